@@ -0,0 +1,103 @@
+import functools
+import os
+
+import pyroll.core as pr
+import pytest
+
+from pyroll.report import Config
+
+PASS_COUNTS = [int(n) for n in os.getenv("PYROLL_REPORT_BENCH_PASSES", "2,10,30").split(",")]
+"""Numbers of roll passes of the benchmarked sequences, configurable by env var as comma separated list."""
+
+DISK_ELEMENT_COUNTS = [int(n) for n in os.getenv("PYROLL_REPORT_BENCH_DISK_ELEMENTS", "0,10").split(",")]
+"""Numbers of disk elements per roll pass of the benchmarked sequences, configurable by env var."""
+
+
+def _round_pass(i: int, disk_element_count: int):
+    return pr.RollPass(
+        label=f"Round {i}",
+        orientation="V",
+        roll=pr.Roll(
+            groove=pr.RoundGroove(r1=1e-3, r2=12.5e-3, depth=11.5e-3),
+            nominal_radius=160e-3,
+            rotational_frequency=1
+        ),
+        gap=2e-3,
+        disk_element_count=disk_element_count,
+    )
+
+
+def _oval_pass(i: int, disk_element_count: int):
+    return pr.RollPass(
+        label=f"Oval {i}",
+        orientation="H",
+        roll=pr.Roll(
+            groove=pr.CircularOvalGroove(depth=8e-3, r1=6e-3, r2=40e-3),
+            nominal_radius=160e-3,
+            rotational_frequency=1
+        ),
+        gap=2e-3,
+        disk_element_count=disk_element_count,
+    )
+
+
+@functools.lru_cache
+def solved_sequence(pass_count: int, disk_element_count: int) -> pr.PassSequence:
+    """Build and solve a synthetic sequence of alternating oval and round passes with transports in between.
+    The same groove pair is repeated, so the profile is rolled back and forth without changing its size much."""
+    units = []
+    for i in range(pass_count):
+        factory = _oval_pass if i % 2 == 0 else _round_pass
+        units.append(factory(i, disk_element_count))
+        units.append(pr.Transport(label=f"Transport {i}", duration=1, disk_element_count=disk_element_count))
+
+    sequence = pr.PassSequence(units)
+    sequence.solve(
+        pr.Profile.round(
+            diameter=30e-3,
+            temperature=1200 + 273.15,
+            strain=0,
+            material=["C45", "steel"],
+            flow_stress=100e6,
+        )
+    )
+
+    return sequence
+
+
+@pytest.fixture(params=PASS_COUNTS, ids=lambda n: f"{n}passes")
+def pass_count(request):
+    return request.param
+
+
+@pytest.fixture(params=DISK_ELEMENT_COUNTS, ids=lambda n: f"{n}elements")
+def disk_element_count(request):
+    return request.param
+
+
+@pytest.fixture
+def sequence(pass_count, disk_element_count):
+    return solved_sequence(pass_count, disk_element_count)
+
+
+@pytest.fixture
+def small_sequence():
+    """A sequence of two roll passes with 10 disk elements each for benchmarks of single rendering steps."""
+    return solved_sequence(2, 10)
+
+
+@pytest.fixture
+def roll_pass(small_sequence):
+    return small_sequence.roll_passes[0]
+
+
+@pytest.fixture(params=[False, True], ids=["no_geoms", "geoms"])
+def plot_geoms(request, monkeypatch):
+    monkeypatch.setattr(Config, "PLOT_GEOMS", request.param)
+    return request.param
+
+
+@pytest.fixture(params=[False, True], ids=["no_disk_elements", "disk_elements"])
+def print_disk_elements(request, monkeypatch):
+    monkeypatch.setattr(Config, "PRINT_DISK_ELEMENTS", request.param)
+    return request.param
@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+import shapely
+
+from pyroll.report import plugin_manager
+from pyroll.report.unit_display.plots import unit_plots_display
+from pyroll.report.unit_display.properties import render_properties_table, format_property
+from pyroll.report.utils import plot_shapely_geom
+
+pytest.importorskip("pytest_benchmark")
+
+
+def test_render_properties_table_roll_pass(benchmark, roll_pass):
+    benchmark(render_properties_table, roll_pass)
+
+
+def test_render_properties_table_disk_element(benchmark, roll_pass):
+    benchmark(render_properties_table, roll_pass.disk_elements[0])
+
+
+def test_unit_plots_roll_pass(benchmark, roll_pass):
+    benchmark(unit_plots_display, roll_pass)
+
+
+def test_unit_plots_sequence(benchmark, small_sequence):
+    benchmark.pedantic(unit_plots_display, args=(small_sequence,), rounds=3)
+
+
+@pytest.mark.parametrize("resolution", [16, 256, 4096])
+def test_plot_shapely_geom(benchmark, resolution):
+    geom = shapely.Point(0, 0).buffer(1, quad_segs=resolution // 4)
+    benchmark(plot_shapely_geom, geom)
+
+
+@pytest.mark.parametrize("size", [10, 1000])
+def test_format_float_array(benchmark, size):
+    values = np.random.default_rng(0).standard_normal(size)
+    benchmark(format_property, "values", values, None)
+
+
+def test_property_format_hook(benchmark):
+    benchmark(plugin_manager.hook.property_format, name="value", value=np.pi, owner=None)
+
+
+def test_format_property_cached(benchmark):
+    benchmark(format_property, "value", np.pi, None)
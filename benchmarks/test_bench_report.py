@@ -0,0 +1,55 @@
+import tracemalloc
+
+import pytest
+from click.testing import CliRunner
+
+import pyroll.report
+from pyroll.report import report, report_to
+
+pytest.importorskip("pytest_benchmark")
+
+
+def _record_extra_info(benchmark, func):
+    """Run once more outside of the timing loop to record peak memory and output size."""
+    tracemalloc.start()
+    try:
+        size = func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    benchmark.extra_info["peak_memory"] = peak
+    benchmark.extra_info["output_size"] = size
+
+
+def test_report(benchmark, sequence, plot_geoms, print_disk_elements):
+    result = benchmark.pedantic(report, args=(sequence,), rounds=3)
+    _record_extra_info(benchmark, lambda: len(report(sequence).encode("utf-8")))
+
+    assert result
+
+
+def test_report_to(benchmark, sequence, tmp_path):
+    file = tmp_path / "report.html"
+
+    benchmark.pedantic(report_to, args=(sequence, file), rounds=3)
+    _record_extra_info(benchmark, lambda: report_to(sequence, file) and file.stat().st_size)
+
+    assert file.exists()
+
+
+@pytest.mark.skipif(not pyroll.report.CLI_INSTALLED, reason="pyroll-cli is not installed in the current environment")
+def test_cli(benchmark, sequence, tmp_path):
+    from pyroll.cli import State
+    from pyroll.report.cli import report as report_command
+
+    file = tmp_path / "report.html"
+    runner = CliRunner()
+
+    def run():
+        result = runner.invoke(report_command, ["-f", str(file)], obj=State(sequence=sequence))
+        assert result.exit_code == 0, result.output
+
+    benchmark.pedantic(run, rounds=3)
+
+    benchmark.extra_info["output_size"] = file.stat().st_size
@@ -1,6 +1,9 @@
-from .report import report, report_to, show_report
+from .report import report, report_to, show_report, iter_report
+from .batch import report_many
+from .asynchronous import report_async, report_to_async
 from .pluggy import plugin_manager, hookimpl, hookspec
 from .config import Config
+from .profiling import ReportProfiler, profile_report
 
 from . import hookspecs
 
@@ -8,11 +11,12 @@ plugin_manager.add_hookspecs(hookspecs)
 
 from . import unit_display
 
+from .server import serve_report, ReportServer
+from .split import report_to_directory
+
 import importlib.util
 
 CLI_INSTALLED = bool(importlib.util.find_spec("pyroll.cli"))
-
-if CLI_INSTALLED:
-    from . import cli
+# the CLI command is loaded by pyroll.cli through its entry point, importing it here would load click and the like
 
 VERSION = "3.1.0"
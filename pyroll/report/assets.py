@@ -0,0 +1,81 @@
+import hashlib
+import os
+import tempfile
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Optional, Union, Set
+
+_active: ContextVar[Optional["AssetDirectory"]] = ContextVar("_active", default=None)
+
+
+class AssetDirectory:
+    """
+    Context manager writing the SVG code of plots and geometry thumbnails rendered within its context
+    to separate files in a directory, which are referenced by ``<img>`` tags instead of being inlined
+    (see :py:func:`embed_svg`).
+    The files are named by a hash of their content, so that equal plots are stored once
+    and several processes may write to the same directory.
+    """
+
+    def __init__(self, directory: Union[str, os.PathLike], href_prefix: str = ""):
+        """
+        :param directory: the directory to write the files to, is created if not existing
+        :param href_prefix: prefix of the file names in the references, the path of the directory
+            relative to the pages
+        """
+        self.directory = Path(directory)
+        """The directory to write the files to."""
+
+        self.href_prefix = href_prefix
+        """Prefix of the file names in the references."""
+
+        self._names: Set[str] = set()
+        self._token = None
+
+    def __enter__(self):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._token = _active.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        _active.reset(self._token)
+
+    def add(self, svg: str) -> str:
+        """Write SVG code to a file, if not already present, and get the reference to it."""
+        name = f"{hashlib.sha1(svg.encode()).hexdigest()[:16]}.svg"
+
+        if name not in self._names:
+            path = self.directory / name
+
+            if not path.exists():
+                # written atomically, as other processes may write the same file
+                fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    f.write(svg)
+                os.replace(tmp, path)
+
+            self._names.add(name)
+
+        return self.href_prefix + name
+
+
+def active_assets() -> Optional[AssetDirectory]:
+    """Get the asset directory active in the current context, if any."""
+    return _active.get()
+
+
+def embed_svg(svg: str, width: Optional[str] = None) -> str:
+    """
+    Embed SVG code into a page, either inline or, if an :py:class:`AssetDirectory` is active,
+    as reference to a file written to it.
+
+    :param svg: the SVG code
+    :param width: CSS width of the referenced image, for SVG code scaling to the available space
+    """
+    assets = _active.get()
+
+    if assets is None or not svg:
+        return svg
+
+    style = f' style="width: {width}"' if width else ""
+    return f'<img src="{assets.add(svg)}" alt="" loading="lazy"{style}>'
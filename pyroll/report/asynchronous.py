@@ -0,0 +1,279 @@
+import contextvars
+import functools
+import os
+import threading
+from pathlib import Path
+from typing import Union, TextIO, Optional, Iterator, Dict, Tuple, List, Callable, Awaitable, TYPE_CHECKING
+
+from pyroll.core import PassSequence
+from pyroll.report.config import Config
+from pyroll.report.export import PropertyExport
+from pyroll.report.parallel import _fork_context, _sequences, _tokens
+from pyroll.report.report import _report_chunks, _check_incremental, _temporary_path
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+BATCH_SIZE = 65536
+"""Number of characters of the report, from which on no further chunks are rendered in the same call to the executor.
+Cancellation takes effect between these calls."""
+
+_renderers: Dict[int, Tuple[Iterator[str], Optional[PropertyExport]]] = {}
+"""Reports rendered in forked worker processes and the exports collecting their property rows by their token."""
+
+
+def _next_batch(chunks: Iterator[str]) -> Optional[str]:
+    batch = []
+    size = 0
+
+    for c in chunks:
+        batch.append(c)
+        size += len(c)
+
+        if size >= BATCH_SIZE:
+            break
+
+    return "".join(batch) if batch else None
+
+
+class _ThreadRenderer:
+    def __init__(self, executor: Optional["Executor"], chunks: Iterator[str]):
+        self._executor = executor
+        self._chunks = chunks
+
+        # the steps run in varying threads of the executor, but must share the context of the generator
+        self._context = contextvars.copy_context()
+        self._lock = threading.Lock()
+
+    def _step(self, func, *args):
+        # a cancelled step may still run in the executor, so the next one has to wait for it
+        with self._lock:
+            return self._context.run(func, *args)
+
+    async def next_batch(self) -> Optional[str]:
+        import asyncio
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, self._step, _next_batch, self._chunks
+        )
+
+    async def close(self):
+        import asyncio
+        await asyncio.get_running_loop().run_in_executor(self._executor, self._step, self._chunks.close)
+
+
+def _exporting(chunks: Iterator[str], export: PropertyExport) -> Iterator[str]:
+    with export:
+        yield from chunks
+
+
+def _process_start(token: int, workers: Optional[int], incremental_file, properties_file):
+    export = None
+
+    # a file object of the parent can not be written from here, so the rows are sent back with the batches
+    if hasattr(properties_file, "write"):
+        export = PropertyExport()
+        properties_file = None
+
+    chunks = _report_chunks(_sequences[token], workers, incremental_file, properties_file)
+    _renderers[token] = _exporting(chunks, export) if export is not None else chunks, export
+
+
+def _process_next_batch(token: int) -> Tuple[Optional[str], List[Dict[str, object]]]:
+    chunks, export = _renderers[token]
+    batch = _next_batch(chunks)
+    rows = []
+
+    if export is not None:
+        rows, export.rows = export.rows, []
+
+    if batch is None:
+        del _renderers[token]
+
+    return batch, rows
+
+
+def _process_close(token: int):
+    chunks, _ = _renderers.pop(token, (None, None))
+
+    if chunks is not None:
+        chunks.close()
+
+
+class _ProcessRenderer:
+    def __init__(self, mp_context, properties_file: Union[str, os.PathLike, TextIO, None]):
+        from concurrent.futures import ProcessPoolExecutor
+
+        self._executor = ProcessPoolExecutor(1, mp_context=mp_context)
+        self._token = next(_tokens)
+
+        # rows for a file object are sent back by the worker and written here
+        self._export = PropertyExport(properties_file) if hasattr(properties_file, "write") else None
+
+    async def start(self, pass_sequence: PassSequence, *args):
+        import asyncio
+
+        # the worker is forked on the first submission and inherits the sequence, as units can not be pickled
+        _sequences[self._token] = pass_sequence
+        try:
+            future = asyncio.get_running_loop().run_in_executor(
+                self._executor, _process_start, self._token, *args
+            )
+        finally:
+            del _sequences[self._token]
+
+        await future
+
+    async def next_batch(self) -> Optional[str]:
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        batch, rows = await loop.run_in_executor(self._executor, _process_next_batch, self._token)
+
+        if self._export is not None and rows:
+            await loop.run_in_executor(None, self._export.extend, rows)
+
+        return batch
+
+    async def close(self):
+        # a running batch can not be interrupted, the worker exits after it without waiting here
+        self._executor.submit(_process_close, self._token)
+        self._executor.shutdown(wait=False)
+
+
+async def _open_renderer(
+        pass_sequence: PassSequence, workers: Optional[int], executor: Union[str, "Executor", None],
+        incremental_file: Union[str, os.PathLike, None], properties_file: Union[str, os.PathLike, TextIO, None],
+):
+    if executor is None:
+        executor = Config.ASYNC_EXECUTOR
+
+    if executor == "process":
+        mp_context = _fork_context()
+
+        if mp_context is not None:
+            renderer = _ProcessRenderer(mp_context, properties_file)
+            try:
+                await renderer.start(pass_sequence, workers, incremental_file, properties_file)
+            except BaseException:
+                await renderer.close()
+                raise
+            return renderer
+
+        executor = "thread"
+
+    if executor == "thread":
+        executor = None
+    elif isinstance(executor, str):
+        raise ValueError(f"Unknown executor '{executor}', use 'thread', 'process' or an executor instance.")
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+
+        if isinstance(executor, ProcessPoolExecutor):
+            raise ValueError("Units can not be sent to a process pool, use executor='process' instead.")
+
+    return _ThreadRenderer(executor, _report_chunks(pass_sequence, workers, incremental_file, properties_file))
+
+
+async def _render(renderer, write: Callable[[str], Awaitable[int]]) -> int:
+    written = 0
+
+    try:
+        while (batch := await renderer.next_batch()) is not None:
+            written += await write(batch)
+    finally:
+        await renderer.close()
+
+    return written
+
+
+async def report_async(
+        pass_sequence: PassSequence, workers: Optional[int] = None, executor: Union[str, "Executor", None] = None,
+) -> str:
+    """
+    Render an HTML report from the specified pass sequence without blocking the event loop.
+    The report is rendered in batches of chunks in an executor,
+    cancelling the awaiting task stops the rendering after the current batch (see ``BATCH_SIZE``).
+
+    With ``executor="process"``, the process is forked from the event loop, while threads of the executor
+    may render other reports. Locks held by these threads at that moment would stay locked in the child forever,
+    so the locks of this package and of matplotlib figures are reset after forking.
+    Plugins holding own locks while rendering must reset them likewise using ``os.register_at_fork()``.
+
+    :param pass_sequence: PassSequence instance to take the data from
+    :param workers: number of worker processes to render the units of the sequence in parallel,
+        the default is to render serially
+    :param executor: ``"thread"`` to render in the default executor of the event loop,
+        ``"process"`` to render in a forked process, which allows several reports to be rendered truly in parallel,
+        or a thread based executor instance, the default is ``Config.ASYNC_EXECUTOR``
+    :returns: generated HTML code as string
+    """
+    batches = []
+
+    async def collect(batch: str) -> int:
+        batches.append(batch)
+        return len(batch)
+
+    renderer = await _open_renderer(pass_sequence, workers, executor, None, None)
+    await _render(renderer, collect)
+    return "".join(batches)
+
+
+async def report_to_async(
+        pass_sequence: PassSequence, file: Union[str, os.PathLike, TextIO], workers: Optional[int] = None,
+        incremental: bool = False, properties_file: Union[str, os.PathLike, TextIO, None] = None,
+        executor: Union[str, "Executor", None] = None,
+) -> int:
+    """
+    Render an HTML report from the specified pass sequence and save it to a file without blocking the event loop.
+    The report is rendered in batches of chunks in an executor (see :py:func:`report_async`)
+    and written in the default executor of the event loop.
+    A report file given as path is written to a temporary file first, which replaces the file only on success,
+    so cancelling the awaiting task leaves an existing report untouched.
+
+    :param pass_sequence: PassSequence instance to take the data from
+    :param file: a str representing a path, a path-like object, or a file-like object with write permissions
+        to write the report to
+    :param workers: number of worker processes to render the units of the sequence in parallel,
+        the default is to render serially
+    :param incremental: whether to reuse the displays of units unchanged since the last report written to the file
+        (see :py:func:`pyroll.report.report_to`), requires ``file`` to be a path
+    :param properties_file: a path or file-like object to write the raw values of all printed properties to
+        as JSON Lines (see :py:class:`pyroll.report.export.PropertyExport`), the default is to not export them
+    :param executor: ``"thread"``, ``"process"`` or a thread based executor instance
+        (see :py:func:`report_async`), the default is ``Config.ASYNC_EXECUTOR``
+    :returns: the number of written bytes
+    """
+    import asyncio
+
+    _check_incremental(file, incremental)
+    loop = asyncio.get_running_loop()
+
+    if hasattr(file, "write"):
+        renderer = await _open_renderer(pass_sequence, workers, executor, None, properties_file)
+        return await _render(renderer, functools.partial(loop.run_in_executor, None, file.write))
+
+    file = Path(file)
+    tmp = _temporary_path(file)
+    f = await loop.run_in_executor(None, lambda: tmp.open("w", encoding="utf-8"))
+
+    try:
+        renderer = await _open_renderer(
+            pass_sequence, workers, executor, file if incremental else None, properties_file
+        )
+        written = await _render(renderer, functools.partial(loop.run_in_executor, None, f.write))
+
+        await loop.run_in_executor(None, f.close)
+        await loop.run_in_executor(None, os.replace, tmp, file)
+        return written
+
+    finally:
+        if not f.closed:
+            await loop.run_in_executor(None, f.close)
+            await loop.run_in_executor(None, _unlink, tmp)
+
+
+def _unlink(path: Path):
+    try:
+        path.unlink()
+    except FileNotFoundError:
+        pass
@@ -0,0 +1,123 @@
+import datetime
+import functools
+import logging
+import os
+import re
+from pathlib import Path
+from typing import Union, Mapping, Iterable, Optional, List, Dict, Tuple, Callable
+
+from pyroll.core import PassSequence
+from .parallel import map_sequences
+from .report import report_to, _TEMPLATE_DIR
+from .templates import get_template
+
+log = logging.getLogger(__name__)
+
+INDEX_FILE = "index.html"
+
+
+def _file_names(names: List[str]) -> List[str]:
+    result = []
+    used = {INDEX_FILE}
+
+    for n in names:
+        stem = re.sub(r"[^\w.-]+", "_", n).strip("._") or "report"
+        file = f"{stem}.html"
+        i = 1
+        while file in used:
+            i += 1
+            file = f"{stem}_{i}.html"
+        used.add(file)
+        result.append(file)
+
+    return result
+
+
+def _warm_up():
+    # load everything expensive once in the parent process, so that forked workers inherit it
+    from matplotlib import font_manager  # noqa: F401 - loads the font cache
+
+    for name in ["main.html", "statistics.html"]:
+        get_template(_TEMPLATE_DIR, name)
+
+
+_SequenceOrLoader = Union[PassSequence, Callable[[], PassSequence]]
+
+
+def _render(files: List[Path], index: int, sequence: _SequenceOrLoader) -> Dict[str, object]:
+    file = files[index]
+
+    try:
+        # pass sequences are callable themselves, so loaders are recognized by not being one
+        if not isinstance(sequence, PassSequence):
+            sequence = sequence()
+
+        size = report_to(sequence, file)
+    except Exception as e:
+        log.exception(f"Failed to generate report {file.name}.")
+        return dict(error=f"{type(e).__name__}: {e}")
+
+    return dict(size=size, units=len(sequence.units))
+
+
+def report_many(
+        sequences: Union[Mapping[str, _SequenceOrLoader], Iterable[Tuple[str, _SequenceOrLoader]],
+                         Iterable[_SequenceOrLoader]],
+        out_dir: Union[str, os.PathLike],
+        workers: Optional[int] = None,
+) -> Path:
+    """
+    Render HTML reports of many pass sequences in one process or a pool of worker processes
+    and write an index page linking all of them.
+    Templates, plugins and caches are loaded once and reused for all reports.
+    A failing report is logged and marked in the index without aborting the others.
+
+    Instead of a solved sequence, a function without arguments returning it may be given, like one loading and
+    solving an input file. It is called only when the report is rendered, in the worker process if any,
+    so that only the sequences currently rendered are held in memory.
+
+    :param sequences: the sequences to report, either as mapping of report names to sequences,
+        as iterable of pairs of report name and sequence, whose names need not be unique,
+        or as iterable of sequences, in which case the reports are named by their index
+    :param out_dir: directory to write the reports and the index page to, is created if not existing
+    :param workers: number of worker processes to render the reports in parallel, each rendering whole reports,
+        the default is to render serially
+    :returns: the path to the index page
+    """
+    if isinstance(sequences, Mapping):
+        names = [str(n) for n in sequences.keys()]
+        sequences = list(sequences.values())
+    else:
+        sequences = list(sequences)
+
+        if sequences and all(isinstance(s, tuple) for s in sequences):
+            names = [str(n) for n, _ in sequences]
+            sequences = [s for _, s in sequences]
+        else:
+            names = [f"report_{i:0{len(str(len(sequences)))}d}" for i in range(len(sequences))]
+
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    files = _file_names(names)
+    render = functools.partial(_render, [out_dir / f for f in files])
+
+    if workers is not None and workers >= 2:
+        _warm_up()
+
+    entries = []
+    for name, file, result in zip(names, files, map_sequences(render, sequences, workers)):
+        entries.append(dict(name=name, file=file, **result))
+        if "error" not in result:
+            log.info(f"Wrote report {name} to: {out_dir / file}")
+
+    index = out_dir / INDEX_FILE
+    index.write_text(
+        get_template(_TEMPLATE_DIR, "index.html").render(
+            entries=entries,
+            timestamp=datetime.datetime.now().isoformat(timespec="seconds"),
+        ),
+        encoding="utf-8",
+    )
+
+    return index
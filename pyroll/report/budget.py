@@ -0,0 +1,191 @@
+import logging
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional, Dict, List, Iterable, Iterator, Tuple, Callable
+
+from pyroll.core import PassSequence
+
+log = logging.getLogger(__name__)
+
+DEGRADATIONS = [
+    None,
+    "long arrays summarized and geometry thumbnails simplified",
+    "geometry thumbnails omitted and only the first, middle and last disk elements printed",
+    "plots and disk elements omitted",
+    "all displays omitted",
+]
+"""Descriptions of the degradation levels, each level includes the reductions of the lower ones."""
+
+MAX_LEVEL = len(DEGRADATIONS) - 1
+"""The highest degradation level, at which only the heading of a unit is printed."""
+
+RESERVE = 4096
+"""Size kept free for the end of the report, like the size summary and the footer."""
+
+_active: ContextVar[Optional["SizeBudget"]] = ContextVar("_active", default=None)
+
+_level: ContextVar[int] = ContextVar("_level", default=0)
+
+
+class SizeBudget:
+    """
+    Context manager accounting the size of the report rendered within its context and degrading the displays of
+    the units of the reported sequence as needed to keep the report below a maximum size.
+
+    Before a unit is rendered, its degradation level (see ``DEGRADATIONS``) is chosen by comparing the remaining
+    budget to the size the remaining units are projected to take, judged by the mean size of the units rendered
+    so far. If the rendered unit still exceeds the remaining budget, it is rendered again at the next higher levels
+    until it fits. Hook implementations query the level of the currently rendered unit
+    using :py:func:`degradation_level`.
+
+    Sizes are counted in characters, which equals bytes for the mostly ASCII content of reports.
+    With a limit, the units of the sequence are rendered one by one in the current process,
+    bypassing worker processes and the fragment cache, as their displays may have to be rendered again.
+    """
+
+    def __init__(self, sequence: PassSequence, limit: int = 0):
+        """
+        :param sequence: the reported sequence, whose units are subject to degradation
+        :param limit: the maximum size of the report, 0 to only account the sizes
+        """
+        self.sequence = sequence
+        """The reported sequence."""
+
+        self.limit = limit
+        """The maximum size of the report, 0 for no limit."""
+
+        self.used = 0
+        """Size of the report rendered so far."""
+
+        self.sections: Dict[str, int] = defaultdict(int)
+        """Accumulated sizes of the sections of the report by their kind (see :py:meth:`account`)."""
+
+        self.units: List[Tuple[str, int, int]] = []
+        """String representation, size and degradation level of the units of the sequence rendered so far,
+        only recorded if a limit is set."""
+
+        self._token = None
+
+    def __enter__(self):
+        self._token = _active.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        _active.reset(self._token)
+
+        if exc_type is None:
+            self._log_summary()
+
+    @property
+    def degraded(self) -> List[Tuple[str, int, int]]:
+        """The units rendered at a degradation level above 0."""
+        return [u for u in self.units if u[2] > 0]
+
+    def account(self, section: str, size: int):
+        """Add the size of a section of the given kind, like ``"plots"``."""
+        self.sections[section] += size
+
+    def count(self, chunks: Iterable[str]) -> Iterator[str]:
+        """Pass through the chunks of the report, counting their size as used."""
+        for c in chunks:
+            self.used += len(c)
+            yield c
+
+    def _initial_level(self, remaining_units: int) -> int:
+        available = self.limit - RESERVE - self.used
+
+        if available <= 0:
+            return MAX_LEVEL
+
+        if not self.units:
+            return 0
+
+        projected = sum(u[1] for u in self.units) / len(self.units) * remaining_units
+
+        # each level is assumed to about halve the size of a unit
+        level = 0
+        while projected > available and level < MAX_LEVEL - 1:
+            projected /= 2
+            level += 1
+
+        return level
+
+    def render_unit(self, unit: object, render: Callable[[], str], remaining_units: int) -> str:
+        """
+        Render a unit of the sequence, degrading it as needed.
+
+        :param unit: the unit to render
+        :param render: function returning the complete HTML of the unit at the current degradation level
+        :param remaining_units: number of units of the sequence still to render including this one
+        """
+        level = self._initial_level(remaining_units)
+
+        sections = dict(self.sections)
+
+        while True:
+            with degraded(level):
+                html = render()
+
+            if level == MAX_LEVEL or self.used + len(html) + RESERVE <= self.limit:
+                break
+
+            # the sections of the discarded rendering are not part of the report
+            self.sections = defaultdict(int, sections)
+            level += 1
+
+        if level > 0:
+            log.warning(f"Reduced the display of {unit} to fit the report size budget: {DEGRADATIONS[level]}.")
+
+        self.units.append((str(unit), len(html), level))
+        return html
+
+    def _log_summary(self):
+        degraded = self.degraded
+
+        if degraded:
+            log.warning(
+                f"Reduced the displays of {len(degraded)} of {len(self.units)} units "
+                f"to keep the report below {self.limit} bytes."
+            )
+
+        if self.sections:
+            log.info("Report size by section: " + ", ".join(f"{k}: {v}" for k, v in sorted(self.sections.items())))
+
+
+@contextmanager
+def degraded(level: int):
+    """Context manager setting the degradation level of the displays rendered within."""
+    token = _level.set(level)
+    try:
+        yield
+    finally:
+        _level.reset(token)
+
+
+def degradation_level() -> int:
+    """Get the degradation level of the currently rendered unit (see ``DEGRADATIONS``), 0 if not degraded."""
+    return _level.get()
+
+
+def active_budget() -> Optional[SizeBudget]:
+    """Get the size budget active in the current context, if any."""
+    return _active.get()
+
+
+def account(section: str, size: int):
+    """Add the size of a section of the given kind to the active size budget, if any."""
+    budget = _active.get()
+
+    if budget is not None:
+        budget.account(section, size)
+
+
+def degradation_note() -> str:
+    """Get a note on the degradation of the currently rendered unit to print below its heading, if degraded."""
+    level = _level.get()
+
+    if level == 0:
+        return ""
+
+    return f"<p class='text-warning'>Reduced to fit the report size budget: {DEGRADATIONS[level]}.</p>"
@@ -1,12 +1,130 @@
+import contextlib
+import functools
+import importlib.util
 import logging
+import os
 from pathlib import Path
+from typing import Tuple, Dict
 
-from .report import report as report_func
+from pyroll.core import PassSequence
+from .report import report_to
+from .batch import report_many
+from .split import report_to_directory
 from pyroll.cli import State
 import click
 from .config import Config
+from .profiling import ReportProfiler
+from .unit_display.disk_elements import validate_disk_element_selection
 
 DEFAULT_REPORT_FILE = "report.html"
+DEFAULT_BATCH_DIR = "reports"
+
+
+def _validate_disk_element_selection(ctx, param, value):
+    if value is None:
+        return None
+
+    try:
+        return validate_disk_element_selection(value)
+    except ValueError as e:
+        raise click.BadParameter(str(e))
+
+
+_CONFIG_OPTIONS = [
+    click.option(
+        "-d/-nd", "--print-disk-elements/--no-print-disk-elements",
+        default=None,
+        help="Whether to print the disk elements in the report "
+             "(overrides the PRINT_DISK_ELEMENTS config value, the default is to not override the config).",
+    ),
+    click.option(
+        "-l/-nl", "--lazy-disk-elements/--no-lazy-disk-elements",
+        default=None,
+        help="Whether to embed the disk elements compressed and build them only when expanded in the browser "
+             "(overrides the LAZY_DISK_ELEMENTS config value, the default is to not override the config).",
+    ),
+    click.option(
+        "--disk-element-selection",
+        default=None,
+        callback=_validate_disk_element_selection,
+        help="Disk elements to print: 'all', 'none', 'every:N' or a comma separated list of 'first', 'middle', 'last' "
+             "and relative positions between 0 and 1 "
+             "(overrides the DISK_ELEMENT_SELECTION config value, the default is to not override the config).",
+    ),
+    click.option(
+        "--disk-element-statistics/--no-disk-element-statistics",
+        default=None,
+        help="Whether to print a table of statistics of the numeric disk element properties per unit "
+             "(overrides the DISK_ELEMENT_STATISTICS config value, the default is to not override the config).",
+    ),
+    click.option(
+        "-g/-ng", "--plot-geoms/--no-plot-geoms",
+        default=None,
+        help="Whether to plot shapely geometry objects in the report "
+             "(overrides the PLOT_GEOMS config value, the default is to not override the config).",
+    ),
+    click.option(
+        "--float-precision",
+        type=int,
+        default=None,
+        help="Number of decimal digits to print for float values "
+             "(overrides the FLOAT_PRECISION config value, the default is to not override the config).",
+    ),
+    click.option(
+        "--temperature-precision",
+        type=int,
+        default=None,
+        help="Number of decimal digits to print for float values of temperatures "
+             "(overrides the TEMPERATURE_PRECISION config value, the default is to not override the config).",
+    ),
+    click.option(
+        "--ratio-precision",
+        type=int,
+        default=None,
+        help="Number of decimal digits to print for float values of ratios "
+             "(overrides the RATIO_PRECISION config value, the default is to not override the config).",
+    ),
+    click.option(
+        "--angle-precision",
+        type=int,
+        default=None,
+        help="Number of decimal digits to print for float values of angles "
+             "(overrides the ANGLE_PRECISION config value, the default is to not override the config).",
+    ),
+    click.option(
+        "--strain-precision",
+        type=int,
+        default=None,
+        help="Number of decimal digits to print for float values of strains "
+             "(overrides the STRAIN_PRECISION config value, the default is to not override the config).",
+    ),
+    click.option(
+        "--max-report-size",
+        type=int,
+        default=None,
+        help="Maximum size of the report in bytes, beyond which unit displays are reduced "
+             "(overrides the MAX_REPORT_SIZE config value, the default is to not override the config).",
+    ),
+    click.option(
+        "--print-statistics/--no-print-statistics",
+        default=None,
+        help="Whether to append timing statistics of the report generation to the report "
+             "(overrides the PRINT_STATISTICS config value, the default is to not override the config).",
+    ),
+]
+"""Options overriding config values of the same name, shared by the report commands."""
+
+
+def _config_options(command):
+    for option in reversed(_CONFIG_OPTIONS):
+        command = option(command)
+    return command
+
+
+def _apply_config_options(overrides: Dict[str, object]):
+    for name, value in overrides.items():
+        if value is not None:
+            setattr(Config, name.upper(), value)
 
 
 @click.command()
@@ -17,80 +135,159 @@ DEFAULT_REPORT_FILE = "report.html"
     default=DEFAULT_REPORT_FILE, show_default=True
 )
 @click.option(
-    "-d/-nd", "--print-disk-elements/--no-print-disk-elements",
+    "-j", "--jobs",
+    type=click.IntRange(min=1),
     default=None,
-    help="Whether to print the disk elements in the report "
-         "(overrides the PRINT_DISK_ELEMENTS config value, the default is to not override the config).",
+    help="Number of worker processes to render the units of the sequence in parallel (the default is to render serially).",
 )
 @click.option(
-    "-g/-ng", "--plot-geoms/--no-plot-geoms",
-    default=None,
-    help="Whether to plot shapely geometry objects in the report "
-         "(overrides the PLOT_GEOMS config value, the default is to not override the config).",
+    "-i", "--incremental",
+    is_flag=True,
+    help="Reuse the displays of units unchanged since the last report written to FILE, "
+         "which are stored in a manifest file next to it.",
 )
 @click.option(
-    "--float-precision",
-    type=int,
+    "--properties-out",
+    type=click.Path(dir_okay=False, path_type=Path),
     default=None,
-    help="Number of decimal digits to print for float values "
-         "(overrides the FLOAT_PRECISION config value, the default is to not override the config).",
+    help="File to write the raw values of all printed properties to as JSON Lines.",
 )
 @click.option(
-    "--temperature-precision",
-    type=int,
+    "--out-dir",
+    type=click.Path(file_okay=False, path_type=Path),
     default=None,
-    help="Number of decimal digits to print for float values of temperatures "
-         "(overrides the TEMPERATURE_PRECISION config value, the default is to not override the config).",
+    help="Directory to write the report to split into an index page, a page per unit and the plots as SVG files, "
+         "instead of writing FILE.",
 )
 @click.option(
-    "--ratio-precision",
-    type=int,
-    default=None,
-    help="Number of decimal digits to print for float values of ratios "
-         "(overrides the RATIO_PRECISION config value, the default is to not override the config).",
+    "--serve",
+    is_flag=True,
+    help="Serve the report from a local HTTP server rendering each unit when first viewed, "
+         "instead of writing it to FILE, until interrupted.",
 )
 @click.option(
-    "--angle-precision",
+    "--port",
     type=int,
-    default=None,
-    help="Number of decimal digits to print for float values of angles "
-         "(overrides the ANGLE_PRECISION config value, the default is to not override the config).",
+    default=0,
+    help="Port of the server started by --serve (the default is to choose a free one).",
 )
 @click.option(
-    "--strain-precision",
-    type=int,
+    "--profile-out",
+    type=click.Path(dir_okay=False, path_type=Path),
     default=None,
-    help="Number of decimal digits to print for float values of strains "
-         "(overrides the STRAIN_PRECISION config value, the default is to not override the config).",
+    help="File to write timing statistics of the report generation to.",
+)
+@click.option(
+    "--profile-format",
+    type=click.Choice(["json", "chrome-trace"]),
+    default="json", show_default=True,
+    help="Format of the file given by --profile-out, either statistics as JSON or a Chrome trace of all hook calls.",
 )
+@_config_options
 @click.pass_obj
-def report(state: State, file: Path, print_disk_elements, plot_geoms, float_precision, temperature_precision,
-           ratio_precision, angle_precision, strain_precision):
+def report(state: State, file: Path, jobs, incremental, properties_out, out_dir, serve, port, profile_out,
+           profile_format, **config_overrides):
     """Generates a HTML report from the simulation results and writes it to FILE."""
     log = logging.getLogger(__name__)
 
-    if print_disk_elements is not None:
-        Config.PRINT_DISK_ELEMENTS = print_disk_elements
+    _apply_config_options(config_overrides)
+
+    if serve:
+        _serve(state.sequence, port)
+        return
+
+    if out_dir and (incremental or properties_out):
+        raise click.UsageError("--out-dir can not be combined with --incremental or --properties-out.")
 
-    if plot_geoms is not None:
-        Config.PLOT_GEOMS = plot_geoms
+    profiler = ReportProfiler(trace=profile_format == "chrome-trace") if profile_out else None
 
-    if float_precision is not None:
-        Config.FLOAT_PRECISION = float_precision
+    with profiler or contextlib.nullcontext():
+        if out_dir:
+            index = report_to_directory(state.sequence, out_dir, jobs)
+        else:
+            report_to(state.sequence, file, jobs, incremental, properties_out)
+
+    if out_dir:
+        log.info(f"Wrote report to: {index.absolute()}")
+    else:
+        log.info(f"Wrote report to: {file.absolute()}")
+
+    if properties_out:
+        log.info(f"Wrote property values to: {properties_out.absolute()}")
+
+    if profiler:
+        if profile_format == "chrome-trace":
+            profiler.write_chrome_trace(profile_out)
+        else:
+            profiler.write_json(profile_out)
+        log.info(f"Wrote report generation statistics to: {profile_out.absolute()}")
+
+
+def _serve(sequence: PassSequence, port: int):
+    import webbrowser
+    from .server import ReportServer
+
+    log = logging.getLogger(__name__)
+
+    with ReportServer(sequence, port=port) as server:
+        log.info(f"Serving report at {server.url}, press Ctrl+C to stop.")
+        webbrowser.open(server.url)
+
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+
+def _load_input_py(file: Path, index: int):
+    spec = importlib.util.spec_from_file_location(f"__pyroll_input_{index}__", file)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    sequence = getattr(module, "sequence")
+    return (sequence if isinstance(sequence, PassSequence) else PassSequence(sequence)), getattr(module, "in_profile")
+
+
+@click.command()
+@click.argument(
+    "input_files", nargs=-1, required=True,
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+)
+@click.option(
+    "-o", "--out-dir",
+    help="Directory to write the reports and the index page to.",
+    type=click.Path(file_okay=False, path_type=Path),
+    default=DEFAULT_BATCH_DIR, show_default=True
+)
+@click.option(
+    "-j", "--jobs",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Number of worker processes to solve the sequences and render the reports in parallel "
+         "(the default is to process serially).",
+)
+@_config_options
+def report_batch(input_files: Tuple[Path, ...], out_dir: Path, jobs, **config_overrides):
+    """Solves the pass sequences defined in the Python scripts INPUT_FILES and generates a HTML report for each,
+    as well as an index page linking all of them. The scripts must define the attributes in_profile and sequence
+    like for the input-py command. Each script is loaded and solved only when its report is rendered,
+    so that only the sequences currently reported are held in memory."""
+    log = logging.getLogger(__name__)
 
-    if temperature_precision is not None:
-        Config.TEMPERATURE_PRECISION = temperature_precision
+    _apply_config_options(config_overrides)
 
-    if ratio_precision is not None:
-        Config.RATIO_PRECISION = ratio_precision
+    # reports are named by the path of their script relative to the common directory of all scripts
+    paths = [f.absolute() for f in input_files]
+    common = Path(os.path.commonpath([p.parent for p in paths]))
+    names = [p.relative_to(common).with_suffix("").as_posix() for p in paths]
 
-    if angle_precision is not None:
-        Config.ANGLE_PRECISION = angle_precision
+    loaders = [(n, functools.partial(_load_and_solve, f, i)) for i, (n, f) in enumerate(zip(names, input_files))]
+    index = report_many(loaders, out_dir, jobs)
 
-    if strain_precision is not None:
-        Config.STRAIN_PRECISION = strain_precision
+    log.info(f"Wrote report index to: {index.absolute()}")
 
-    rendered = report_func(state.sequence)
 
-    file.write_text(rendered, encoding='utf-8')
-    log.info(f"Wrote report to: {file.absolute()}")
+def _load_and_solve(file: Path, index: int) -> PassSequence:
+    logging.getLogger(__name__).info(f"Solving pass sequence from: {file.absolute()}")
+    sequence, in_profile = _load_input_py(file, index)
+    sequence.solve(in_profile)
+    return sequence
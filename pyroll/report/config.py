@@ -1,4 +1,8 @@
+from pathlib import Path
+from typing import Dict
+
 from pyroll.core import config
+from pyroll.core.config import ConfigValue
 
 
 @config("PYROLL_REPORT")
@@ -6,6 +10,20 @@ class Config:
     PRINT_DISK_ELEMENTS = False
     """Whether to include the distinct disk elements into the report."""
 
+    LAZY_DISK_ELEMENTS = False
+    """Whether to embed the disk elements compressed into the report,
+    so that their HTML is only built by the browser when they are expanded."""
+
+    DISK_ELEMENT_SELECTION = "all"
+    """Disk elements to include if ``PRINT_DISK_ELEMENTS`` is enabled: ``"all"``, ``"none"``,
+    ``"every:N"`` for every N-th element, or a comma separated list of ``first``, ``middle``, ``last``
+    and relative positions between 0 and 1, like ``"first,0.25,middle,last"``.
+    An invalid value is logged as error and all disk elements are printed instead."""
+
+    DISK_ELEMENT_STATISTICS = False
+    """Whether to print a table of the minimum, maximum, mean, entry and exit values
+    of the numeric disk element properties per unit."""
+
     FLOAT_PRECISION = 3
     """Number of decimal digits to print for float values."""
 
@@ -23,3 +41,49 @@ class Config:
 
     PLOT_GEOMS = True
     """Whether to plot shapely geometry objects. Otherwise only a property table is printed."""
+
+    ARRAY_THRESHOLD = 1000
+    """Number of elements of a collection above which only the first and last elements are printed."""
+
+    ARRAY_EDGEITEMS = 3
+    """Number of elements printed at the beginning and end of collections exceeding ``ARRAY_THRESHOLD``."""
+
+    SEQUENCE_PLOT_LABEL_LIMIT = 60
+    """Maximum number of labeled units on the x-axis of sequence plots.
+    For longer sequences only every n-th unit is labeled, bars are drawn as one outline and markers are omitted.
+    Values below 1 are treated as 1, so that at least the first unit is labeled."""
+
+    PROPERTY_TIME_BUDGET = 0.5
+    """Time in seconds the evaluation of the attributes of an object or the formatting of a single property
+    may take, before it is logged as slow. A summary of the slow properties is logged after each report."""
+
+    MAX_REPORT_SIZE = 0
+    """Maximum size of a report in bytes, 0 for no limit. Units exceeding their share of the budget are degraded
+    step by step by summarizing arrays, simplifying or omitting geometry thumbnails, sampling or omitting disk elements
+    and omitting plots, which is logged and noted in the report.
+    With a limit, the units are rendered serially and without reusing stored displays, which is logged as warning
+    if worker processes or incremental rendering are requested."""
+
+    PRINT_STATISTICS = False
+    """Whether to append a collapsed section with timing statistics of the report generation to the report."""
+
+    PLOT_CACHE = False
+    """Whether to cache the SVG code of rendered unit plots on disk, to reuse it for unchanged units.
+    Plots are identified by the state of the plotted unit, so plot hooks must not depend on other units."""
+
+    PLOT_CACHE_DIR = Path.home() / ".cache" / "pyroll-report" / "plots"
+    """Directory to store the plot cache in."""
+
+    PLOT_CACHE_SIZE = 100_000_000
+    """Maximum size of the plot cache in bytes, the least recently used plots are evicted beyond it."""
+
+    ASYNC_EXECUTOR = "thread"
+    """Executor to render reports in with ``report_async`` and ``report_to_async`` by default:
+    ``"thread"`` for the default executor of the event loop or ``"process"`` for a forked process per report.
+    Forking while other threads render copies their locks in whatever state they are,
+    see ``report_async`` on how this is handled."""
+
+
+def config_values() -> Dict[str, object]:
+    """Get the current values of all configuration variables of this package."""
+    return {n: getattr(Config, n) for n, v in vars(type(Config)).items() if isinstance(v, ConfigValue)}
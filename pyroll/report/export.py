@@ -0,0 +1,226 @@
+import enum
+import json
+import os
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Optional, List, Dict, Union, TextIO, Tuple, Iterable, Iterator
+
+import numpy as np
+import shapely
+
+from pyroll.core import Unit
+from pyroll.core.repr import ReprMixin
+
+_active: ContextVar[Optional["PropertyExport"]] = ContextVar("_active", default=None)
+
+_owner: ContextVar[Optional[Tuple[str, str]]] = ContextVar("_owner", default=None)
+"""Unit path and property name prefix of the properties table currently rendered."""
+
+
+def encode_value(value: object) -> Optional[Dict[str, object]]:
+    """
+    Encode a raw property value as JSON compatible dict of its type and value.
+    Arrays and collections of numbers are encoded with their dtype and shape.
+
+    :returns: the encoded value or ``None`` for values not exported themselves,
+        like ``ReprMixin`` objects, whose properties are exported separately
+    """
+    if isinstance(value, (bool, np.bool_)):
+        return dict(type="bool", value=bool(value))
+
+    if isinstance(value, (int, np.integer)):
+        return dict(type="int", value=int(value))
+
+    if isinstance(value, (float, np.floating)):
+        return dict(type="float", value=float(value))
+
+    if isinstance(value, str):
+        return dict(type="str", value=value)
+
+    if isinstance(value, enum.Enum):
+        return dict(type="str", value=str(value))
+
+    if isinstance(value, (ReprMixin, shapely.Geometry)):
+        return None
+
+    if isinstance(value, (np.ndarray, list, tuple)):
+        try:
+            array = np.asarray(value)
+        except ValueError:  # ragged
+            return None
+
+        if array.dtype.kind in "biuf":
+            return dict(type="array", dtype=array.dtype.str, shape=list(array.shape), value=array.ravel().tolist())
+
+        if array.dtype.kind == "U":
+            return dict(type="array", dtype="str", shape=list(array.shape), value=array.ravel().tolist())
+
+        return None
+
+    if isinstance(value, (set, frozenset, dict)) or callable(value):
+        return None
+
+    return dict(type="str", value=str(value))
+
+
+class PropertyExport:
+    """
+    Context manager collecting the raw values of all properties printed in the property tables
+    of reports rendered within its context.
+    Each row is keyed by the path of the unit, which is the chain of subunit indices from the reported sequence
+    separated by ``/``, and the property name, which is prefixed by the names of the enclosing properties
+    separated by ``.`` for nested objects like profiles.
+
+    Use it as follows::
+
+        with PropertyExport("properties.jsonl"):
+            report_to(sequence, "report.html")
+
+    or simply call ``report_to(sequence, "report.html", properties_file="properties.jsonl")``.
+
+    With a file, the rows are written to it as they are added instead of being kept in memory.
+    A file given as path is written to a temporary file first, which replaces it on successful exit of the context.
+    """
+
+    def __init__(self, file: Union[str, os.PathLike, TextIO, None] = None):
+        self.file = file
+        """File to write the rows to as JSON Lines, if any."""
+
+        self.rows: List[Dict[str, object]] = []
+        """The collected rows as dicts of ``unit`` path, ``property`` name and the encoded value
+        (see :py:func:`encode_value`), only kept if no file is given."""
+
+        self._indices: Dict[int, Tuple[Unit, Dict[int, int]]] = {}
+        self._captures: List[List[Dict[str, object]]] = []
+        self._out: Optional[TextIO] = file if hasattr(file, "write") else None
+        self._tmp: Optional[Path] = None
+        self._token = None
+
+    def __enter__(self):
+        if self.file is not None and self._out is None:
+            file = Path(self.file)
+            self._tmp = file.with_name(f".{file.name}.{os.getpid()}.{id(self)}.tmp")
+            self._out = self._tmp.open("w", encoding="utf-8")
+
+        self._token = _active.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        _active.reset(self._token)
+
+        if self._tmp is not None:
+            self._out.close()
+
+            if exc_type is None:
+                os.replace(self._tmp, self.file)
+            else:
+                self._tmp.unlink()
+
+            self._tmp = None
+            self._out = None
+
+    def _index(self, parent: Unit, unit: Unit) -> int:
+        try:
+            _, indices = self._indices[id(parent)]
+        except KeyError:
+            # the parent is kept to prevent reuse of its id
+            indices = {id(u): i for i, u in enumerate(parent.subunits)}
+            self._indices[id(parent)] = parent, indices
+
+        return indices[id(unit)]
+
+    def unit_path(self, unit: Unit) -> str:
+        """Get the path of a unit relative to the root of its hierarchy."""
+        segments = []
+
+        while (parent := unit.parent) is not None:
+            segments.append(str(self._index(parent, unit)))
+            unit = parent
+
+        return "/".join(reversed(segments))
+
+    def owner(self, instance: ReprMixin) -> Tuple[str, str]:
+        """Get the unit path and the property name prefix for the properties of an instance."""
+        if isinstance(instance, Unit):
+            return self.unit_path(instance), ""
+
+        return _owner.get() or ("", "")
+
+    @contextmanager
+    def nested(self, unit_path: str, prefix: str):
+        """Context manager setting the owner of properties tables rendered within, like those of property values."""
+        token = _owner.set((unit_path, prefix))
+        try:
+            yield
+        finally:
+            _owner.reset(token)
+
+    def add(self, unit_path: str, name: str, value: object):
+        """Add a row for a property value, if it is exported."""
+        encoded = encode_value(value)
+
+        if encoded is not None:
+            self.extend([dict(unit=unit_path, property=name, **encoded)])
+
+    def extend(self, rows: Iterable[Dict[str, object]]):
+        """Add already encoded rows."""
+        rows = list(rows)
+
+        for c in self._captures:
+            c.extend(rows)
+
+        if self._out is not None:
+            _write_rows(self._out, rows)
+        else:
+            self.rows.extend(rows)
+
+    @contextmanager
+    def capture(self) -> Iterator[List[Dict[str, object]]]:
+        """Context manager collecting the rows added within in a list, in addition to exporting them,
+        for caches storing the rows of a display to replay them later."""
+        rows = []
+        self._captures.append(rows)
+        try:
+            yield rows
+        finally:
+            self._captures.remove(rows)
+
+    def write_jsonl(self, file: Union[str, os.PathLike, TextIO]):
+        """Write the collected rows as JSON Lines to a file."""
+        if hasattr(file, "write"):
+            _write_rows(file, self.rows)
+        else:
+            with Path(file).open("w", encoding="utf-8") as f:
+                _write_rows(f, self.rows)
+
+
+def _write_rows(file: TextIO, rows: Iterable[Dict[str, object]]):
+    for r in rows:
+        file.write(json.dumps(r))
+        file.write("\n")
+
+
+def active_export() -> Optional[PropertyExport]:
+    """Get the property export active in the current context, if any."""
+    return _active.get()
+
+
+def relocate_rows(rows: Iterable[Dict[str, object]], old_path: str, new_path: str) -> List[Dict[str, object]]:
+    """Replace the unit path prefix ``old_path`` of rows by ``new_path``."""
+    return [dict(r, unit=new_path + r["unit"][len(old_path):]) for r in rows]
+
+
+def relocate_owner(
+        rows: Iterable[Dict[str, object]], old_owner: Tuple[str, str], new_owner: Tuple[str, str]
+) -> List[Dict[str, object]]:
+    """Move rows of properties of ``old_owner`` to ``new_owner``, both given as unit path and property prefix
+    (see :py:meth:`PropertyExport.owner`). Rows of other owners, like nested units, are kept."""
+    old_path, old_prefix = old_owner
+    new_path, new_prefix = new_owner
+
+    return [
+        dict(r, unit=new_path, property=new_prefix + r["property"][len(old_prefix):])
+        if r["unit"] == old_path and r["property"].startswith(old_prefix) else r
+        for r in rows
+    ]
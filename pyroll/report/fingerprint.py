@@ -0,0 +1,100 @@
+import enum
+import hashlib
+import sys
+from typing import Mapping, Collection, Set
+
+import numpy as np
+import shapely
+
+from pyroll.core.repr import ReprMixin
+
+
+def fingerprint(*objects: object) -> str:
+    """
+    Compute a stable fingerprint of the given objects, which is equal across processes for equal data.
+    Numbers, strings, arrays, geometries, collections and the attributes of ``ReprMixin`` objects are considered.
+    Other objects are represented by their type and ``repr``, which may not be stable and lead to differing
+    fingerprints in the worst case.
+
+    :returns: the fingerprint as hex string
+    """
+    h = hashlib.sha256()
+
+    for o in objects:
+        _update(h, o, set())
+
+    return h.hexdigest()
+
+
+def _update(h, obj: object, seen: Set[int]):
+    if obj is None or isinstance(obj, (bool, int, float, complex, str, enum.Enum, np.generic)):
+        h.update(f"{type(obj).__qualname__}:{obj!r};".encode())
+
+    elif isinstance(obj, bytes):
+        h.update(b"bytes:%d;" % len(obj))
+        h.update(obj)
+
+    elif isinstance(obj, np.ndarray):
+        h.update(f"ndarray:{obj.dtype.str}:{obj.shape};".encode())
+        if obj.dtype.hasobject:
+            for e in obj.flat:
+                _update(h, e, seen)
+        else:
+            h.update(np.ascontiguousarray(obj).tobytes())
+
+    elif isinstance(obj, shapely.Geometry):
+        h.update(b"geometry;")
+        h.update(shapely.to_wkb(obj))
+
+    elif isinstance(obj, ReprMixin):
+        if id(obj) in seen:
+            h.update(b"cycle;")
+            return
+        seen.add(id(obj))
+
+        h.update(f"{type(obj).__qualname__}{{".encode())
+        for n, v in sorted(obj.__attrs__.items()):
+            h.update(f"{n}=".encode())
+            _update(h, v, seen)
+        h.update(b"};")
+
+        seen.remove(id(obj))
+
+    elif isinstance(obj, Mapping):
+        h.update(b"mapping{")
+        for k, v in sorted(obj.items(), key=lambda i: repr(i[0])):
+            _update(h, k, seen)
+            _update(h, v, seen)
+        h.update(b"};")
+
+    elif isinstance(obj, (set, frozenset)):
+        h.update(b"set{")
+        for f in sorted(fingerprint(e) for e in obj):
+            h.update(f.encode())
+        h.update(b"};")
+
+    elif isinstance(obj, Collection):
+        h.update(f"{type(obj).__qualname__}[".encode())
+        for e in obj:
+            _update(h, e, seen)
+        h.update(b"];")
+
+    elif callable(obj) and hasattr(obj, "__qualname__"):
+        h.update(f"callable:{getattr(obj, '__module__', '')}.{obj.__qualname__};".encode())
+
+    else:
+        h.update(f"{type(obj).__qualname__}:{obj!r};".encode())
+
+
+def module_version(module_name: str) -> str:
+    """Get the version of the package containing the given module from its ``VERSION`` or ``__version__``
+    attribute, searching from the module up to the top-level package."""
+    parts = module_name.split(".")
+
+    for i in range(len(parts), 0, -1):
+        module = sys.modules.get(".".join(parts[:i]))
+        version = getattr(module, "VERSION", None) or getattr(module, "__version__", None)
+        if version:
+            return str(version)
+
+    return ""
@@ -0,0 +1,165 @@
+import json
+import logging
+import os
+import tempfile
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Optional, List, Dict, Union
+
+import pyroll.core
+from pyroll.core import Unit
+from .config import config_values
+from .fingerprint import fingerprint, module_version
+from .pluggy import plugin_manager
+
+log = logging.getLogger(__name__)
+
+MANIFEST_VERSION = 1
+"""Format version of the manifest files, manifests of other versions are ignored."""
+
+_active: ContextVar[Optional["FragmentCache"]] = ContextVar("_active", default=None)
+
+
+def manifest_path(report_file: Union[str, os.PathLike]) -> Path:
+    """Get the path of the manifest belonging to a report file."""
+    report_file = Path(report_file)
+    return report_file.with_name(report_file.name + ".manifest.json")
+
+
+def environment_fingerprint() -> str:
+    """Fingerprint of everything besides the unit itself influencing the rendered displays,
+    namely the config values and the versions of pyroll-core and of all loaded hook implementations."""
+    impls = [
+        (impl.plugin_name, impl.function.__module__, impl.function.__qualname__,
+         module_version(impl.function.__module__))
+        for hook in [plugin_manager.hook.unit_display, plugin_manager.hook.unit_plot,
+                     plugin_manager.hook.property_format]
+        for impl in hook.get_hookimpls()
+    ]
+    return fingerprint(config_values(), pyroll.core.VERSION, impls)
+
+
+class FragmentCache:
+    """
+    Context manager reusing the rendered displays of unchanged units from a previous report.
+    The displays of each unit directly contained in a sequence are stored as HTML fragments in a manifest file,
+    addressed by a fingerprint of the unit state, its heading level and the :py:func:`environment_fingerprint`.
+    Reports rendered within the context take the fragments of unchanged units from the manifest
+    instead of calling the ``unit_display`` hooks.
+    On exit, the manifest is replaced by the fragments of the units rendered within the context,
+    if no exception occurred.
+
+    Use it as follows::
+
+        with FragmentCache(manifest_path("report.html")):
+            report_to(sequence, "report.html")
+
+    or simply call ``report_to(sequence, "report.html", incremental=True)``.
+    """
+
+    def __init__(self, manifest: Union[str, os.PathLike]):
+        self.manifest = Path(manifest)
+        """Path of the manifest file."""
+
+        self.hits = 0
+        """Number of units whose fragments were reused."""
+
+        self.misses = 0
+        """Number of units that were rendered."""
+
+        self._old: Dict[str, List[str]] = {}
+        self._new: Dict[str, List[str]] = {}
+        self._old_rows: Dict[str, List[Dict]] = {}
+        self._new_rows: Dict[str, List[Dict]] = {}
+        self._units: List[Dict[str, object]] = []
+        self._token = None
+
+    def __enter__(self):
+        content = self._load()
+        self._old = content.get("fragments", {})
+        self._old_rows = content.get("rows", {})
+        self._token = _active.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        _active.reset(self._token)
+
+        if exc_type is None:
+            self.save()
+
+    def _load(self) -> Dict[str, Dict]:
+        try:
+            content = json.loads(self.manifest.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            log.warning(f"Failed to read the fragment manifest, rendering all units: {e}")
+            return {}
+
+        if not isinstance(content, dict) or content.get("version") != MANIFEST_VERSION:
+            return {}
+
+        return content
+
+    def key(self, unit: Unit, level: int, environment: str) -> str:
+        """Get the key of the fragment of a unit."""
+        return fingerprint(environment, level, unit)
+
+    def get(self, key: str, with_rows: bool = False) -> Optional[List[str]]:
+        """
+        Get the displays stored under ``key`` or ``None`` if not present, counting hits and misses.
+
+        :param with_rows: whether the exported property rows of the unit are required too (see :py:meth:`get_rows`),
+            displays stored without rows are treated as not present
+        """
+        displays = self._new.get(key)
+        rows = self._new_rows
+
+        if displays is None:
+            displays = self._old.get(key)
+            rows = self._old_rows
+
+        if displays is not None and with_rows and key not in rows:
+            displays = None
+
+        if displays is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+
+        return displays
+
+    def get_rows(self, key: str) -> List[Dict]:
+        """Get the exported property rows stored under ``key`` with unit paths relative to the unit."""
+        rows = self._new_rows.get(key)
+        return rows if rows is not None else self._old_rows[key]
+
+    def put(self, key: str, unit: Unit, level: int, displays: List[str], rows: Optional[List[Dict]] = None):
+        """Store the displays of a unit under ``key`` for the manifest written on exit.
+        Must be called for reused displays too, as only stored displays are kept.
+        The exported property rows of the unit (see :py:class:`pyroll.report.export.PropertyExport`)
+        may be stored alongside with unit paths relative to the unit."""
+        self._new[key] = displays
+        self._units.append(dict(unit=str(unit), level=level, fingerprint=key))
+
+        if rows is not None:
+            self._new_rows[key] = rows
+        elif key in self._old_rows and key not in self._new_rows:
+            self._new_rows[key] = self._old_rows[key]
+
+    def save(self):
+        """Write the fragments rendered or used within the context to the manifest file."""
+        content = dict(version=MANIFEST_VERSION, units=self._units, fragments=self._new, rows=self._new_rows)
+
+        try:
+            fd, tmp = tempfile.mkstemp(dir=self.manifest.parent, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(content, f)
+            os.replace(tmp, self.manifest)
+        except OSError as e:
+            log.warning(f"Failed to write the fragment manifest: {e}")
+
+
+def active_fragment_cache() -> Optional[FragmentCache]:
+    """Get the fragment cache active in the current context, if any."""
+    return _active.get()
@@ -1,28 +1,42 @@
-from typing import Union, Optional
-
-from matplotlib.figure import Figure
+from typing import Union, Optional, Iterable, TYPE_CHECKING
 
 from pyroll.report.pluggy import hookspec
 from pyroll.core import Unit
 
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
+
 
 @hookspec
-def unit_display(unit: Unit, level: int) -> str:
+def unit_display(unit: Unit, level: int) -> Union[str, Iterable[str]]:
     """Return HTML code as str which displays the given unit.
     Multiple implementations will be included sequentially into the report.
+    An iterable of str chunks (for example a generator) may be returned instead, which is streamed into the report.
     Other return types as HTML str are possible, if respective hook wrappers for conversion exist."""
 
 
 @hookspec
-def unit_plot(unit: Unit) -> Union[Figure, str]:
+def unit_plot(unit: Unit) -> Union["Figure", str]:
     """Generate a matplotlib figure or SVG code visualizing a unit.
-    All loaded hook implementations are listed in the report."""
+    All loaded hook implementations are listed in the report.
+
+    Implementations may be called concurrently from several threads, for example when reports are rendered
+    in a thread pool, and must therefore not use global state. Create figures using the object-oriented API,
+    like ``matplotlib.figure.Figure(...)``, instead of ``matplotlib.pyplot``, whose current figure is shared
+    between threads, and do not modify ``matplotlib.rcParams``, use the keyword arguments of the plotting
+    methods instead. The returned figure must not be used elsewhere, it is rendered to SVG once and then dropped.
+    Figures created by ``pyplot`` are still accepted and closed after rendering, but are not safe to use
+    concurrently."""
 
 
 @hookspec(firstresult=True)
 def property_format(name: str, value: object, owner: Optional[object]) -> str:
     """
     Format the value of a property as string for display in the report. This hook is first result.
+    The report resolves the implementations to call once per property name, value type and owner type.
+    Implementations taking only the ``name`` argument are therefore evaluated once per name and must not depend
+    on other state. Use :py:func:`pyroll.report.unit_display.properties.value_types` to declare the value types
+    an implementation accepts, so that it is skipped for other types.
     :param name: the name of the property to format
     :param value: the value of the property to format
     :param owner: the owner of the property to format, may be None
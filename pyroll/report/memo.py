@@ -0,0 +1,30 @@
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional
+
+TABLE_MEMO_SIZE = 1024
+"""Maximum number of tables kept by the memo of :py:func:`table_memo`, the least recently used are dropped."""
+
+_table_memo: ContextVar[Optional[OrderedDict]] = ContextVar("_table_memo", default=None)
+
+
+@contextmanager
+def table_memo():
+    """
+    Context manager memoizing the properties tables of objects other than units rendered within by object identity
+    (see :py:func:`pyroll.report.unit_display.properties.render_properties_table`),
+    so that objects referenced several times, like rolls or materials, are rendered only once.
+    The objects must not change within the context, so it should span a single report, as the units are solved
+    before rendering.
+    """
+    token = _table_memo.set(OrderedDict())
+    try:
+        yield
+    finally:
+        _table_memo.reset(token)
+
+
+def active_table_memo() -> Optional[OrderedDict]:
+    """Get the table memo active in the current context, if any."""
+    return _table_memo.get()
@@ -0,0 +1,195 @@
+import contextlib
+import itertools
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional, Iterator, List, Dict, Tuple, Sequence, Callable, TypeVar, TYPE_CHECKING
+
+from pyroll.core import PassSequence
+from pyroll.report.pluggy import plugin_manager
+from pyroll.report.utils import iter_chunks
+from pyroll.report.fragments import active_fragment_cache, environment_fingerprint
+from pyroll.report.sequence_data import sequence_data_cache
+from pyroll.report.memo import table_memo
+from pyroll.report.export import PropertyExport, active_export, relocate_rows
+from pyroll.report.profiling import SlowProperty, slow_property_summary, active_slow_properties
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+T = TypeVar("T")
+
+log = logging.getLogger(__name__)
+
+_sequences: Dict[int, PassSequence] = {}
+"""Sequences rendered in parallel, inherited by the forked worker processes (units can not be pickled)."""
+
+_batches: Dict[int, Sequence[PassSequence]] = {}
+"""Sequence lists processed by :py:func:`map_sequences`, inherited by the forked worker processes."""
+
+_tokens = itertools.count()
+
+_pool: ContextVar[Optional[Tuple[PassSequence, int, "Executor"]]] = ContextVar("_pool", default=None)
+
+
+def _fork_context():
+    import multiprocessing
+
+    if "fork" not in multiprocessing.get_all_start_methods():
+        log.warning("Parallel report rendering requires the 'fork' start method, falling back to serial rendering.")
+        return None
+
+    return multiprocessing.get_context("fork")
+
+
+@contextmanager
+def worker_pool(sequence: PassSequence, workers: Optional[int]):
+    """
+    Context manager enabling rendering of the units of the given sequence in worker processes.
+
+    :param sequence: the sequence whose units shall be rendered in parallel
+    :param workers: number of worker processes, ``None`` or values less than 2 disable parallel rendering
+    """
+    if workers is None or workers < 2:
+        yield
+        return
+
+    mp_context = _fork_context()
+
+    if mp_context is None:
+        yield
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    token = next(_tokens)
+    _sequences[token] = sequence
+
+    try:
+        with ProcessPoolExecutor(workers, mp_context=mp_context) as executor:
+            context_token = _pool.set((sequence, token, executor))
+            try:
+                yield
+            finally:
+                _pool.reset(context_token)
+    finally:
+        del _sequences[token]
+
+
+def _render_unit(
+        token: int, index: int, level: int, export: bool
+) -> Tuple[List[str], Optional[List[Dict]], List[SlowProperty]]:
+    unit = _sequences[token].units[index]
+
+    with contextlib.ExitStack() as stack:
+        stack.enter_context(sequence_data_cache())
+        stack.enter_context(table_memo())
+        slow = stack.enter_context(slow_property_summary(log_summary=False))
+        rows = stack.enter_context(PropertyExport()) if export else None
+
+        # streamed displays can not be pickled, so they are joined in the worker
+        displays = ["".join(iter_chunks(d)) for d in plugin_manager.hook.unit_display(unit=unit, level=level)]
+
+    return displays, rows.rows if rows else None, slow
+
+
+def _render_displays(sequence: PassSequence, indices: List[int], level: int) -> Iterator[List]:
+    pool = _pool.get()
+
+    if pool is not None and pool[0] is sequence:
+        _, token, executor = pool
+        export = active_export()
+        slow_properties = active_slow_properties()
+        count = len(indices)
+
+        for displays, rows, slow in executor.map(
+                _render_unit, itertools.repeat(token, count), indices, itertools.repeat(level, count),
+                itertools.repeat(export is not None, count)
+        ):
+            if export is not None:
+                export.extend(rows)
+            if slow_properties is not None:
+                slow_properties.extend(slow)
+            yield displays
+        return
+
+    for i in indices:
+        yield plugin_manager.hook.unit_display(unit=sequence.units[i], level=level)
+
+
+def unit_displays(sequence: PassSequence, level: int) -> Iterator[List]:
+    """
+    Yield the displays of the units of a sequence in order.
+    The units are rendered in the worker pool, if one was opened for this sequence using :py:func:`worker_pool`.
+    If a :py:class:`pyroll.report.fragments.FragmentCache` is active, the stored displays of unchanged units
+    are yielded instead of rendering them, and the displays of the other units are rendered as a whole.
+    """
+    units = sequence.units
+    cache = active_fragment_cache()
+
+    if cache is None:
+        yield from _render_displays(sequence, list(range(len(units))), level)
+        return
+
+    export = active_export()
+    environment = environment_fingerprint()
+    keys = [cache.key(u, level, environment) for u in units]
+    stored = [cache.get(k, with_rows=export is not None) for k in keys]
+    rendered = _render_displays(sequence, [i for i, d in enumerate(stored) if d is None], level)
+
+    for unit, key, displays in zip(units, keys, stored):
+        rows = None
+
+        if export is not None:
+            path = export.unit_path(unit)
+
+            if displays is None:
+                with export.capture() as rows:
+                    displays = ["".join(iter_chunks(d)) for d in next(rendered)]
+                rows = relocate_rows(rows, path, "")
+            else:
+                rows = cache.get_rows(key)
+                export.extend(relocate_rows(rows, "", path))
+
+        elif displays is None:
+            displays = ["".join(iter_chunks(d)) for d in next(rendered)]
+
+        cache.put(key, unit, level, displays, rows)
+        yield displays
+
+
+def _call_on_sequence(token: int, func: Callable[[int, PassSequence], T], index: int) -> T:
+    return func(index, _batches[token][index])
+
+
+def map_sequences(
+        func: Callable[[int, PassSequence], T], sequences: Sequence[PassSequence], workers: Optional[int]
+) -> Iterator[T]:
+    """
+    Call a function with the index and the sequence for each of the given sequences
+    and yield the results in order.
+
+    :param func: the function to call, must be defined at module level
+    :param sequences: the sequences to process
+    :param workers: number of worker processes to process the sequences in parallel,
+        ``None`` or values less than 2 disable parallel processing
+    """
+    mp_context = _fork_context() if workers is not None and workers >= 2 else None
+
+    if mp_context is None:
+        for i, s in enumerate(sequences):
+            yield func(i, s)
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    token = next(_tokens)
+    _batches[token] = sequences
+
+    try:
+        with ProcessPoolExecutor(workers, mp_context=mp_context) as executor:
+            count = len(sequences)
+            yield from executor.map(_call_on_sequence, itertools.repeat(token, count), itertools.repeat(func, count),
+                                    range(count))
+    finally:
+        del _batches[token]
@@ -0,0 +1,177 @@
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional, Dict
+
+from .config import Config
+
+log = logging.getLogger(__name__)
+
+STALE_TMP_AGE = 3600
+"""Age in seconds, from which on temporary files left by interrupted writes are deleted on eviction."""
+
+
+class PlotCache:
+    """
+    Persistent cache of rendered SVG plots, stored as files in ``Config.PLOT_CACHE_DIR``.
+    Entries are addressed by a fingerprint of the plotted data (see :py:func:`pyroll.report.fingerprint.fingerprint`).
+    The least recently used entries are evicted if the total size exceeds ``Config.PLOT_CACHE_SIZE``.
+    The total size is determined once per process and directory and kept up to date by the writes of this process,
+    the directory is scanned again only to evict entries.
+
+    The hit and miss counters cover only the current process, lookups in worker processes are not counted.
+    """
+
+    def __init__(self):
+        self.hits = 0
+        """Number of successful lookups."""
+
+        self.misses = 0
+        """Number of failed lookups."""
+
+        self._size: Optional[int] = None
+        self._size_directory: Optional[Path] = None
+
+    @property
+    def directory(self) -> Path:
+        return Path(Config.PLOT_CACHE_DIR)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.svg"
+
+    def get(self, key: str) -> Optional[str]:
+        """Get the SVG code stored under ``key`` or ``None`` if not present."""
+        path = self._path(key)
+
+        try:
+            svg = path.read_text(encoding="utf-8")
+        except OSError:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+
+        try:
+            os.utime(path)  # mark as recently used
+        except OSError:
+            pass
+
+        return svg
+
+    def put(self, key: str, svg: str):
+        """Store the SVG code under ``key`` and evict old entries if the size limit is exceeded."""
+        directory = self.directory
+        path = self._path(key)
+
+        try:
+            directory.mkdir(parents=True, exist_ok=True)
+            size = self._total_size()
+
+            try:
+                size -= path.stat().st_size
+            except OSError:
+                pass
+
+            # write to a temporary file first, so that concurrent readers never see partial entries
+            fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(svg)
+            size += os.path.getsize(tmp)
+            os.replace(tmp, path)
+        except OSError as e:
+            log.warning(f"Failed to write to the plot cache: {e}")
+            return
+
+        self._size = size
+
+        if size > Config.PLOT_CACHE_SIZE:
+            self.evict()
+
+    def _total_size(self) -> int:
+        directory = self.directory
+
+        if self._size is None or self._size_directory != directory:
+            self._size = sum(size for _, size, _ in self._stats())
+            self._size_directory = directory
+
+        return self._size
+
+    def _entries(self, suffix: str = ".svg"):
+        try:
+            with os.scandir(self.directory) as it:
+                return [e for e in it if e.name.endswith(suffix) and e.is_file()]
+        except OSError:
+            return []
+
+    def _stats(self):
+        entries = []
+        for e in self._entries():
+            try:
+                stat = e.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, e.path))
+
+        return entries
+
+    def _remove_tmp_files(self, max_age: float):
+        now = time.time()
+
+        for e in self._entries(".tmp"):
+            try:
+                if now - e.stat().st_mtime >= max_age:
+                    os.remove(e.path)
+            except OSError:
+                pass
+
+    def evict(self):
+        """Delete the least recently used entries until the total size is within ``Config.PLOT_CACHE_SIZE``
+        and temporary files left by interrupted writes (see ``STALE_TMP_AGE``)."""
+        entries = self._stats()
+        total = sum(size for _, size, _ in entries)
+
+        for _, size, path in sorted(entries):
+            if total <= Config.PLOT_CACHE_SIZE:
+                break
+
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+
+        self._size = total
+        self._size_directory = self.directory
+
+        self._remove_tmp_files(STALE_TMP_AGE)
+
+    def clear(self):
+        """Delete all entries and temporary files and reset the counters."""
+        for e in self._entries():
+            try:
+                os.remove(e.path)
+            except OSError:
+                pass
+
+        self._remove_tmp_files(0)
+
+        self._size = None
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Get the hit and miss counters and the current number and total size of entries."""
+        sizes = [size for _, size, _ in self._stats()]
+
+        return dict(
+            hits=self.hits,
+            misses=self.misses,
+            entries=len(sizes),
+            size=sum(sizes),
+        )
+
+
+plot_cache = PlotCache()
+"""The plot cache used by the report."""
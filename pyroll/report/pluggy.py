@@ -1,5 +1,25 @@
 import pluggy
 
-plugin_manager = pluggy.PluginManager("pyroll_report")
+
+class PluginManager(pluggy.PluginManager):
+    """Plugin manager counting the changes of the registered plugins, so that dependent caches can be invalidated."""
+
+    def __init__(self, project_name: str):
+        super().__init__(project_name)
+        self.generation = 0
+        """Number incremented on every registration or unregistration of a plugin."""
+
+    def register(self, plugin, name=None):
+        result = super().register(plugin, name)
+        self.generation += 1
+        return result
+
+    def unregister(self, plugin=None, name=None):
+        result = super().unregister(plugin, name)
+        self.generation += 1
+        return result
+
+
+plugin_manager = PluginManager("pyroll_report")
 hookspec = pluggy.HookspecMarker("pyroll_report")
 hookimpl = pluggy.HookimplMarker("pyroll_report")
@@ -0,0 +1,333 @@
+import contextlib
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Dict, List, Tuple, Optional, Union, TextIO
+
+from pyroll.core import PassSequence
+from .config import Config
+from .pluggy import plugin_manager
+
+log = logging.getLogger(__name__)
+
+_active: ContextVar[Optional["ReportProfiler"]] = ContextVar("_active", default=None)
+
+_install_lock = threading.Lock()
+_install_count = 0
+_originals: Dict[object, object] = {}
+
+
+def _reset_lock_after_fork():
+    global _install_lock
+    _install_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_lock_after_fork)
+
+
+def _wrap(hook_name: str, impl):
+    func = impl.function
+    key = (hook_name, impl.plugin_name, func.__name__)
+    unit_index = impl.argnames.index("unit") if hook_name == "unit_display" and "unit" in impl.argnames else None
+
+    @functools.wraps(func)
+    def wrapper(*args):
+        profiler = _active.get()
+
+        if profiler is None:
+            return func(*args)
+
+        return profiler._call(key, func, args, args[unit_index] if unit_index is not None else None)
+
+    return wrapper
+
+
+def _install():
+    global _install_count
+
+    with _install_lock:
+        if _install_count == 0:
+            for hook_name, caller in vars(plugin_manager.hook).items():
+                for impl in caller.get_hookimpls():
+                    if impl.hookwrapper or getattr(impl, "wrapper", False):
+                        continue
+                    _originals[impl] = impl.function
+                    impl.function = _wrap(hook_name, impl)
+
+        _install_count += 1
+
+
+def _uninstall():
+    global _install_count
+
+    with _install_lock:
+        _install_count -= 1
+
+        if _install_count == 0:
+            for impl, func in _originals.items():
+                impl.function = func
+            _originals.clear()
+
+
+class HookImplStats:
+    """Timing statistics of one hook implementation."""
+
+    def __init__(self, hook: str, plugin: str, function: str):
+        self.hook = hook
+        """Name of the hook."""
+
+        self.plugin = plugin
+        """Name of the plugin providing the implementation."""
+
+        self.function = function
+        """Name of the implementing function."""
+
+        self.calls = 0
+        """Number of calls."""
+
+        self.cumulative = 0.0
+        """Total time spent in the implementation including nested hook calls in seconds."""
+
+        self.self_time = 0.0
+        """Total time spent in the implementation excluding nested hook calls in seconds."""
+
+    def as_dict(self):
+        return dict(
+            hook=self.hook, plugin=self.plugin, function=self.function,
+            calls=self.calls, cumulative=self.cumulative, self=self.self_time,
+        )
+
+
+class ReportProfiler:
+    """
+    Context manager recording the time spent in the hook implementations of the report plugin manager
+    while reports are rendered within its context.
+
+    Use it as follows::
+
+        with ReportProfiler() as profiler:
+            report(sequence)
+
+        profiler.write_json("profile.json")
+
+    Individual hook calls are only recorded if ``trace`` is set,
+    which is required for :py:meth:`write_chrome_trace`.
+
+    Units rendered in worker processes are not recorded.
+    Displays returned as generators are rendered while the report is streamed, so their time is recorded
+    for the hook calls made during streaming and not for the implementation that returned the generator.
+    """
+
+    def __init__(self, trace: bool = False):
+        """
+        :param trace: whether to record each hook call for :py:meth:`write_chrome_trace`,
+            which takes memory proportional to the number of calls
+        """
+        self.total = 0.0
+        """Wall time spent within the context in seconds."""
+
+        self.trace = trace
+        """Whether each hook call is recorded."""
+
+        self._impl_stats: Dict[Tuple[str, str, str], HookImplStats] = {}
+        self._unit_stats: Dict[int, List] = {}
+        self._events: List[Tuple[Tuple[str, str, str], float, float]] = []
+        self._stack: List[float] = []
+        self._hook_time = 0.0
+        self._start = None
+        self._token = None
+
+    def __enter__(self):
+        _install()
+        self._token = _active.set(self)
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.total += time.perf_counter() - self._start
+        _active.reset(self._token)
+        _uninstall()
+
+    def _call(self, key, func, args, unit):
+        start = time.perf_counter()
+        self._stack.append(0.0)
+
+        try:
+            return func(*args)
+        finally:
+            duration = time.perf_counter() - start
+            nested = self._stack.pop()
+
+            if self._stack:
+                self._stack[-1] += duration
+            else:
+                self._hook_time += duration
+
+            try:
+                stats = self._impl_stats[key]
+            except KeyError:
+                stats = self._impl_stats[key] = HookImplStats(*key)
+
+            stats.calls += 1
+            stats.cumulative += duration
+            stats.self_time += duration - nested
+
+            if unit is not None:
+                unit_stats = self._unit_stats.setdefault(id(unit), [str(unit), unit, 0, 0.0])
+                unit_stats[2] += 1
+                unit_stats[3] += duration
+
+            if self.trace:
+                self._events.append((key, start, duration))
+
+    @property
+    def hook_stats(self) -> List[HookImplStats]:
+        """Statistics per hook implementation, sorted descending by cumulative time."""
+        return sorted(self._impl_stats.values(), key=lambda s: s.cumulative, reverse=True)
+
+    @property
+    def unit_stats(self) -> List[Dict[str, object]]:
+        """Number of ``unit_display`` calls and their cumulative time per unit in order of rendering."""
+        return [dict(unit=name, calls=calls, cumulative=cumulative) for name, _, calls, cumulative in
+                self._unit_stats.values()]
+
+    @property
+    def other_time(self) -> float:
+        """Time spent outside of hook implementations, mainly in template rendering, in seconds."""
+        total = self.total + (time.perf_counter() - self._start if _active.get() is self else 0)
+        return total - self._hook_time
+
+    def as_dict(self) -> Dict[str, object]:
+        """Get all recorded statistics as JSON serializable dict."""
+        return dict(
+            total=self.total,
+            other=self.other_time,
+            hooks=[s.as_dict() for s in self.hook_stats],
+            units=self.unit_stats,
+        )
+
+    def write_json(self, file: Union[str, os.PathLike, TextIO]):
+        """Write the statistics as JSON to a file."""
+        _write(file, json.dumps(self.as_dict(), indent=2))
+
+    def write_chrome_trace(self, file: Union[str, os.PathLike, TextIO]):
+        """Write all recorded hook calls as trace events to a file,
+        which can be viewed in ``chrome://tracing`` or Perfetto. Requires the profiler to be created with ``trace``."""
+        if not self.trace:
+            raise ValueError("Hook calls were not recorded, create the profiler with trace=True.")
+
+        pid = os.getpid()
+        events = [
+            dict(
+                name=f"{plugin}.{function}", cat=hook, ph="X", pid=pid, tid=0,
+                ts=(start - self._start) * 1e6, dur=duration * 1e6,
+            )
+            for (hook, plugin, function), start, duration in self._events
+        ]
+        _write(file, json.dumps(dict(traceEvents=events, displayTimeUnit="ms")))
+
+
+def _write(file: Union[str, os.PathLike, TextIO], content: str):
+    if hasattr(file, "write"):
+        file.write(content)
+    else:
+        Path(file).write_text(content, encoding="utf-8")
+
+
+def active_profiler() -> Optional[ReportProfiler]:
+    """Get the profiler active in the current context, if any."""
+    return _active.get()
+
+
+def profile_report(
+        pass_sequence: PassSequence, workers: Optional[int] = None, trace: bool = False
+) -> Tuple[str, ReportProfiler]:
+    """
+    Render an HTML report from the specified pass sequence while recording timing statistics.
+
+    :param pass_sequence: PassSequence instance to take the data from
+    :param workers: number of worker processes to render the units of the sequence in parallel
+    :param trace: whether to record each hook call for :py:meth:`ReportProfiler.write_chrome_trace`
+    :returns: generated HTML code as string and the profiler holding the statistics
+    """
+    from .report import report
+
+    with ReportProfiler(trace) as profiler:
+        result = report(pass_sequence, workers)
+
+    return result, profiler
+
+
+class SlowProperty:
+    """A property whose evaluation or formatting exceeded ``Config.PROPERTY_TIME_BUDGET``."""
+
+    def __init__(self, unit: str, owner: str, name: str, duration: float):
+        self.unit = unit
+        """String representation of the unit the property belongs to."""
+
+        self.owner = owner
+        """String representation of the object owning the property, may be a nested object of the unit."""
+
+        self.name = name
+        """Name of the property, ``__attrs__`` for the evaluation of all attributes of the owner."""
+
+        self.duration = duration
+        """Time spent in seconds."""
+
+    def __str__(self):
+        owner = self.owner if self.owner == self.unit else f"{self.owner} in {self.unit}"
+        return f"'{self.name}' of {owner}: {self.duration:.3f} s"
+
+
+_slow_properties: ContextVar[Optional[List[SlowProperty]]] = ContextVar("_slow_properties", default=None)
+
+
+def record_slow_property(unit: object, owner: object, name: str, duration: float):
+    """Log a property exceeding ``Config.PROPERTY_TIME_BUDGET`` and add it to the summary of the current report."""
+    slow = SlowProperty(str(unit), str(owner), name, duration)
+    log.warning(f"Slow property {slow} exceeding the budget of {Config.PROPERTY_TIME_BUDGET} s.")
+
+    slow_properties = _slow_properties.get()
+    if slow_properties is not None:
+        slow_properties.append(slow)
+
+
+SLOW_PROPERTIES_SUMMARY_SIZE = 20
+"""Maximum number of properties listed in the summary logged by :py:func:`slow_property_summary`."""
+
+
+@contextlib.contextmanager
+def slow_property_summary(log_summary: bool = True):
+    """
+    Context manager collecting the properties exceeding ``Config.PROPERTY_TIME_BUDGET`` within its context
+    and logging a summary of the slowest on exit, so that a report lists its slow properties once at the end
+    instead of only between the warnings logged while rendering.
+
+    :param log_summary: whether to log the summary on exit, worker processes only collect
+    :returns: the list of collected :py:class:`SlowProperty` instances
+    """
+    slow_properties = []
+    token = _slow_properties.set(slow_properties)
+
+    try:
+        yield slow_properties
+    finally:
+        _slow_properties.reset(token)
+
+        if log_summary and slow_properties:
+            slowest = sorted(slow_properties, key=lambda p: p.duration, reverse=True)[:SLOW_PROPERTIES_SUMMARY_SIZE]
+            log.warning(
+                f"{len(slow_properties)} properties exceeded the time budget of {Config.PROPERTY_TIME_BUDGET} s, "
+                f"the slowest were:\n" + "\n".join(f"    {p}" for p in slowest)
+            )
+
+
+def active_slow_properties() -> Optional[List[SlowProperty]]:
+    """Get the list collecting slow properties in the current context, if any."""
+    return _slow_properties.get()
@@ -1,72 +1,251 @@
+import contextlib
+import contextvars
 import datetime
+import functools
+import logging
 import os
-import tempfile
-import webbrowser
-
-import jinja2
 from pathlib import Path
 import platform
 
-from pyroll.core import PassSequence
+from pyroll.core import PassSequence, Unit
 from pyroll.report.pluggy import plugin_manager
+from pyroll.report.config import Config
+from pyroll.report.budget import SizeBudget, DEGRADATIONS
+from pyroll.report.fragments import FragmentCache, manifest_path
+from pyroll.report.export import PropertyExport
+from pyroll.report.parallel import worker_pool, _tokens
+from pyroll.report.sequence_data import sequence_data_cache
+from pyroll.report.memo import table_memo
+from pyroll.report.profiling import ReportProfiler, active_profiler, slow_property_summary
+from pyroll.report.templates import get_template
+from pyroll.report.utils import deduplicate_svg_symbols
+
+from typing import Union, TextIO, Optional, Iterator, Iterable, List, Callable
+
+log = logging.getLogger(__name__)
+
+_TEMPLATE_DIR = Path(__file__).parent
+
+
+def _render_statistics(profiler: ReportProfiler) -> str:
+    return get_template(_TEMPLATE_DIR, "statistics.html").render(
+        other=profiler.other_time,
+        hooks=profiler.hook_stats,
+        units=profiler.unit_stats,
+    )
+
+
+def _render_size_summary(budget: SizeBudget) -> str:
+    return get_template(_TEMPLATE_DIR, "size_summary.html").render(
+        limit=budget.limit,
+        used=budget.used,
+        sections=sorted(budget.sections.items(), key=lambda s: s[1], reverse=True),
+        degraded=budget.degraded,
+        degradations=DEGRADATIONS,
+    )
+
+
+def _platform() -> str:
+    return f"{platform.node()} ({platform.platform()}, {platform.python_implementation()} {platform.python_version()})"
+
+
+def _generate(pass_sequence: PassSequence, workers: Optional[int]) -> Iterator[str]:
+    template = get_template(_TEMPLATE_DIR, "main.html")
+
+    with contextlib.ExitStack() as stack:
+        statistics = None
+
+        if Config.PRINT_STATISTICS:
+            profiler = active_profiler() or stack.enter_context(ReportProfiler())
+            statistics = functools.partial(_render_statistics, profiler)
+
+        budget = stack.enter_context(SizeBudget(pass_sequence, Config.MAX_REPORT_SIZE))
+        size_summary = None
+
+        if Config.MAX_REPORT_SIZE or Config.PRINT_STATISTICS:
+            size_summary = functools.partial(_render_size_summary, budget)
+
+        stack.enter_context(slow_property_summary())
+        stack.enter_context(sequence_data_cache())
+        stack.enter_context(table_memo())
+
+        if Config.MAX_REPORT_SIZE and workers is not None and workers >= 2:
+            log.warning(
+                "Rendering the units serially, as worker processes are not used with MAX_REPORT_SIZE set, "
+                "since degraded units must be rendered again."
+            )
+            workers = None
+
+        stack.enter_context(worker_pool(pass_sequence, workers))
+
+        displays = plugin_manager.hook.unit_display(unit=pass_sequence, level=1)
+
+        yield from budget.count(deduplicate_svg_symbols(template.generate(
+            timestamp=datetime.datetime.now().isoformat(timespec="seconds"),
+            platform=_platform(),
+            displays=displays,
+            statistics=statistics,
+            size_summary=size_summary,
+        )))
+
+
+def _render_page(displays: Iterable) -> str:
+    return "".join(deduplicate_svg_symbols(get_template(_TEMPLATE_DIR, "main.html").generate(
+        timestamp=datetime.datetime.now().isoformat(timespec="seconds"),
+        platform=_platform(),
+        displays=displays,
+        statistics=None,
+    )))
+
+
+def _render_unit_page(units: List[Unit], index: int, href: Callable[[int], str], contents: str) -> str:
+    # a page of one unit of a sequence with navigation to its neighbours and the page of the sequence
+    nav = get_template(_TEMPLATE_DIR, "unit_nav.html").render(
+        previous=href(index - 1) if index > 0 else None,
+        previous_label=str(units[index - 1]) if index > 0 else None,
+        next=href(index + 1) if index + 1 < len(units) else None,
+        next_label=str(units[index + 1]) if index + 1 < len(units) else None,
+        contents=contents,
+    )
+    return _render_page([nav, *plugin_manager.hook.unit_display(unit=units[index], level=2), nav])
 
-from typing import Union, TextIO
 
-_env = jinja2.Environment(
-    loader=jinja2.FileSystemLoader(Path(__file__).parent, encoding="utf-8")
-)
+def iter_report(pass_sequence: PassSequence, workers: Optional[int] = None) -> Iterator[str]:
+    """
+    Render an HTML report from the specified pass sequence chunk by chunk.
+    The units are rendered only as the chunks are consumed, so the complete report is never held in memory.
 
+    :param pass_sequence: PassSequence instance to take the data from
+    :param workers: number of worker processes to render the units of the sequence in parallel,
+        the default is to render serially
+    :returns: an iterator over the chunks of generated HTML code
+    """
+
+    # run the rendering in an own context, so that context state does not leak to the consumer between chunks
+    context = contextvars.copy_context()
+    chunks = context.run(_generate, pass_sequence, workers)
 
-def report(pass_sequence: PassSequence) -> str:
+    try:
+        while True:
+            try:
+                yield context.run(next, chunks)
+            except StopIteration:
+                return
+    finally:
+        context.run(chunks.close)
+
+
+def report(pass_sequence: PassSequence, workers: Optional[int] = None) -> str:
     """
     Render an HTML report from the specified pass sequence.
 
     :param pass_sequence: PassSequence instance to take the data from
+    :param workers: number of worker processes to render the units of the sequence in parallel,
+        the default is to render serially
     :returns: generated HTML code as string
     """
 
-    template = _env.get_template("main.html")
+    return "".join(iter_report(pass_sequence, workers))
 
-    displays = plugin_manager.hook.unit_display(unit=pass_sequence, level=1)
 
-    return template.render(
-        timestamp=datetime.datetime.now().isoformat(timespec="seconds"),
-        platform=f"{platform.node()} ({platform.platform()}, {platform.python_implementation()} {platform.python_version()})",
-        displays=displays,
-    )
+def _write_chunks(file: TextIO, chunks: Iterable[str]) -> int:
+    return sum(file.write(c) for c in chunks)
 
 
-def report_to(pass_sequence: PassSequence, file: Union[str, os.PathLike, TextIO]) -> int:
+def report_to(
+        pass_sequence: PassSequence, file: Union[str, os.PathLike, TextIO], workers: Optional[int] = None,
+        incremental: bool = False, properties_file: Union[str, os.PathLike, TextIO, None] = None,
+) -> int:
     """
     Render an HTML report from the specified pass sequence and save it directly to a file.
+    The report is written chunk by chunk while it is rendered.
+    A report file given as path is written to a temporary file first, which replaces the file only on success,
+    so a failing rendering leaves an existing report untouched.
 
     :param pass_sequence: PassSequence instance to take the data from
     :param file: a str representing a path, a path-like object, or a file-like object with write permissions
     to write the report to
+    :param workers: number of worker processes to render the units of the sequence in parallel,
+        the default is to render serially
+    :param incremental: whether to reuse the displays of units unchanged since the last report written to the file,
+        which are stored in a manifest file next to it (see :py:class:`pyroll.report.fragments.FragmentCache`),
+        requires ``file`` to be a path
+    :param properties_file: a path or file-like object to write the raw values of all printed properties to
+        as JSON Lines (see :py:class:`pyroll.report.export.PropertyExport`), the default is to not export them
     :returns: the number of written bytes
     """
 
-    result = report(pass_sequence)
+    _check_incremental(file, incremental)
 
-    try:
-        return file.write(result)
+    with contextlib.closing(
+            _report_chunks(pass_sequence, workers, file if incremental else None, properties_file)
+    ) as chunks:
+        if hasattr(file, "write"):
+            return _write_chunks(file, chunks)
+
+        # a failing rendering shall not destroy a previous report, so it is replaced only on success
+        file = Path(file)
+        tmp = _temporary_path(file)
+
+        try:
+            with tmp.open("w", encoding="utf-8") as f:
+                written = _write_chunks(f, chunks)
+
+            os.replace(tmp, file)
+            return written
+
+        finally:
+            if tmp.exists():
+                tmp.unlink()
+
+
+def _temporary_path(file: Path) -> Path:
+    return file.with_name(f".{file.name}.{os.getpid()}.{next(_tokens)}.tmp")
+
+
+def _check_incremental(file: Union[str, os.PathLike, TextIO], incremental: bool):
+    if incremental and hasattr(file, "write"):
+        raise ValueError("Incremental rendering requires the report file to be given as path.")
+
+
+def _report_chunks(
+        pass_sequence: PassSequence, workers: Optional[int],
+        incremental_file: Union[str, os.PathLike, None], properties_file: Union[str, os.PathLike, TextIO, None],
+) -> Iterator[str]:
+    # the fragment cache and the property export are committed only if the generator is exhausted
+    with contextlib.ExitStack() as stack:
+        if incremental_file and Config.MAX_REPORT_SIZE:
+            log.warning(
+                "Rendering all units, as stored unit displays are not reused with MAX_REPORT_SIZE set, "
+                "since the displays depend on the size of the whole report."
+            )
+            incremental_file = None
+
+        cache = stack.enter_context(FragmentCache(manifest_path(incremental_file))) if incremental_file else None
+
+        if properties_file is not None:
+            stack.enter_context(PropertyExport(properties_file))
+
+        yield from iter_report(pass_sequence, workers)
 
-    except AttributeError:
-        path = Path(file)
-        return path.write_text(result, encoding='utf-8')
+    if cache is not None:
+        log.info(f"Reused {cache.hits} and rendered {cache.misses} unit displays.")
 
 
-def show_report(pass_sequence: PassSequence) -> Path:
+def show_report(pass_sequence: PassSequence, workers: Optional[int] = None) -> Path:
     """
     Render an HTML report from the specified pass sequence, save it to a temporary file and open this in the webbrowser.
 
     :param pass_sequence: PassSequence instance to take the data from
+    :param workers: number of worker processes to render the units of the sequence in parallel,
+        the default is to render serially
     :returns: the path to the temporary file
     """
+    import tempfile
+    import webbrowser
 
-    result = report(pass_sequence)
     with tempfile.NamedTemporaryFile("w", prefix="pyroll_report_", suffix=".html", delete=False, encoding='utf-8') as file:
-        file.write(result)
+        _write_chunks(file, iter_report(pass_sequence, workers))
         path = Path(file.name)
 
     webbrowser.open(path.as_uri())
@@ -0,0 +1,125 @@
+import functools
+from contextlib import contextmanager
+from contextvars import ContextVar
+from operator import attrgetter
+from typing import Optional, Dict, List, Tuple
+
+import numpy as np
+
+from pyroll.core import PassSequence, BaseRollPass, Unit
+
+_cache: ContextVar[Optional[Dict[int, Tuple[PassSequence, "SequenceData"]]]] = ContextVar("_cache", default=None)
+
+
+class SequenceData:
+    """
+    Columnar view of the data of a pass sequence for use in sequence plots.
+    The columns are NumPy arrays, which are extracted on first access in one traversal of the units and cached.
+    Columns ending in ``_in_out`` hold the value of the incoming profile of the first unit followed by
+    the values of the outgoing profiles of all units.
+
+    Use :py:func:`sequence_data` to get the shared instance for a sequence during report rendering.
+    """
+
+    def __init__(self, sequence: PassSequence):
+        self.sequence = sequence
+        """The sequence the data is taken from."""
+
+        self.units: List[Unit] = list(sequence)
+        """All units of the sequence."""
+
+        self.roll_passes: List[BaseRollPass] = [u for u in self.units if isinstance(u, BaseRollPass)]
+        """All roll passes of the sequence."""
+
+    @staticmethod
+    def _extract(units: List[Unit], *attributes: str) -> List[np.ndarray]:
+        # one traversal for all columns
+        getters = [attrgetter(a) for a in attributes]
+        rows = [[g(u) for g in getters] for u in units]
+        return [np.array([r[i] for r in rows], dtype=float) for i in range(len(getters))]
+
+    @functools.cached_property
+    def labels(self) -> np.ndarray:
+        """String representations of all units."""
+        return np.array([str(u) for u in self.units], dtype=object)
+
+    @functools.cached_property
+    def roll_pass_labels(self) -> np.ndarray:
+        """String representations of the roll passes."""
+        return np.array([str(u) for u in self.roll_passes], dtype=object)
+
+    @functools.cached_property
+    def strains_in_out(self) -> np.ndarray:
+        """Mean equivalent strains of the profiles of all units."""
+        return self._in_out(self.units, "strain")
+
+    @functools.cached_property
+    def roll_pass_areas_in_out(self) -> np.ndarray:
+        """Cross-section areas of the profiles of the roll passes."""
+        return self._in_out(self.roll_passes, "cross_section.area")
+
+    @staticmethod
+    def _in_out(units: List[Unit], attribute: str) -> np.ndarray:
+        if not units:
+            return np.empty(0)
+
+        getter = attrgetter(attribute)
+        return np.array([getter(units[0].in_profile)] + [getter(u.out_profile) for u in units], dtype=float)
+
+    @functools.cached_property
+    def roll_forces(self) -> np.ndarray:
+        """Roll forces of the roll passes."""
+        return self._roll_pass_columns[0]
+
+    @functools.cached_property
+    def roll_torques(self) -> np.ndarray:
+        """Roll torques of the roll passes."""
+        return self._roll_pass_columns[1]
+
+    @functools.cached_property
+    def engine_powers(self) -> np.ndarray:
+        """Engine powers of the roll passes."""
+        return self._roll_pass_columns[2]
+
+    @functools.cached_property
+    def _roll_pass_columns(self) -> List[np.ndarray]:
+        return self._extract(self.roll_passes, "roll_force", "roll.roll_torque", "engine.power")
+
+    @functools.cached_property
+    def filling_ratios(self) -> Dict[str, np.ndarray]:
+        """Filling ratios and errors of the roll passes, as dict with the keys ``filling_ratio``,
+        ``cross_section_filling_ratio``, ``filling_error``, ``cross_section_error``, ``target_filling_ratio``
+        and ``target_cross_section_filling_ratio``."""
+        names = ["filling_ratio", "cross_section_filling_ratio", "filling_error", "cross_section_error"]
+        target_names = ["target_filling_ratio", "target_cross_section_filling_ratio"]
+
+        columns = self._extract(self.roll_passes, *[f"out_profile.{n}" for n in names], *target_names)
+        return dict(zip(names + target_names, columns))
+
+
+@contextmanager
+def sequence_data_cache():
+    """Context manager sharing the :py:class:`SequenceData` instances returned by :py:func:`sequence_data`
+    within its context, so that all sequence plots of a report gather the columns of the units only once.
+    The units must not change within the context."""
+    token = _cache.set({})
+    try:
+        yield
+    finally:
+        _cache.reset(token)
+
+
+def sequence_data(sequence: PassSequence) -> SequenceData:
+    """Get the columnar data of a sequence, which is shared by all plots of the currently rendered report."""
+    cache = _cache.get()
+
+    if cache is None:
+        return SequenceData(sequence)
+
+    entry = cache.get(id(sequence))
+
+    if entry is None:
+        # the sequence is kept to prevent reuse of its id
+        entry = cache[id(sequence)] = sequence, SequenceData(sequence)
+
+    return entry[1]
@@ -0,0 +1,188 @@
+import contextlib
+import contextvars
+import functools
+import logging
+import re
+import threading
+from typing import Optional, Dict
+
+from pyroll.core import PassSequence
+from pyroll.report.pluggy import plugin_manager
+from pyroll.report.memo import table_memo
+from pyroll.report.profiling import slow_property_summary
+from pyroll.report.report import _render_page, _render_unit_page
+from pyroll.report.sequence_data import sequence_data_cache
+from pyroll.report.unit_display.units import unit_links
+
+log = logging.getLogger(__name__)
+
+_UNIT_PATH = re.compile(r"/units/(\d+)")
+
+
+class ReportServer:
+    """
+    Local HTTP server rendering the report of a pass sequence on demand.
+    The index page shows the display of the sequence itself with links to its units instead of their displays.
+    Each unit is rendered on its own page when first requested, all pages are kept in memory afterwards.
+    Rendering happens in one request at a time, while cached pages are served concurrently.
+
+    Use it as context manager, which closes the server on exit::
+
+        with ReportServer(sequence) as server:
+            print(server.url)
+            server.serve_forever()
+
+    or call :py:func:`serve_report` to serve in the background and open the browser.
+    """
+
+    def __init__(self, pass_sequence: PassSequence, host: str = "127.0.0.1", port: int = 0):
+        """
+        :param pass_sequence: PassSequence instance to take the data from
+        :param host: host name or address to listen on
+        :param port: port to listen on, the default is to choose a free one
+        """
+        from http.server import ThreadingHTTPServer
+
+        self.sequence = pass_sequence
+        """The served sequence."""
+
+        self._pages: Dict[str, bytes] = {}
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+        # the caches of a report are shared by all pages, so they live in an own context entered for each rendering
+        self._context = contextvars.copy_context()
+        self._stack = contextlib.ExitStack()
+        for cm in [slow_property_summary(), sequence_data_cache(), table_memo()]:
+            self._context.run(self._stack.enter_context, cm)
+
+        self._httpd = ThreadingHTTPServer((host, port), _handler_class())
+        self._httpd.report_server = self
+
+    @property
+    def url(self) -> str:
+        """URL of the index page."""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def page(self, path: str) -> Optional[bytes]:
+        """Get the encoded page for a URL path, rendering it on first request, or ``None`` if not existing."""
+        page = self._pages.get(path)
+
+        if page is not None:
+            return page
+
+        with self._lock:
+            page = self._pages.get(path)
+
+            if page is None:
+                html = self._context.run(self._render, path)
+
+                if html is None:
+                    return None
+
+                page = self._pages[path] = html.encode("utf-8")
+
+        return page
+
+    def _render(self, path: str) -> Optional[str]:
+        if path == "/":
+            with unit_links(self.sequence, lambda i: f"units/{i}"):
+                return _render_page(plugin_manager.hook.unit_display(unit=self.sequence, level=1))
+
+        match = _UNIT_PATH.fullmatch(path)
+
+        if match is None:
+            return None
+
+        units = self.sequence.units
+        index = int(match.group(1))
+
+        if index >= len(units):
+            return None
+
+        log.info(f"Rendering unit {index}: {units[index]}")
+        return _render_unit_page(units, index, str, "../")
+
+    def start(self):
+        """Start serving in a background thread."""
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="pyroll-report-server", daemon=True)
+        self._thread.start()
+
+    def serve_forever(self):
+        """Serve in the current thread until :py:meth:`close` is called from another thread."""
+        self._httpd.serve_forever()
+
+    def close(self):
+        """Stop serving and release all rendered pages."""
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+
+        self._httpd.server_close()
+        self._pages.clear()
+        self._context.run(self._stack.close)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+@functools.lru_cache(maxsize=None)
+def _handler_class():
+    # created on first use, so that the http.server module is only imported when serving
+    from http.server import BaseHTTPRequestHandler
+    from urllib.parse import urlsplit
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            try:
+                page = self.server.report_server.page(urlsplit(self.path).path)
+            except Exception:
+                log.exception(f"Failed to render {self.path}.")
+                self.send_error(500)
+                return
+
+            if page is None:
+                self.send_error(404)
+                return
+
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(page)))
+            self.end_headers()
+            self.wfile.write(page)
+
+        def log_message(self, format, *args):
+            log.debug(format % args)
+
+    return Handler
+
+
+def serve_report(
+        pass_sequence: PassSequence, host: str = "127.0.0.1", port: int = 0, open_browser: bool = True
+) -> ReportServer:
+    """
+    Serve the report of the specified pass sequence from a local HTTP server in a background thread
+    and open it in the webbrowser.
+    Units are rendered only when their page is first requested (see :py:class:`ReportServer`),
+    so the time to the first view does not depend on the length of the sequence.
+
+    :param pass_sequence: PassSequence instance to take the data from
+    :param host: host name or address to listen on
+    :param port: port to listen on, the default is to choose a free one
+    :param open_browser: whether to open the index page in the webbrowser
+    :returns: the running server, call its ``close()`` method to stop it
+    """
+    server = ReportServer(pass_sequence, host, port)
+    server.start()
+    log.info(f"Serving report at: {server.url}")
+
+    if open_browser:
+        import webbrowser
+        webbrowser.open(server.url)
+
+    return server
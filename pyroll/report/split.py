@@ -0,0 +1,99 @@
+import contextlib
+import functools
+import logging
+import os
+from pathlib import Path
+from typing import Union, Optional, List
+
+from pyroll.core import PassSequence
+from .assets import AssetDirectory
+from .memo import table_memo
+from .parallel import _fork_context, _sequences, _tokens
+from .pluggy import plugin_manager
+from .profiling import slow_property_summary
+from .report import _render_page, _render_unit_page
+from .sequence_data import sequence_data_cache
+from .unit_display.units import unit_links
+
+log = logging.getLogger(__name__)
+
+INDEX_FILE = "index.html"
+
+ASSET_DIR = "assets"
+"""Name of the subdirectory the SVG files are written to."""
+
+
+def _unit_files(count: int) -> List[str]:
+    width = len(str(count - 1)) if count else 1
+    return [f"unit_{i:0{width}d}.html" for i in range(count)]
+
+
+def _write(file: Path, html: str) -> int:
+    with file.open("w", encoding="utf-8") as f:
+        return f.write(html)
+
+
+def _write_unit_page(sequence: PassSequence, out_dir: Path, files: List[str], index: int) -> int:
+    with AssetDirectory(out_dir / ASSET_DIR, ASSET_DIR + "/"):
+        html = _render_unit_page(sequence.units, index, files.__getitem__, INDEX_FILE)
+
+    return _write(out_dir / files[index], html)
+
+
+def _write_unit_page_in_worker(token: int, out_dir: Path, files: List[str], index: int) -> int:
+    with sequence_data_cache(), table_memo():
+        return _write_unit_page(_sequences[token], out_dir, files, index)
+
+
+def report_to_directory(
+        pass_sequence: PassSequence, out_dir: Union[str, os.PathLike], workers: Optional[int] = None,
+) -> Path:
+    """
+    Render an HTML report from the specified pass sequence split into several files,
+    for sequences too large to be viewed as one page.
+    The directory gets an index page with the display of the sequence itself and links to its units,
+    one page per unit and a subdirectory ``assets`` with the plots and geometry thumbnails as SVG files,
+    which are referenced by the pages instead of being inlined.
+
+    :param pass_sequence: PassSequence instance to take the data from
+    :param out_dir: directory to write the files to, is created if not existing
+    :param workers: number of worker processes to render and write the unit pages in parallel,
+        the default is to render serially
+    :returns: the path to the index page
+    """
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    files = _unit_files(len(pass_sequence.units))
+
+    with contextlib.ExitStack() as stack:
+        stack.enter_context(slow_property_summary())
+        stack.enter_context(sequence_data_cache())
+        stack.enter_context(table_memo())
+
+        with AssetDirectory(out_dir / ASSET_DIR, ASSET_DIR + "/"), unit_links(pass_sequence, files.__getitem__):
+            index = _render_page(plugin_manager.hook.unit_display(unit=pass_sequence, level=1))
+
+        _write(out_dir / INDEX_FILE, index)
+
+        mp_context = _fork_context() if workers is not None and workers >= 2 else None
+
+        if mp_context is None:
+            sizes = [_write_unit_page(pass_sequence, out_dir, files, i) for i in range(len(files))]
+
+        else:
+            from concurrent.futures import ProcessPoolExecutor
+
+            token = next(_tokens)
+            _sequences[token] = pass_sequence
+
+            try:
+                with ProcessPoolExecutor(workers, mp_context=mp_context) as executor:
+                    sizes = list(executor.map(
+                        functools.partial(_write_unit_page_in_worker, token, out_dir, files), range(len(files))
+                    ))
+            finally:
+                del _sequences[token]
+
+    log.info(f"Wrote {len(files) + 1} pages with {sum(sizes) + len(index)} characters to: {out_dir}")
+
+    return out_dir / INDEX_FILE
@@ -0,0 +1,26 @@
+import functools
+from pathlib import Path
+from typing import Union
+
+from .utils import iter_chunks
+
+
+@functools.lru_cache(maxsize=None)
+def environment(directory: Path):
+    """
+    Get the Jinja environment loading templates from the given directory.
+    Jinja is imported and the environment is created only on first use, so that importing the package stays cheap.
+    Templates are compiled on first use and cached by the environment afterwards.
+    """
+    import jinja2
+
+    env = jinja2.Environment(
+        loader=jinja2.FileSystemLoader(directory, encoding="utf-8")
+    )
+    env.filters["chunks"] = iter_chunks
+    return env
+
+
+def get_template(directory: Union[str, Path], name: str):
+    """Get the template of the given name from the given directory, compiling it on first use."""
+    return environment(Path(directory)).get_template(name)
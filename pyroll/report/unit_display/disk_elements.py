@@ -0,0 +1,231 @@
+import functools
+import logging
+import numbers
+import warnings
+from operator import attrgetter
+from pathlib import Path
+from typing import Sequence, List, Dict
+
+import numpy as np
+
+from pyroll.core import Unit
+from pyroll.report.templates import get_template
+from .properties import format_property, format_array, DoNotPrint
+
+_TEMPLATE_DIR = Path(__file__).parent
+
+log = logging.getLogger(__name__)
+
+
+def select_disk_elements(count: int, selection: str) -> List[int]:
+    """
+    Get the indices of the disk elements to print according to a selection specification.
+
+    :param count: the number of disk elements
+    :param selection: ``"all"``, ``"none"``, ``"every:N"`` for every N-th element starting with the first,
+        or a comma separated list of ``first``, ``middle``, ``last`` and relative positions between 0 and 1,
+        like ``"first,0.25,middle,last"``
+    :raises ValueError: if the specification is invalid
+    """
+    spec = selection.strip().lower()
+
+    if spec == "all":
+        return list(range(count))
+
+    if spec == "none" or count == 0:
+        return []
+
+    if spec.startswith("every:"):
+        try:
+            step = int(spec[len("every:"):])
+        except ValueError:
+            raise ValueError(f"Step of disk element selection must be an integer, got '{selection}'.") from None
+        if step < 1:
+            raise ValueError(f"Step of disk element selection must be positive, got {step}.")
+        return list(range(0, count, step))
+
+    indices = set()
+    for token in spec.split(","):
+        token = token.strip()
+
+        if token == "first":
+            indices.add(0)
+        elif token == "middle":
+            indices.add((count - 1) // 2)
+        elif token == "last":
+            indices.add(count - 1)
+        else:
+            try:
+                position = float(token)
+            except ValueError:
+                raise ValueError(
+                    f"Unknown disk element selection '{token}', "
+                    f"expected 'all', 'none', 'every:N', 'first', 'middle', 'last' or a relative position."
+                ) from None
+            if not 0 <= position <= 1:
+                raise ValueError(f"Relative disk element positions must be between 0 and 1, got {position}.")
+            indices.add(round(position * (count - 1)))
+
+    return sorted(indices)
+
+
+def validate_disk_element_selection(selection: str) -> str:
+    """
+    Check a selection specification of disk elements (see :py:func:`select_disk_elements`).
+
+    :returns: the unchanged specification
+    :raises ValueError: if the specification is invalid
+    """
+    select_disk_elements(1, selection)
+    return selection
+
+
+def select_disk_elements_or_all(count: int, selection: str) -> List[int]:
+    """
+    Like :py:func:`select_disk_elements`, but an invalid specification is logged once and all disk elements are
+    selected, as errors raised while formatting would silently drop the whole disk elements display.
+    """
+    try:
+        return select_disk_elements(count, selection)
+    except ValueError as e:
+        _log_invalid_selection(selection, str(e))
+        return list(range(count))
+
+
+@functools.lru_cache(maxsize=None)
+def _log_invalid_selection(selection: str, message: str):
+    log.error(f"Invalid DISK_ELEMENT_SELECTION '{selection}', printing all disk elements instead: {message}")
+
+
+def _is_number(value: object):
+    return isinstance(value, numbers.Real) and not isinstance(value, (bool, np.bool_))
+
+
+def disk_element_columns(disk_elements: Sequence[Unit]) -> Dict[str, np.ndarray]:
+    """
+    Gather the numeric scalar properties of disk elements and of their outgoing profiles in one traversal.
+    The names of profile properties are prefixed by ``out_profile.``.
+
+    :returns: a dict of property names to float arrays holding the value per disk element,
+        only properties numeric in all disk elements are included
+    """
+    values: Dict[str, List[float]] = {}
+    excluded = set()
+
+    for i, de in enumerate(disk_elements):
+        attrs = dict(de.__attrs__)
+        attrs.update((f"out_profile.{n}", v) for n, v in de.out_profile.__attrs__.items())
+
+        for n, v in attrs.items():
+            if n in excluded:
+                continue
+
+            if not _is_number(v) or (i > 0 and n not in values):
+                excluded.add(n)
+                values.pop(n, None)
+                continue
+
+            values.setdefault(n, []).append(v)
+
+    return {n: np.array(v, dtype=float) for n, v in values.items() if len(v) == len(disk_elements)}
+
+
+def gather_disk_element_values(disk_elements: Sequence[Unit], attributes: Sequence[str]) -> Dict[str, np.ndarray]:
+    """
+    Gather the values of the given attributes of disk elements in one traversal.
+
+    :param disk_elements: the disk elements to take the values from
+    :param attributes: the attributes to gather given as dotted paths, like ``"out_profile.temperature"``
+    :returns: a dict of attribute paths to float arrays holding the value per disk element,
+        attributes not available or not numeric in any disk element are omitted
+    """
+    getters = {a: attrgetter(a) for a in attributes}
+    values: Dict[str, List[float]] = {a: [] for a in attributes}
+
+    for de in disk_elements:
+        for a, getter in list(getters.items()):
+            try:
+                v = getter(de)
+            except (AttributeError, TypeError, ValueError):
+                v = None
+
+            if not _is_number(v):
+                del getters[a]
+                del values[a]
+                continue
+
+            values[a].append(v)
+
+    return {a: np.array(v, dtype=float) for a, v in values.items()}
+
+
+def _format_statistics(name: str, statistics: np.ndarray, owner: object) -> List[str]:
+    short_name = name.rsplit(".", 1)[-1]
+    formatted = format_array(short_name, statistics, float, owner)
+
+    if formatted is None:
+        formatted = [format_property(short_name, float(v), owner) for v in statistics]
+
+    return list(formatted)
+
+
+_PROFILE_PREFIX = "out_profile."
+
+
+def disk_element_statistics(disk_elements: Sequence[Unit]) -> Dict[str, np.ndarray]:
+    """
+    Compute minimum, maximum, mean, entry and exit values of the numeric properties of disk elements
+    (see :py:func:`disk_element_columns`) vectorized over all elements.
+    The entry values of profile properties are taken from the incoming profile of the first disk element,
+    those of the other properties from the first disk element itself.
+
+    :returns: a dict of property names to arrays of the five values
+    """
+    columns = disk_element_columns(disk_elements)
+
+    if not columns:
+        return {}
+
+    names = list(columns)
+    table = np.stack([columns[n] for n in names])
+
+    in_profile = dict(disk_elements[0].in_profile.__attrs__)
+    entry = np.array([
+        _entry_value(in_profile.get(n[len(_PROFILE_PREFIX):])) if n.startswith(_PROFILE_PREFIX) else table[i, 0]
+        for i, n in enumerate(names)
+    ], dtype=float)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)  # all-NaN rows
+        statistics = np.column_stack([
+            np.nanmin(table, axis=1), np.nanmax(table, axis=1), np.nanmean(table, axis=1), entry, table[:, -1],
+        ])
+
+    return dict(zip(names, statistics))
+
+
+def _entry_value(value: object) -> float:
+    return float(value) if _is_number(value) else np.nan
+
+
+def render_disk_element_statistics(disk_elements: Sequence[Unit]) -> str:
+    """Render a table of minimum, maximum, mean, entry and exit values of the numeric properties of disk elements
+    (see :py:func:`disk_element_statistics`)."""
+    statistics = disk_element_statistics(disk_elements)
+
+    if not statistics:
+        return ""
+
+    # profile properties are formatted as in the tables of the profiles
+    de = disk_elements[0]
+
+    rows = []
+    for name, row in statistics.items():
+        owner = de.out_profile if name.startswith(_PROFILE_PREFIX) else de
+
+        try:
+            rows.append((name.replace("_", " ").replace(".", " "), _format_statistics(name, row, owner)))
+        except DoNotPrint:
+            continue
+
+    return get_template(_TEMPLATE_DIR, "disk_element_statistics.html").render(statistics=rows)
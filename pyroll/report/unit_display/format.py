@@ -1,3 +1,5 @@
+import base64
+import gzip
 import html
 from typing import Sequence, Collection
 
@@ -5,11 +7,14 @@ import numpy as np
 
 from pyroll.core.repr import ReprMixin
 from pyroll.report.pluggy import hookimpl, plugin_manager
-from .properties import render_properties_table, DoNotPrint
+from .properties import render_properties_table, DoNotPrint, value_types, vectorized, format_property, format_array
 import shapely.geometry
 
 from ..config import Config
-from ..utils import plot_shapely_geom
+from .disk_elements import select_disk_elements_or_all, render_disk_element_statistics
+from ..assets import embed_svg
+from ..budget import account, degradation_level
+from ..utils import plot_shapely_geom, iter_chunks
 
 
 def _is_float_like(value: object):
@@ -17,18 +22,71 @@ def _is_float_like(value: object):
             isinstance(value, np.ndarray) and np.isscalar(value) and np.issubdtype(value.dtype, np.floating))
 
 
+def _positional_array(values: np.ndarray, precision: int) -> np.ndarray:
+    """Vectorized equivalent of ``np.format_float_positional(value, trim='0', precision=precision)``."""
+    result = np.char.mod(f"%#.{precision}f", values)
+    result = np.char.rstrip(result, "0")
+    result = np.where(np.char.endswith(result, "."), np.char.add(result, "0"), result).astype(object)
+
+    # the shortest representation printed by numpy differs from the fixed one beyond 15 significant digits
+    with np.errstate(invalid="ignore"):
+        inexact = ~(np.abs(values) < 10.0 ** (15 - precision))
+    result[inexact] = [np.format_float_positional(v, trim="0", precision=precision) for v in values[inexact]]
+
+    return result
+
+
+def _default_format_array(value: np.ndarray):
+    return np.array([html.escape(str(v)) for v in value], dtype=object)
+
+
 @hookimpl(specname="property_format", trylast=True)
+@vectorized(_default_format_array)
 def default_format(value: object):
     return html.escape(str(value))
 
 
+def _int_format_array(value: np.ndarray):
+    if value.dtype.kind in "iu":
+        return np.char.mod("%d", value).astype(object)
+
+
 @hookimpl(specname="property_format")
+@value_types(int)
+@vectorized(_int_format_array)
 def int_format(value: object):
     if isinstance(value, int) and not isinstance(value, bool):
         return "{:d}".format(value)
 
 
+def _float_format_array(value: np.ndarray):
+    if value.dtype.kind != "f":
+        return None
+
+    result = np.full(len(value), None, dtype=object)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        order = np.log10(np.abs(value)) // 3
+
+    nonzero = ~np.isclose(value, 0)
+    finite = nonzero & np.isfinite(order)
+    infinite = nonzero & ~np.isfinite(order)
+
+    exps, inverse = np.unique((order[finite] * 3).astype(int), return_inverse=True)
+    # use Python powers of ten to get the same mantissa values as float_format
+    mantissas = value[finite] / np.array([10 ** int(e) for e in exps], dtype=float)[inverse]
+    result[finite] = (
+            _positional_array(mantissas, Config.FLOAT_PRECISION)
+            + np.char.mod("e%+03d", exps[inverse]).astype(object)
+    )
+    result[infinite] = [np.format_float_positional(v) for v in value[infinite]]
+
+    return result
+
+
 @hookimpl(specname="property_format")
+@value_types(float, np.ndarray)
+@vectorized(_float_format_array)
 def float_format(value: object):
     if _is_float_like(value):
         if np.isclose(value, 0):
@@ -43,15 +101,62 @@ def float_format(value: object):
 
 
 @hookimpl(specname="property_format")
+@value_types(Collection)
 def collection_format(name: str, value: object, owner: object):
     if (
             isinstance(value, Collection)
             and not isinstance(value, str)
     ):
-        return ", ".join([plugin_manager.hook.property_format(name=name, value=e, owner=owner) for e in value])
+        edgeitems = max(Config.ARRAY_EDGEITEMS, 0)
+        # degraded units summarize all arrays, which are not shortened by that
+        threshold = Config.ARRAY_THRESHOLD if degradation_level() < 1 else 2 * edgeitems + 1
+
+        if len(value) > threshold:
+            items = value if isinstance(value, (Sequence, np.ndarray)) else list(value)
+            result = ", ".join(
+                [
+                    *_format_elements(name, items[:edgeitems], owner),
+                    "...",
+                    *_format_elements(name, items[len(items) - edgeitems:], owner),
+                ]
+            )
+        else:
+            result = ", ".join(_format_elements(name, value, owner))
+
+        account("arrays", len(result))
+        return result
+
+
+def _numeric_array(elements: Collection):
+    """Get elements of homogeneous numeric type as 1-D array together with the type of the single elements."""
+    if isinstance(elements, np.ndarray):
+        if elements.ndim == 1 and len(elements) > 0 and elements.dtype.kind in "iuf":
+            return elements, type(elements[0])
+        return None
+
+    if isinstance(elements, (list, tuple)) and len(elements) > 0:
+        element_type = type(elements[0])
+        if element_type in (int, float) and all(type(e) is element_type for e in elements):
+            array = np.asarray(elements)
+            if array.dtype.kind in "iuf":
+                return array, element_type
+
+    return None
+
+
+def _format_elements(name: str, elements: Collection, owner: object):
+    numeric = _numeric_array(elements)
+
+    if numeric is not None:
+        formatted = format_array(name, *numeric, owner)
+        if formatted is not None:
+            return list(formatted)
+
+    return [format_property(name=name, value=e, owner=owner) for e in elements]
 
 
 @hookimpl(specname="property_format")
+@value_types(ReprMixin)
 def repr_mixin_format(value: object):
     if isinstance(value, ReprMixin):
         return f"""
@@ -64,17 +169,39 @@ def repr_mixin_format(value: object):
         """
 
 
+_PLOTTED_GEOMS = (
+    shapely.geometry.Polygon, shapely.geometry.LineString, shapely.geometry.MultiLineString,
+    shapely.geometry.MultiPolygon
+)
+
+
+_SIMPLIFICATION_TOLERANCE = 0.01
+"""Tolerance of the simplification of geometry thumbnails of degraded units relative to the geometry extent."""
+
+
+def _geometry_thumbnail(geom: shapely.Geometry) -> str:
+    if degradation_level() >= 1:
+        minx, miny, maxx, maxy = geom.bounds
+        geom = geom.simplify(_SIMPLIFICATION_TOLERANCE * max(maxx - minx, maxy - miny))
+
+    return embed_svg(plot_shapely_geom(geom), width="100%")
+
+
 # noinspection PyTypeChecker
 @hookimpl(specname="property_format")
+@value_types(*_PLOTTED_GEOMS)
 def shapely_format(value: object):
-    if isinstance(value, (shapely.geometry.Polygon, shapely.geometry.LineString, shapely.geometry.MultiLineString, shapely.geometry.MultiPolygon)):
-        if Config.PLOT_GEOMS:
+    if isinstance(value, _PLOTTED_GEOMS):
+        if Config.PLOT_GEOMS and degradation_level() < 2:
+            thumbnail = _geometry_thumbnail(value)
+            account("geometry thumbnails", len(thumbnail))
+
             return f"""
             <details open>
                 <summary>{str(value)}</summary>
                 <div class="row align-items-center">
                     <div class="col-4">
-                        {plot_shapely_geom(value)}
+                        {thumbnail}
                     </div>
                     <div class="col-8">
                         {render_properties_table(value)}
@@ -94,18 +221,28 @@ def shapely_format(value: object):
 
 
 @hookimpl(specname="property_format")
+@value_types(Sequence)
 def disk_elements_format(name: str, value: object):
     if isinstance(value, Sequence) and name == "disk_elements":
-        if not Config.PRINT_DISK_ELEMENTS:
+        if not (Config.PRINT_DISK_ELEMENTS or Config.DISK_ELEMENT_STATISTICS):
             raise DoNotPrint()
 
-        displays = "\n".join(
-            [
-                d
-                for u in value
-                for d in plugin_manager.hook.unit_display(unit=u, level=6)
-            ]
-        )
+        displays = []
+
+        if Config.DISK_ELEMENT_STATISTICS:
+            displays.append(render_disk_element_statistics(value))
+
+        level = degradation_level()
+
+        if Config.PRINT_DISK_ELEMENTS and level < 3:
+            display = _lazy_disk_element_display if Config.LAZY_DISK_ELEMENTS else _disk_element_display
+            selection = Config.DISK_ELEMENT_SELECTION if level < 2 else "first,middle,last"
+            displays.extend(
+                display(value[i]) for i in select_disk_elements_or_all(len(value), selection)
+            )
+
+        displays = "\n".join(d for d in displays if d)
+        account("disk elements", len(displays))
 
         if displays:
             return f"""
@@ -118,3 +255,22 @@ def disk_elements_format(name: str, value: object):
             """
 
         raise DoNotPrint()
+
+
+def _disk_element_display(unit: object):
+    return "\n".join(
+        "".join(iter_chunks(d))
+        for d in plugin_manager.hook.unit_display(unit=unit, level=6)
+    )
+
+
+def _lazy_disk_element_display(unit: object):
+    # the HTML is stored compressed and inserted by a script in main.html when the details are expanded
+    content = base64.b64encode(gzip.compress(_disk_element_display(unit).encode("utf-8"), mtime=0)).decode("ascii")
+
+    return f"""
+            <details class="ms-3" data-content="{content}">
+                <summary>{html.escape(str(unit))}</summary>
+                <div></div>
+            </details>
+            """
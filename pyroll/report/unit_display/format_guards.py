@@ -1,9 +1,11 @@
 from typing import Collection
 
+import numpy as np
+
 from shapely import Geometry
 
 from ..pluggy import hookimpl
-from .properties import DoNotPrint
+from .properties import DoNotPrint, value_types
 
 
 @hookimpl(specname="property_format")
@@ -57,7 +59,11 @@ def do_not_print_roll_surface(name: str):
 
 
 @hookimpl(specname="property_format")
+@value_types(Collection)
 def do_not_print_geom_sequences(name: str, value: object):
+    if isinstance(value, np.ndarray) and value.dtype != object:
+        return
+
     if isinstance(value, Collection) and not isinstance(value, str):
         for e in value:
             if isinstance(e, Geometry):
@@ -2,34 +2,71 @@ import numpy as np
 
 from pyroll.report import hookimpl
 from ..config import Config
-from .format import _is_float_like
+from .format import _is_float_like, _positional_array
+from .properties import value_types, vectorized
+
+
+def _temperature_format_array(name: str, value: np.ndarray):
+    if "temperature" in name:
+        return _positional_array(value, Config.TEMPERATURE_PRECISION)
 
 
 @hookimpl(specname="property_format")
+@value_types(float, np.ndarray)
+@vectorized(_temperature_format_array)
 def temperature_format(name: str, value: object):
     if _is_float_like(value) and "temperature" in name:
         return np.format_float_positional(value, precision=Config.TEMPERATURE_PRECISION, trim="0")
 
 
+def _ratio_format_array(name: str, value: np.ndarray):
+    if "ratio" in name:
+        return _positional_array(value, Config.RATIO_PRECISION)
+
+
 @hookimpl(specname="property_format")
+@value_types(float, np.ndarray)
+@vectorized(_ratio_format_array)
 def ratio_format(name: str, value: object):
     if _is_float_like(value) and "ratio" in name:
         return np.format_float_positional(value, precision=Config.RATIO_PRECISION, trim="0")
 
 
-@hookimpl(specname="property_format")
-def strain_format(name: str, value: object):
-    if _is_float_like(value) and (
+def _is_strain_like(name: str):
+    return (
             "strain" in name
             or "elongation" in name
             or "draught" in name
             or "spread" in name
             or "efficiency" in name
-    ):
+    )
+
+
+def _strain_format_array(name: str, value: np.ndarray):
+    if _is_strain_like(name):
+        return _positional_array(value, Config.STRAIN_PRECISION)
+
+
+@hookimpl(specname="property_format")
+@value_types(float, np.ndarray)
+@vectorized(_strain_format_array)
+def strain_format(name: str, value: object):
+    if _is_float_like(value) and _is_strain_like(name):
         return np.format_float_positional(value, precision=Config.STRAIN_PRECISION, trim="0")
 
 
+def _is_angle_like(name: str):
+    return ("angle" in name or "alpha" in name) and "relative" not in name
+
+
+def _angle_format_array(name: str, value: np.ndarray):
+    if _is_angle_like(name):
+        return _positional_array(np.rad2deg(value), Config.ANGLE_PRECISION)
+
+
 @hookimpl(specname="property_format")
+@value_types(float, np.ndarray)
+@vectorized(_angle_format_array)
 def angle_format(name: str, value: object):
-    if _is_float_like(value) and (("angle" in name or "alpha" in name)) and "relative" not in name:
+    if _is_float_like(value) and _is_angle_like(name):
         return np.format_float_positional(np.rad2deg(value), precision=Config.ANGLE_PRECISION, trim="0")
@@ -1,50 +1,88 @@
+import importlib.metadata
 from pathlib import Path
+from typing import Union, TYPE_CHECKING
 
-import jinja2
 import numpy as np
-from matplotlib import pyplot as plt
-from matplotlib.figure import Figure
 
+import pyroll.core
 from pyroll.core import Unit, PassSequence, BaseRollPass
 from .. import utils
+from ..assets import embed_svg
+from ..budget import account, degradation_level
+from ..config import Config, config_values
+from ..fingerprint import fingerprint, module_version
+from ..plot_cache import plot_cache
+from ..sequence_data import sequence_data
+from .disk_elements import gather_disk_element_values
 from pyroll.report.pluggy import hookimpl, plugin_manager
+from pyroll.report.templates import get_template
 
-_env = jinja2.Environment(
-    loader=jinja2.FileSystemLoader(Path(__file__).parent, encoding="utf-8")
-)
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+    from matplotlib.figure import Figure
 
-_template = _env.get_template("plots.html")
+_TEMPLATE_DIR = Path(__file__).parent
+
+
+def _to_svg(plot: Union["Figure", str]):
+    return plot if isinstance(plot, str) else utils.get_svg_from_figure(plot)
+
+
+def _cached_unit_plots(unit: Unit):
+    impls = plugin_manager.hook.unit_plot.get_hookimpls()
+
+    if any(impl.hookwrapper or getattr(impl, "wrapper", False) for impl in impls):
+        # wrappers need the full hook call
+        return [_to_svg(p) for p in plugin_manager.hook.unit_plot(unit=unit)]
+
+    unit_fingerprint = fingerprint(
+        unit, config_values(), pyroll.core.VERSION, importlib.metadata.version("matplotlib")
+    )
+
+    plots = []
+    for impl in reversed(impls):
+        key = fingerprint(
+            unit_fingerprint, impl.plugin_name, impl.function.__module__, impl.function.__qualname__,
+            module_version(impl.function.__module__),
+        )
+        svg = plot_cache.get(key)
+
+        if svg is None:
+            p = impl.function(*[unit for _ in impl.argnames])
+            svg = _to_svg(p) if p is not None else ""  # an empty entry marks that the hook gave no plot
+            plot_cache.put(key, svg)
+
+        if svg:
+            plots.append(svg)
+
+    return plots
 
 
 @hookimpl(specname="unit_display")
 def unit_plots_display(unit: Unit):
-    plots = [
-        utils.get_svg_from_figure(p) if isinstance(p, Figure) else p
-        for p in plugin_manager.hook.unit_plot(unit=unit)
-    ]
+    if degradation_level() >= 3:
+        return None
+
+    if Config.PLOT_CACHE:
+        plots = _cached_unit_plots(unit)
+    else:
+        plots = [_to_svg(p) for p in plugin_manager.hook.unit_plot(unit=unit)]
 
-    return _template.render(plots=plots)
+    display = get_template(_TEMPLATE_DIR, "plots.html").render(plots=[embed_svg(p) for p in plots])
+    account("plots", len(display))
+    return display
 
 
 @hookimpl(specname="unit_plot")
 def roll_forces_plot(unit: Unit):
     if isinstance(unit, PassSequence):
-        if any(isinstance(subunit, BaseRollPass) for subunit in unit):
-            units = unit.roll_passes
-            fig, ax = utils.create_sequence_plot(units)
+        data = sequence_data(unit)
+        if data.roll_passes:
+            fig, ax = utils.create_sequence_plot(data.roll_pass_labels)
             ax.set_ylabel(r"roll force $F$")
             ax.set_title("Roll Forces")
 
-            if len(units) > 0:
-                indices, forces = np.transpose(
-                    [
-                        (index, unit.roll_force)
-                        for index, unit in enumerate(units)
-                        if isinstance(unit, BaseRollPass)
-                    ]
-                )
-
-                ax.bar(x=indices, height=forces, width=0.8)
+            utils.plot_sequence_bars(ax, data.roll_forces)
 
             return fig
 
@@ -52,24 +90,13 @@ def roll_forces_plot(unit: Unit):
 @hookimpl(specname="unit_plot")
 def roll_torques_plot(unit: Unit):
     if isinstance(unit, PassSequence):
-        if any(isinstance(subunit, BaseRollPass) for subunit in unit):
-            units = unit.roll_passes
-
-            fig, ax = utils.create_sequence_plot(units)
+        data = sequence_data(unit)
+        if data.roll_passes:
+            fig, ax = utils.create_sequence_plot(data.roll_pass_labels)
             ax.set_ylabel(r"roll torque $M$")
             ax.set_title("Roll Torques")
 
-            units = list(unit.roll_passes)
-            if len(units) > 0:
-                x, y = np.transpose(
-                    [
-                        (index, unit.roll.roll_torque)
-                        for index, unit in enumerate(units)
-                        if isinstance(unit, BaseRollPass)
-                    ]
-                )
-
-            ax.bar(x=x, height=y, width=0.8)
+            utils.plot_sequence_bars(ax, data.roll_torques)
 
             return fig
 
@@ -77,22 +104,13 @@ def roll_torques_plot(unit: Unit):
 @hookimpl(specname="unit_plot")
 def engine_power_plot(unit: Unit):
     if isinstance(unit, PassSequence):
-        if any(isinstance(subunit, BaseRollPass) for subunit in unit):
-            units = unit.roll_passes
-            fig, ax = utils.create_sequence_plot(units)
+        data = sequence_data(unit)
+        if data.roll_passes:
+            fig, ax = utils.create_sequence_plot(data.roll_pass_labels)
             ax.set_ylabel(r"engine power $P_\mathrm{E}$")
             ax.set_title("Engine Power")
 
-            if len(units) > 0:
-                x2, y2 = np.transpose(
-                    [
-                        (index, unit.engine.power)
-                        for index, unit in enumerate(units)
-                        if isinstance(unit, BaseRollPass)
-                    ]
-                )
-
-            ax.bar(x=x2, height=y2, width=0.8)
+            utils.plot_sequence_bars(ax, data.engine_powers)
 
             return fig
 
@@ -100,22 +118,14 @@ def engine_power_plot(unit: Unit):
 @hookimpl(specname="unit_plot")
 def strains_plot(unit: Unit):
     if isinstance(unit, PassSequence):
-        fig, ax = utils.create_sequence_plot(unit)
+        data = sequence_data(unit)
+        fig, ax = utils.create_sequence_plot(data.labels)
         ax.set_ylabel(r"strain $\varphi_\mathrm{V}$")
         ax.set_title("Mean Equivalent Strains")
 
-        units = list(unit)
-        if len(units) > 0:
-            def gen_seq():
-                yield -0.5, units[0].in_profile.strain
-                for i, u in enumerate(units):
-                    yield i + 0.5, u.out_profile.strain
-
-            x, y = np.transpose(
-                list(gen_seq())
-            )
-
-            ax.plot(x, y, marker="x")
+        if data.units:
+            y = data.strains_in_out
+            ax.plot(np.arange(len(y)) - 0.5, y, marker=utils.sequence_marker(len(data.units)))
 
             return fig
 
@@ -123,67 +133,83 @@ def strains_plot(unit: Unit):
 @hookimpl(specname="unit_plot")
 def filling_ratios_plot(unit: Unit):
     if isinstance(unit, PassSequence):
-        if any(isinstance(subunit, BaseRollPass) for subunit in unit):
-            units = unit.roll_passes
-            fig, ax = utils.create_sequence_plot(units)
+        data = sequence_data(unit)
+        if data.roll_passes:
+            fig, ax = utils.create_sequence_plot(data.roll_pass_labels)
             ax.set_ylabel("Filling Ratio")
-            ax2: plt.Axes = ax.twinx()
+            ax2: "Axes" = ax.twinx()
             ax2.set_ylabel("Filling Error")
 
             ax.set_title("Filling Ratios and Errors")
 
-            if len(units) > 0:
-                x, fr, csfr, fe, cse, tfr, tcsfr = np.transpose(
-                    [
-                        (
-                            index,
-                            unit.out_profile.filling_ratio,
-                            unit.out_profile.cross_section_filling_ratio,
-                            unit.out_profile.filling_error,
-                            unit.out_profile.cross_section_error,
-                            unit.target_filling_ratio,
-                            unit.target_cross_section_filling_ratio,
-                        )
-                        for index, unit in enumerate(units)
-                        if isinstance(unit, BaseRollPass)
-                    ]
-                )
-
-                ax.plot(x, fr, label="Width Filling Ratio", c="C0")
-                ax.plot(x, csfr, label="Cross-Section Filling Ratio", c="C1")
-                ax.plot(x, tfr, label="Target", c="C0", ls="--")
-                ax.plot(x, tcsfr, label="Target", c="C1", ls="--")
-                ax2.plot(x, fe, label="Width Filling Error", c="C0", ls=":")
-                ax2.plot(x, cse, label="Cross-Section Error", c="C1", ls=":")
-
-                ax.legend(loc="lower left", ncols=2)
-                ax2.legend(loc="lower right")
-
-                return fig
+            x = np.arange(len(data.roll_passes))
+            c = data.filling_ratios
+
+            ax.plot(x, c["filling_ratio"], label="Width Filling Ratio", c="C0")
+            ax.plot(x, c["cross_section_filling_ratio"], label="Cross-Section Filling Ratio", c="C1")
+            ax.plot(x, c["target_filling_ratio"], label="Target", c="C0", ls="--")
+            ax.plot(x, c["target_cross_section_filling_ratio"], label="Target", c="C1", ls="--")
+            ax2.plot(x, c["filling_error"], label="Width Filling Error", c="C0", ls=":")
+            ax2.plot(x, c["cross_section_error"], label="Cross-Section Error", c="C1", ls=":")
+
+            ax.legend(loc="lower left", ncols=2)
+            ax2.legend(loc="lower right")
+
+            return fig
 
 
 @hookimpl(specname="unit_plot")
 def cross_sections_plot(unit: Unit):
     if isinstance(unit, PassSequence):
-        if any(isinstance(subunit, BaseRollPass) for subunit in unit):
-            units = unit.roll_passes
-            fig, ax = utils.create_sequence_plot(units)
+        data = sequence_data(unit)
+        if data.roll_passes:
+            fig, ax = utils.create_sequence_plot(data.roll_pass_labels)
             ax.set_ylabel(r"cross section $A_\mathrm{p}$")
             ax.set_title("Profile Cross-Sections")
 
-            if len(units) > 0:
-                def gen_seq():
-                    yield -0.5, units[0].in_profile.cross_section.area
-                    for i, u in enumerate(units):
-                        yield i + 0.5, u.out_profile.cross_section.area
+            y = data.roll_pass_areas_in_out
+            ax.plot(np.arange(len(y)) - 0.5, y, marker=utils.sequence_marker(len(data.roll_passes)))
 
-                x, y = np.transpose(
-                    list(gen_seq())
-                )
+            return fig
 
-                ax.plot(x, y, marker="x")
 
-                return fig
+_DISK_ELEMENT_QUANTITIES = [
+    ("out_profile.temperature", r"temperature $T$"),
+    ("out_profile.strain", r"strain $\varphi$"),
+    ("strain_rate", r"strain rate $\dot{\varphi}$"),
+    ("out_profile.flow_stress", r"flow stress $k_\mathrm{f}$"),
+]
+"""Disk element attributes plotted by :py:func:`disk_elements_plot` and their axis labels."""
+
+
+@hookimpl(specname="unit_plot")
+def disk_elements_plot(unit: Unit):
+    """Plot the evolution of the disk element properties along the roll gap"""
+
+    if isinstance(unit, BaseRollPass) and len(unit.disk_elements) > 0:
+        from matplotlib.figure import Figure
+
+        columns = gather_disk_element_values(
+            unit.disk_elements, ["out_profile.x"] + [a for a, _ in _DISK_ELEMENT_QUANTITIES]
+        )
+        x = columns.pop("out_profile.x", None)
+        quantities = [(columns[a], label) for a, label in _DISK_ELEMENT_QUANTITIES if a in columns]
+
+        if x is None or not quantities:
+            return None
+
+        fig = Figure(constrained_layout=True, figsize=(4, 1.2 * len(quantities) + 0.8))
+        axes = fig.subplots(nrows=len(quantities), sharex=True, squeeze=False)[:, 0]
+        axes[0].set_title("Disk Elements")
+
+        for ax, (y, label) in zip(axes, quantities):
+            ax.plot(x, y, marker=utils.sequence_marker(len(x)))
+            ax.set_ylabel(label)
+            ax.grid(lw=0.5)
+
+        axes[-1].set_xlabel(r"position in roll gap $x$")
+
+        return fig
 
 
 @hookimpl(specname="unit_plot")
@@ -191,9 +217,11 @@ def roll_pass_plot(unit):
     """Plot roll pass contour and its profiles"""
 
     if isinstance(unit, BaseRollPass):
-        fig: plt.Figure = plt.figure(constrained_layout=True, figsize=(4, 4))
-        ax: plt.Axes
-        axl: plt.Axes
+        from matplotlib.figure import Figure
+
+        fig = Figure(constrained_layout=True, figsize=(4, 4))
+        ax: "Axes"
+        axl: "Axes"
         ax, axl = fig.subplots(nrows=2, height_ratios=[1, 0.3])
         ax.set_title("In- and Outcoming Profiles")
 
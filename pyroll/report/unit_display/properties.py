@@ -1,40 +1,338 @@
+import time
+from collections import OrderedDict
+from contextvars import ContextVar
+from html import escape
 from pathlib import Path
+from typing import Dict, Tuple, Optional, Sequence, Set
 
-import jinja2
+import numpy as np
+from pluggy import HookImpl
 
 from pyroll.core import Unit
 from pyroll.core.repr import ReprMixin
 from pyroll.report.pluggy import hookimpl, plugin_manager
+from pyroll.report.templates import get_template
+from pyroll.report.export import PropertyExport, active_export, relocate_owner
+from pyroll.report.config import Config, config_values
+from pyroll.report.profiling import record_slow_property
+from pyroll.report.budget import account, degradation_level
+from pyroll.report.memo import active_table_memo, TABLE_MEMO_SIZE
 
-_env = jinja2.Environment(
-    loader=jinja2.FileSystemLoader(Path(__file__).parent, encoding="utf-8")
-)
+_TEMPLATE_DIR = Path(__file__).parent
 
 
 class DoNotPrint(Exception):
     pass
 
 
-def try_format_property(name: str, value: object, owner: object):
+def value_types(*types: type):
+    """
+    Decorator declaring the types of values a ``property_format`` hook implementation is able to format.
+    The implementation is skipped for values of other types without being called.
+    """
+
+    def dec(func):
+        func.value_types = types
+        return func
+
+    return dec
+
+
+def vectorized(array_func):
+    """
+    Decorator registering a vectorized variant of a ``property_format`` hook implementation,
+    which is used to format all elements of a 1-D numeric array at once (see :py:func:`format_array`).
+    The variant takes the same arguments, but ``value`` is the array of elements.
+    It returns an object array holding the formatted str or ``None`` for each element,
+    or ``None`` if it does not format any of them.
+    """
+
+    def dec(func):
+        func.vectorized = array_func
+        return func
+
+    return dec
+
+
+_DO_NOT_PRINT = object()
+"""Marker in resolved implementation lists, that all further formatting leads to :py:class:`DoNotPrint`."""
+
+_resolutions: Dict[Tuple[str, type, type], Optional[Sequence]] = {}
+_resolutions_generation = -1
+
+
+def _resolve(name: str, value_type: type, owner_type: type) -> Optional[Sequence]:
+    impls = plugin_manager.hook.property_format.get_hookimpls()
+
+    if any(impl.hookwrapper or getattr(impl, "wrapper", False) for impl in impls):
+        return None  # wrappers need the full hook call
+
+    resolved = []
+    for impl in reversed(impls):
+        types = getattr(impl.function, "value_types", None)
+        if types is not None and not issubclass(value_type, types):
+            continue
+
+        # implementations depending only on the name give the same result for all values
+        if set(impl.argnames) <= {"name"}:
+            try:
+                result = impl.function(*[name for _ in impl.argnames])
+            except DoNotPrint:
+                resolved.append(_DO_NOT_PRINT)
+                break
+            except Exception:
+                resolved.append(impl)
+                continue
+
+            if result is None:
+                continue
+
+        resolved.append(impl)
+
+    return resolved
+
+
+def _resolved(name: str, value_type: type, owner_type: type) -> Optional[Sequence]:
+    global _resolutions_generation
+
+    if _resolutions_generation != plugin_manager.generation:
+        _resolutions.clear()
+        _resolutions_generation = plugin_manager.generation
+
+    key = (name, value_type, owner_type)
+
     try:
+        return _resolutions[key]
+    except KeyError:
+        resolved = _resolutions[key] = _resolve(*key)
+        return resolved
+
+
+def format_property(name: str, value: object, owner: Optional[object]):
+    """
+    Format a property value like ``plugin_manager.hook.property_format``, but resolve the hook implementations
+    to call only once per combination of property name, value type and owner type.
+    Hook implementations not accepting the value type (see :py:func:`value_types`) are skipped,
+    those depending only on the property name are evaluated during resolution.
+    The resolutions are discarded if plugins are registered or unregistered.
+
+    :raises DoNotPrint: if the property shall not be printed
+    """
+    resolved = _resolved(name, type(value), type(owner))
+
+    if resolved is None:
         return plugin_manager.hook.property_format(name=name, value=value, owner=owner)
+
+    kwargs = dict(name=name, value=value, owner=owner)
+
+    impl: HookImpl
+    for impl in resolved:
+        if impl is _DO_NOT_PRINT:
+            raise DoNotPrint()
+
+        result = impl.function(*[kwargs[a] for a in impl.argnames])
+
+        if result is not None:
+            return result
+
+    return None
+
+
+def format_array(name: str, values: np.ndarray, element_type: type, owner: Optional[object]) -> Optional[np.ndarray]:
+    """
+    Format all elements of a 1-D array at once using the vectorized variants of the resolved
+    ``property_format`` hook implementations (see :py:func:`vectorized`).
+    The result equals calling :py:func:`format_property` on each element of type ``element_type``.
+
+    :returns: an object array of the formatted elements or ``None``, if a resolved implementation has no
+        vectorized variant or some elements remain unformatted
+    :raises DoNotPrint: if the elements shall not be printed
+    """
+    resolved = _resolved(name, element_type, type(owner))
+
+    if resolved is None:
+        return None
+
+    result = np.full(len(values), None, dtype=object)
+    pending = np.arange(len(values))
+
+    for impl in resolved:
+        if len(pending) == 0:
+            break
+
+        if impl is _DO_NOT_PRINT:
+            raise DoNotPrint()
+
+        array_func = getattr(impl.function, "vectorized", None)
+        if array_func is None:
+            return None
+
+        kwargs = dict(name=name, value=values[pending], owner=owner)
+        formatted = array_func(*[kwargs[a] for a in impl.argnames])
+
+        if formatted is None:
+            continue
+
+        done = np.not_equal(formatted, None)
+        result[pending[done]] = formatted[done]
+        pending = pending[~done]
+
+    if len(pending) > 0:
+        return None
+
+    return result
+
+
+def try_format_property(name: str, value: object, owner: object):
+    try:
+        return format_property(name=name, value=value, owner=owner)
     except (TypeError, ValueError, DoNotPrint):
         return None
 
 
-def render_properties_table(instance: ReprMixin):
-    template = _env.get_template("properties.html")
+def _format_properties(instance: ReprMixin, export: Optional[PropertyExport]):
+    budget = Config.PROPERTY_TIME_BUDGET
+    unit = instance if isinstance(instance, Unit) else _unit.get()
+
+    start = time.perf_counter()
+    attrs = instance.__attrs__
+    duration = time.perf_counter() - start
+    if duration > budget:
+        record_slow_property(unit, instance, "__attrs__", duration)
+
+    if export is not None:
+        unit_path, prefix = export.owner(instance)
+
+    properties = []
+
+    for n, v in attrs.items():
+        start = time.perf_counter()
+
+        if export is not None:
+            with export.nested(unit_path, f"{prefix}{n}."):
+                s = try_format_property(n, v, instance)
+        else:
+            s = try_format_property(n, v, instance)
 
-    properties = [
-        (n.replace("_", " "), s) for n, v in instance.__attrs__.items()
-        if (s := try_format_property(n, v, instance)) is not None
-    ]
+        duration = time.perf_counter() - start
+        if duration > budget:
+            record_slow_property(unit, instance, n, duration)
+
+        if s is not None:
+            properties.append((n.replace("_", " "), s))
+
+            if export is not None:
+                export.add(unit_path, prefix + n, v)
+
+    return properties
+
+
+def _render_properties_table(instance: ReprMixin, export: Optional[PropertyExport]):
+    template = get_template(_TEMPLATE_DIR, "properties.html")
+    properties = _format_properties(instance, export)
 
     return template.render(
         properties=properties,
     )
 
 
+_unit: ContextVar[Optional[Unit]] = ContextVar("_unit", default=None)
+"""The unit whose properties table is currently rendered."""
+
+_rendering: ContextVar[Tuple[int, ...]] = ContextVar("_rendering", default=())
+"""Ids of the objects whose tables are currently rendered, to detect cycles."""
+
+_cyclic: ContextVar[Optional[Set[int]]] = ContextVar("_cyclic", default=None)
+"""Ids of the objects currently rendered, whose tables contain a recursive reference to an enclosing table,
+so that they depend on where they are rendered and must not be memoized."""
+
+_contained: ContextVar[Tuple[Set[int], ...]] = ContextVar("_contained", default=())
+"""Ids of the objects whose tables are nested in each memoized table currently rendered."""
+
+
+def _add_contained(ids):
+    for c in _contained.get():
+        c.update(ids)
+
+
+def _render_memoized(instance: ReprMixin, export: Optional[PropertyExport], memo: OrderedDict):
+    key = (id(instance), plugin_manager.generation, tuple(config_values().values()), degradation_level())
+    owner = export.owner(instance) if export is not None else None
+    entry = memo.get(key)
+
+    # a table nesting one of the enclosing objects would print it where a recursive reference belongs
+    if entry is not None and entry[4].isdisjoint(_rendering.get()):
+        _, html, rows_owner, rows, contained = entry
+
+        if export is None or rows is not None:
+            memo.move_to_end(key)
+            _add_contained(contained)
+
+            if export is not None:
+                export.extend(relocate_owner(rows, rows_owner, owner))
+
+            return html
+
+    contained = set()
+    token = _contained.set(_contained.get() + (contained,))
+    try:
+        if export is None:
+            html = _render_properties_table(instance, export)
+            rows = None
+        else:
+            with export.capture() as rows:
+                html = _render_properties_table(instance, export)
+    finally:
+        _contained.reset(token)
+
+    cyclic = _cyclic.get()
+    if id(instance) in cyclic:
+        cyclic.discard(id(instance))
+        return html
+
+    # the instance is kept to prevent reuse of its id
+    memo[key] = instance, html, owner, rows, contained
+    if len(memo) > TABLE_MEMO_SIZE:
+        memo.popitem(last=False)
+
+    return html
+
+
+def render_properties_table(instance: ReprMixin):
+    rendering = _rendering.get()
+
+    if id(instance) in rendering:
+        # the tables between the referenced one and this reference are only valid below the referenced one
+        _cyclic.get().update(rendering[rendering.index(id(instance)) + 1:])
+        return f"<p class='text-secondary'>recursive reference to {escape(str(instance))}</p>"
+
+    _add_contained((id(instance),))
+    cyclic_token = _cyclic.set(set()) if not rendering else None
+    token = _rendering.set(rendering + (id(instance),))
+    try:
+        export = active_export()
+        memo = active_table_memo()
+
+        if isinstance(instance, Unit):
+            unit_token = _unit.set(instance)
+            try:
+                html = _render_properties_table(instance, export)
+                account("property tables", len(html))
+                return html
+            finally:
+                _unit.reset(unit_token)
+
+        if memo is None:
+            return _render_properties_table(instance, export)
+
+        return _render_memoized(instance, export, memo)
+    finally:
+        _rendering.reset(token)
+
+        if cyclic_token is not None:
+            _cyclic.reset(cyclic_token)
+
+
 @hookimpl(specname="unit_display")
 def unit_properties_display(unit: Unit, level: int):
     return render_properties_table(unit)
@@ -1,5 +1,34 @@
+import functools
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Optional, Tuple, Callable
+
 from pyroll.core import Unit, PassSequence
 from pyroll.report.pluggy import hookimpl, plugin_manager
+from ..budget import active_budget, degradation_level, degradation_note, MAX_LEVEL
+from ..parallel import unit_displays
+from ..templates import get_template
+from ..utils import iter_chunks
+
+_TEMPLATE_DIR = Path(__file__).parent
+
+_unit_links: ContextVar[Optional[Tuple[PassSequence, Callable[[int], str]]]] = ContextVar("_unit_links", default=None)
+
+
+@contextmanager
+def unit_links(sequence: PassSequence, href: Callable[[int], str]):
+    """
+    Context manager letting the display of the given sequence list links to its units instead of rendering them.
+
+    :param sequence: the sequence to list the units of
+    :param href: function returning the link target for the index of a unit
+    """
+    token = _unit_links.set((sequence, href))
+    try:
+        yield
+    finally:
+        _unit_links.reset(token)
 
 
 @hookimpl(specname="unit_display", tryfirst=True)
@@ -7,17 +36,60 @@ def unit_heading(unit: Unit, level: int):
     return f"<h{level} class='mt-4'>{str(unit)}</h{level}>"
 
 
-@hookimpl(specname="unit_display")
-def sequence_units(unit: Unit, level: int):
-    if isinstance(unit, PassSequence):
-        displays = "\n".join([
-            d
-            for u in unit.units
-            for d in plugin_manager.hook.unit_display(unit=u, level=level + 1)
-        ])
+def _render_unit(unit: Unit, level: int) -> str:
+    if degradation_level() == MAX_LEVEL:
+        return unit_heading(unit, level) + degradation_note()
+
+    displays = ["".join(iter_chunks(d)) for d in plugin_manager.hook.unit_display(unit=unit, level=level)]
+
+    if displays:
+        displays.insert(1, degradation_note())
+
+    return "\n".join(d for d in displays if d)
+
+
+def _sequence_units_chunks(unit: PassSequence, level: int):
+    links = _unit_links.get()
 
-        return f"""
+    if links is not None and links[0] is unit:
+        yield get_template(_TEMPLATE_DIR, "unit_links.html").render(
+            units=[(links[1](i), str(u)) for i, u in enumerate(unit.units)]
+        )
+        return
+
+    yield """
         <div>
-            {displays}
+            """
+
+    budget = active_budget()
+
+    if budget is not None and budget.limit and budget.sequence is unit:
+        units = unit.units
+
+        for i, u in enumerate(units):
+            if i > 0:
+                yield "\n"
+            yield budget.render_unit(u, functools.partial(_render_unit, u, level + 1), len(units) - i)
+
+    else:
+        yield from _unit_displays_chunks(unit, level)
+
+    yield """
         </div>
         """
+
+
+def _unit_displays_chunks(unit: PassSequence, level: int):
+    first = True
+    for displays in unit_displays(unit, level + 1):
+        for d in displays:
+            if not first:
+                yield "\n"
+            first = False
+            yield from iter_chunks(d)
+
+
+@hookimpl(specname="unit_display")
+def sequence_units(unit: Unit, level: int):
+    if isinstance(unit, PassSequence):
+        return _sequence_units_chunks(unit, level)
@@ -1,14 +1,23 @@
+import hashlib
+import math
+import os
 import re
+import sys
+import threading
 import shapely
 import numpy as np
 
 from io import StringIO
-from typing import Sequence, List
+from typing import Sequence, List, Iterable, Iterator, Union, Optional, TYPE_CHECKING
 from shapely.affinity import rotate
 from shapely import LineString, Geometry
-from matplotlib import pyplot as plt
-from matplotlib.ticker import FixedLocator, FixedFormatter
 from pyroll.core import Unit, BaseRollPass
+from .config import Config
+
+# matplotlib is imported on first plot only, as it is expensive to import
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+    from matplotlib.figure import Figure
 
 
 def orient_geometry_to_technology(geom: List[Geometry] | Geometry, unit: BaseRollPass):
@@ -30,57 +39,182 @@ def orient_geometry_to_technology(geom: List[Geometry] | Geometry, unit: BaseRol
     return geom
 
 
+def iter_chunks(display: Union[str, Iterable]) -> Iterator[str]:
+    """Yields the str chunks of a display, which may be either a str or an iterable of (nested) displays."""
+    if isinstance(display, str):
+        yield display
+        return
+
+    for d in display:
+        yield from iter_chunks(d)
+
+
 def create_sequence_plot(units: Sequence[Unit]):
     """Creates a styled base figure for use in sequence plots.
-    The x-axis ticks will be labeled with the unit labels and indices."""
-    fig: plt.Figure = plt.figure(constrained_layout=True, figsize=(8, 4))
-    ax: plt.Axes = fig.subplots()
+    The x-axis ticks will be labeled with the unit labels and indices.
+    If there are more units than ``Config.SEQUENCE_PLOT_LABEL_LIMIT``, only every n-th unit is labeled."""
+    from matplotlib.figure import Figure
+    from matplotlib.ticker import FixedLocator, FixedFormatter
+
+    fig = Figure(constrained_layout=True, figsize=(8, 4))
+    ax: "Axes" = fig.subplots()
+
+    step = max(1, math.ceil(len(units) / max(1, Config.SEQUENCE_PLOT_LABEL_LIMIT)))
+    indices, labels = [], []
+    for i, p in enumerate(units):
+        if i % step == 0:
+            indices.append(i)
+            labels.append(f"{i}: {p}")
 
-    indices = np.arange(len(units))
     ax.xaxis.set_major_locator(FixedLocator(indices))
-    ax.xaxis.set_major_formatter(
-        FixedFormatter([f"{i}: {p}" for i, p in zip(indices, units)]))
-    plt.setp(ax.xaxis.get_majorticklabels(), rotation=90)
+    ax.xaxis.set_major_formatter(FixedFormatter(labels))
+    ax.tick_params(axis="x", labelrotation=90)
     ax.grid()
 
     return fig, ax
 
 
+def plot_sequence_bars(ax, heights: Sequence[float]):
+    """Plot a bar per unit of a sequence plot created by :py:func:`create_sequence_plot`.
+    If there are more units than ``Config.SEQUENCE_PLOT_LABEL_LIMIT``, the bars are drawn as one filled outline."""
+    if len(heights) > Config.SEQUENCE_PLOT_LABEL_LIMIT:
+        ax.stairs(heights, np.arange(len(heights) + 1) - 0.5, fill=True)
+    else:
+        ax.bar(x=np.arange(len(heights)), height=heights, width=0.8)
+
+
+def sequence_marker(count: int) -> Optional[str]:
+    """Get the marker for line plots over ``count`` units in sequence plots, which is omitted for long sequences."""
+    return "x" if count <= Config.SEQUENCE_PLOT_LABEL_LIMIT else None
+
+
 def resize_svg_to_100_percent(svg: str) -> str:
     svg = re.sub(r'height="[\d.\w]*?"', 'height="100%"', svg)
     svg = re.sub(r'width="[\d.\w]*?"', 'width="100%"', svg)
     return svg
 
 
-def get_svg_from_figure(fig: plt.Figure) -> str:
+_svg_lock = threading.Lock()
+
+
+def _reset_locks_after_fork():
+    # a thread of the parent may have held the locks while forking, which would never release them in the child
+    global _svg_lock
+    _svg_lock = threading.Lock()
+
+    figure = sys.modules.get("matplotlib.figure")
+    if figure is not None:
+        figure.Figure._render_lock = threading.RLock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_locks_after_fork)
+
+
+def get_svg_from_figure(fig: "Figure") -> str:
+    """Render a figure as SVG code. Figures created by ``pyplot`` are closed afterwards.
+
+    The SVG output is made deterministic by a fixed hash salt. As this is a global matplotlib setting,
+    the figures are saved one at a time, while they may be created and drawn concurrently."""
+    import matplotlib
+
     with StringIO() as buf:
-        fig.savefig(buf, format="svg")
-        plt.close(fig)
+        # fixed salt and omitted date make the output deterministic
+        with _svg_lock, matplotlib.rc_context({"svg.hashsalt": "pyroll-report"}):
+            fig.savefig(buf, format="svg", metadata={"Date": None})
+
+        # figures of the object-oriented API are garbage collected, only pyplot keeps references
+        pyplot = sys.modules.get("matplotlib.pyplot")
+        if pyplot is not None and getattr(fig.canvas, "manager", None) is not None:
+            pyplot.close(fig)
+
         return buf.getvalue()
 
 
-def plot_shapely_geom(geom: shapely.Geometry):
-    fig: plt.Figure = plt.figure(figsize=(2, 2))
-    ax: plt.Axes = fig.add_subplot()
-    ax.axis("off")
-    ax.set_aspect("equal")
-    fig.patch.set_alpha(0)
-
-    try:
-        if isinstance(geom, shapely.LineString):
-            ax.plot(*geom.xy, c="k")
-        elif isinstance(geom, shapely.Polygon):
-            ax.fill(*geom.boundary.xy, c="k", alpha=0.5)
-            ax.fill(*geom.boundary.xy, c="k", fill=False)
-        elif isinstance(geom, shapely.MultiLineString):
-            for g in geom.geoms:
-                ax.plot(*g.xy, c="k")
-        elif isinstance(geom, shapely.MultiPolygon):
-            for g in geom.geoms:
-                ax.fill(*g.boundary.xy, c="k", alpha=0.5)
-                ax.fill(*g.boundary.xy, c="k", fill=False)
-    except NotImplementedError:
+_THUMBNAIL_SIZE = 1000
+"""Edge length of the view box of geometry thumbnails."""
+
+_THUMBNAIL_MARGIN = 0.05
+"""Margin around geometries in thumbnails relative to their extent."""
+
+_STROKE = 'stroke="black" stroke-width="1.5" stroke-linejoin="round" vector-effect="non-scaling-stroke"'
+
+
+def _svg_path_data(coords: np.ndarray, closed: bool) -> str:
+    points = " L".join([f"{x:.1f},{y:.1f}" for x, y in coords])
+    return f"M{points}{' Z' if closed else ''}"
+
+
+def plot_shapely_geom(geom: shapely.Geometry) -> str:
+    """Renders a thumbnail of a (multi) polygon or (multi) line string directly as SVG code,
+    with polygons filled in translucent black and all lines outlined in black.
+    The SVG is scaled to fill the available space, keeping an equal aspect ratio."""
+    if geom.is_empty:
+        return ""
+
+    if isinstance(geom, (shapely.Polygon, shapely.LineString)):
+        parts = [geom]
+    elif isinstance(geom, (shapely.MultiPolygon, shapely.MultiLineString)):
+        parts = list(geom.geoms)
+    else:
+        return ""
+
+    minx, miny, maxx, maxy = geom.bounds
+    extent = max(maxx - minx, maxy - miny)
+    if extent == 0:
         return ""
 
-    fig.set_layout_engine('constrained')
-    return resize_svg_to_100_percent(get_svg_from_figure(fig))
+    # map to a square view box with the geometry centered and the y-axis pointing upwards
+    scale = _THUMBNAIL_SIZE / (extent * (1 + 2 * _THUMBNAIL_MARGIN))
+    offset = np.array([
+        _THUMBNAIL_SIZE / 2 - (minx + maxx) / 2 * scale,
+        _THUMBNAIL_SIZE / 2 + (miny + maxy) / 2 * scale,
+    ])
+
+    def transform(coords):
+        return np.asarray(coords)[:, :2] * [scale, -scale] + offset
+
+    paths = []
+    for p in parts:
+        if isinstance(p, shapely.Polygon):
+            d = " ".join(
+                _svg_path_data(transform(r.coords), closed=True)
+                for r in [p.exterior, *p.interiors]
+            )
+            paths.append(f'<path d="{d}" fill="black" fill-opacity="0.5" fill-rule="evenodd" {_STROKE}/>')
+        else:
+            d = _svg_path_data(transform(p.coords), closed=False)
+            paths.append(f'<path d="{d}" fill="none" {_STROKE}/>')
+
+    content = "".join(paths)
+    symbol_id = f"pyroll-geom-{hashlib.sha1(content.encode()).hexdigest()[:16]}"
+
+    # the geometry is defined as symbol, so that repeated occurrences can reference the first one,
+    # see deduplicate_svg_symbols
+    return (
+            f'<svg xmlns="http://www.w3.org/2000/svg" width="100%" height="100%" '
+            f'viewBox="0 0 {_THUMBNAIL_SIZE} {_THUMBNAIL_SIZE}">'
+            f'<defs><symbol id="{symbol_id}" viewBox="0 0 {_THUMBNAIL_SIZE} {_THUMBNAIL_SIZE}">{content}</symbol></defs>'
+            f'<use href="#{symbol_id}"/>'
+            "</svg>"
+    )
+
+
+_SYMBOL_DEFINITION = re.compile(r'<defs><symbol id="(pyroll-geom-[0-9a-f]+)".*?</symbol></defs>', re.DOTALL)
+
+
+def deduplicate_svg_symbols(chunks: Iterable[str]) -> Iterator[str]:
+    """Removes repeated definitions of geometry thumbnail symbols (see :py:func:`plot_shapely_geom`) from a stream
+    of HTML chunks forming one document, so that later occurrences reference the first definition."""
+    defined = set()
+
+    def replace(match: re.Match):
+        if match.group(1) in defined:
+            return ""
+        defined.add(match.group(1))
+        return match.group(0)
+
+    for chunk in chunks:
+        if "<symbol" in chunk:
+            chunk = _SYMBOL_DEFINITION.sub(replace, chunk)
+        yield chunk
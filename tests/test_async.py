@@ -0,0 +1,136 @@
+import asyncio
+import io
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import pyroll.core as pr
+
+from pyroll.report import report_async, report_to_async, hookimpl, plugin_manager, utils
+
+IN_PROFILE = pr.Profile.round(
+    diameter=4e-3,
+    strain=0,
+    flow_stress=100e6,
+)
+
+
+def _sequence():
+    sequence = pr.PassSequence([
+        pr.RollPass(
+            label=f"Pass {i}",
+            roll=pr.Roll(
+                groove=pr.CircularOvalGroove(r1=1e-3, r2=5e-3, depth=1e-3),
+                nominal_radius=100e-3
+            ),
+            gap=1e-3,
+            velocity=1,
+        )
+        for i in range(3)
+    ])
+    sequence.solve(IN_PROFILE)
+    return sequence
+
+
+SEQUENCE = _sequence()
+
+
+async def _ticking(coroutine):
+    # count how often the event loop gets the chance to run another task while the coroutine is awaited
+    ticks = 0
+
+    async def tick():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    ticker = asyncio.create_task(tick())
+    try:
+        return await coroutine, ticks
+    finally:
+        ticker.cancel()
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_report_async(executor):
+    result, ticks = asyncio.run(_ticking(report_async(SEQUENCE, executor=executor)))
+
+    assert "Pass 2" in result
+    assert result.rstrip().endswith("</html>")
+    assert ticks > 0
+
+
+def test_report_async_process_lock_held_at_fork():
+    # a lock held by another thread while forking must not deadlock the child on its first plot
+    with utils._svg_lock:
+        result = asyncio.run(asyncio.wait_for(report_async(SEQUENCE, executor="process"), 120))
+
+    assert "Pass 2" in result
+
+
+def test_report_async_executor_instance():
+    with ThreadPoolExecutor(2) as executor:
+        result = asyncio.run(report_async(SEQUENCE, executor=executor))
+
+    assert "Pass 2" in result
+
+
+def test_report_async_unknown_executor():
+    with pytest.raises(ValueError):
+        asyncio.run(report_async(SEQUENCE, executor="fiber"))
+
+
+def test_report_to_async_concurrent(tmp_path):
+    async def main():
+        return await asyncio.gather(*[
+            report_to_async(SEQUENCE, tmp_path / f"report{i}.html", executor=executor)
+            for i, executor in enumerate(["thread", "process", "thread"])
+        ])
+
+    sizes = asyncio.run(main())
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["report0.html", "report1.html", "report2.html"]
+    for i, size in enumerate(sizes):
+        assert len((tmp_path / f"report{i}.html").read_text(encoding="utf-8")) == size
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_report_to_async_properties_file_object(executor):
+    properties = io.StringIO()
+    asyncio.run(report_to_async(SEQUENCE, io.StringIO(), properties_file=properties, executor=executor))
+
+    expected = io.StringIO()
+    asyncio.run(report_to_async(SEQUENCE, io.StringIO(), properties_file=expected, executor="thread"))
+
+    assert properties.getvalue()
+    assert properties.getvalue() == expected.getvalue()
+
+
+def test_report_to_async_cancel(tmp_path):
+    class Impls:
+        @staticmethod
+        @hookimpl(specname="property_format")
+        def slow_format(name):
+            if name == "gap":
+                time.sleep(0.2)
+
+    file = tmp_path / "report.html"
+    file.write_text("previous")
+
+    async def main():
+        task = asyncio.create_task(report_to_async(SEQUENCE, file, incremental=True))
+        await asyncio.sleep(0.1)
+        task.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    plugin_manager.register(Impls)
+    try:
+        asyncio.run(main())
+    finally:
+        plugin_manager.unregister(Impls)
+
+    assert file.read_text() == "previous"
+    assert [p.name for p in tmp_path.iterdir()] == ["report.html"]
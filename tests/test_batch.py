@@ -0,0 +1,90 @@
+import pyroll.core as pr
+
+from pyroll.report import report_many
+
+IN_PROFILE = pr.Profile.round(
+    diameter=30e-3,
+    temperature=1200 + 273.15,
+    strain=0,
+    material=["C45", "steel"],
+    flow_stress=100e6,
+)
+
+
+def _sequence(gap: float):
+    sequence = pr.PassSequence([
+        pr.RollPass(
+            label="Oval I",
+            orientation="H",
+            roll=pr.Roll(
+                groove=pr.CircularOvalGroove(depth=8e-3, r1=6e-3, r2=40e-3),
+                nominal_radius=160e-3,
+                rotational_frequency=1
+            ),
+            gap=gap,
+        ),
+    ])
+    sequence.solve(IN_PROFILE)
+    return sequence
+
+
+SEQUENCES = {f"gap {g} mm": _sequence(g * 1e-3) for g in [1, 2, 3]}
+
+
+def test_report_many(tmp_path):
+    index = report_many(SEQUENCES, tmp_path)
+
+    assert index == tmp_path / "index.html"
+    content = index.read_text()
+
+    for name, file in zip(SEQUENCES, ["gap_1_mm.html", "gap_2_mm.html", "gap_3_mm.html"]):
+        assert name in content
+        assert f'href="{file}"' in content
+        assert "Oval I" in (tmp_path / file).read_text()
+
+
+def test_report_many_parallel_identical_to_serial(tmp_path):
+    report_many(SEQUENCES.values(), tmp_path / "serial")
+    report_many(SEQUENCES.values(), tmp_path / "parallel", workers=2)
+
+    for file in ["report_0.html", "report_1.html", "report_2.html"]:
+        serial = (tmp_path / "serial" / file).read_text()
+        parallel = (tmp_path / "parallel" / file).read_text()
+        assert serial.split("<footer")[0] == parallel.split("<footer")[0]
+
+
+def test_report_many_failing_report(tmp_path):
+    unsolved = pr.PassSequence([pr.Transport(label="unsolved", duration=1)])
+
+    index = report_many({"ok": SEQUENCES["gap 1 mm"], "unsolved": unsolved}, tmp_path)
+
+    assert (tmp_path / "ok.html").exists()
+    assert "failed" in index.read_text()
+
+
+def test_report_many_loaders_with_duplicate_names(tmp_path):
+    loaded = []
+
+    def loader(gap):
+        def load():
+            loaded.append(gap)
+            return _sequence(gap * 1e-3)
+
+        return load
+
+    index = report_many([("case", loader(1)), ("case", loader(2))], tmp_path)
+
+    assert loaded == [1, 2]
+    content = index.read_text()
+    assert 'href="case.html"' in content
+    assert 'href="case_2.html"' in content
+
+
+def test_report_many_failing_loader(tmp_path):
+    def load():
+        raise RuntimeError("input not solvable")
+
+    index = report_many({"ok": SEQUENCES["gap 1 mm"], "broken": load}, tmp_path)
+
+    assert (tmp_path / "ok.html").exists()
+    assert "input not solvable" in index.read_text()
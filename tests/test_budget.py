@@ -0,0 +1,73 @@
+import logging
+
+import numpy as np
+import pyroll.core as pr
+
+from pyroll.report import report, report_to, Config
+from pyroll.report.budget import degraded
+from pyroll.report.unit_display.properties import format_property
+
+IN_PROFILE = pr.Profile.round(
+    diameter=4e-3,
+    strain=0,
+    flow_stress=100e6,
+)
+
+SEQUENCE = pr.PassSequence([
+    pr.RollPass(
+        label=f"Pass {i}",
+        roll=pr.Roll(
+            groove=pr.CircularOvalGroove(r1=1e-3, r2=5e-3, depth=1e-3),
+            nominal_radius=100e-3
+        ),
+        gap=1e-3,
+        velocity=1,
+    )
+    for i in range(3)
+])
+
+SEQUENCE.solve(IN_PROFILE)
+
+
+def test_no_limit(monkeypatch):
+    result = report(SEQUENCE)
+
+    assert "Reduced to fit" not in result
+    assert "Report size" not in result
+
+    monkeypatch.setattr(Config, "PRINT_STATISTICS", True)
+    assert "Report size" in report(SEQUENCE)
+
+
+def test_degradation(monkeypatch, caplog):
+    full = len(report(SEQUENCE))
+    limit = int(full * 0.75)
+    monkeypatch.setattr(Config, "MAX_REPORT_SIZE", limit)
+
+    result = report(SEQUENCE)
+
+    assert len(result) <= limit
+    assert "Reduced to fit the report size budget" in result
+    assert "reduced to fit the budget" in result
+    assert "Pass 2" in result
+    assert any(r.levelno == logging.WARNING and "Reduced the display of" in r.message for r in caplog.records)
+
+
+def test_limit_warns_on_workers_and_incremental(monkeypatch, caplog, tmp_path):
+    monkeypatch.setattr(Config, "MAX_REPORT_SIZE", 10_000_000)
+
+    report_to(SEQUENCE, tmp_path / "report.html", workers=2, incremental=True)
+
+    messages = [r.message for r in caplog.records if r.levelno == logging.WARNING]
+    assert any("worker processes are not used" in m for m in messages)
+    assert any("stored unit displays are not reused" in m for m in messages)
+
+
+def test_degraded_arrays(monkeypatch):
+    monkeypatch.setattr(Config, "ARRAY_EDGEITEMS", 2)
+    values = np.arange(10)
+
+    assert "..." not in format_property("values", values, None)
+
+    with degraded(1):
+        assert format_property("values", values, None) == "0, 1, ..., 8, 9"
@@ -78,3 +78,77 @@ def test_cli(tmp_path, monkeypatch, caplog):
     assert result.exit_code == 0
 
     webbrowser.open((tmp_path / "report.html").as_uri())
+
+
+@pytest.mark.skipif(not pyroll.report.CLI_INSTALLED, reason="pyroll-cli is not installed in the current environment")
+def test_cli_report_batch(tmp_path, monkeypatch, caplog):
+    from pyroll.report.cli import report_batch
+
+    (tmp_path / "a.py").write_text(INPUT)
+    (tmp_path / "b.py").write_text(INPUT)
+    caplog.set_level(logging.INFO, "pyroll")
+    monkeypatch.chdir(tmp_path)
+
+    result = RUNNER.invoke(report_batch, ("a.py", "b.py", "-o", "out"))
+
+    print(caplog.text)
+
+    assert result.exit_code == 0
+    assert (tmp_path / "out" / "a.html").exists()
+    assert (tmp_path / "out" / "b.html").exists()
+    assert 'href="a.html"' in (tmp_path / "out" / "index.html").read_text()
+
+
+def test_cli_report_batch_same_stems(tmp_path, monkeypatch, caplog):
+    from pyroll.report import Config
+    from pyroll.report.cli import report_batch
+
+    for d in ["a", "b"]:
+        (tmp_path / "runs" / d).mkdir(parents=True)
+        (tmp_path / "runs" / d / "input.py").write_text(INPUT)
+    caplog.set_level(logging.INFO, "pyroll")
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(Config, "FLOAT_PRECISION", Config.FLOAT_PRECISION)
+
+    result = RUNNER.invoke(
+        report_batch, ("runs/a/input.py", "runs/b/input.py", "-o", "out", "--float-precision", "2")
+    )
+
+    print(caplog.text)
+
+    assert result.exit_code == 0
+    assert Config.FLOAT_PRECISION == 2
+
+    index = (tmp_path / "out" / "index.html").read_text()
+    for file in ["a_input.html", "b_input.html"]:
+        assert f'href="{file}"' in index
+        assert "Oval I" in (tmp_path / "out" / file).read_text()
+
+
+@pytest.mark.parametrize("selection", ["every:x", "1.5", "frist,last"])
+def test_cli_invalid_disk_element_selection(tmp_path, monkeypatch, selection):
+    from pyroll.report.cli import report_batch
+
+    (tmp_path / "a.py").write_text(INPUT)
+    monkeypatch.chdir(tmp_path)
+
+    result = RUNNER.invoke(report_batch, ("a.py", "-o", "out", "--disk-element-selection", selection))
+
+    assert result.exit_code == 2
+    assert "--disk-element-selection" in result.output
+    assert not (tmp_path / "out").exists()
+
+
+@pytest.mark.skipif(not pyroll.report.CLI_INSTALLED, reason="pyroll-cli is not installed in the current environment")
+def test_cli_out_dir(tmp_path, monkeypatch, caplog):
+    (tmp_path / "input.py").write_text(INPUT)
+    caplog.set_level(logging.INFO, "pyroll")
+    monkeypatch.chdir(tmp_path)
+
+    result = RUNNER.invoke(main, ("input-py", "solve", "report", "--out-dir", "out"))
+
+    print(caplog.text)
+
+    assert result.exit_code == 0
+    assert (tmp_path / "out" / "index.html").exists()
+    assert not (tmp_path / "report.html").exists()
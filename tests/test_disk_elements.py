@@ -0,0 +1,147 @@
+import re
+
+import numpy as np
+import pyroll.core as pr
+import pytest
+
+from pyroll.report import Config, plugin_manager
+from pyroll.report.unit_display.disk_elements import (
+    select_disk_elements, disk_element_columns, disk_element_statistics
+)
+
+IN_PROFILE = pr.Profile.round(
+    diameter=30e-3,
+    temperature=1200 + 273.15,
+    strain=0,
+    material=["C45", "steel"],
+    flow_stress=100e6,
+)
+
+ROLL_PASS = pr.RollPass(
+    label="Oval I",
+    orientation="H",
+    roll=pr.Roll(
+        groove=pr.CircularOvalGroove(depth=8e-3, r1=6e-3, r2=40e-3),
+        nominal_radius=160e-3,
+        rotational_frequency=1
+    ),
+    gap=2e-3,
+    disk_element_count=9,
+)
+
+ROLL_PASS.solve(IN_PROFILE)
+
+
+@pytest.mark.parametrize(
+    "selection,indices",
+    [
+        ("all", list(range(9))),
+        ("none", []),
+        ("every:4", [0, 4, 8]),
+        ("first,last", [0, 8]),
+        ("Middle", [4]),
+        ("0, 0.25, 1", [0, 2, 8]),
+    ]
+)
+def test_select_disk_elements(selection, indices):
+    assert select_disk_elements(9, selection) == indices
+
+
+@pytest.mark.parametrize("selection", ["every:0", "every:x", "1.5", "foo", "frist,last"])
+def test_select_disk_elements_invalid(selection):
+    with pytest.raises(ValueError):
+        select_disk_elements(9, selection)
+
+
+def test_disk_element_columns():
+    columns = disk_element_columns(ROLL_PASS.disk_elements)
+
+    assert np.array_equal(columns["duration"], [de.duration for de in ROLL_PASS.disk_elements])
+    assert np.array_equal(columns["out_profile.temperature"],
+                          [de.out_profile.temperature for de in ROLL_PASS.disk_elements])
+    assert "label" not in columns
+    assert "out_profile.material" not in columns
+
+
+def test_disk_element_statistics_entry():
+    statistics = disk_element_statistics(ROLL_PASS.disk_elements)
+    first = ROLL_PASS.disk_elements[0]
+
+    # the time advances within the first disk element
+    assert statistics["out_profile.t"][3] == first.in_profile.t
+    assert statistics["out_profile.t"][3] != first.out_profile.t
+    assert statistics["out_profile.t"][4] == ROLL_PASS.disk_elements[-1].out_profile.t
+    assert statistics["duration"][3] == first.duration
+
+
+def test_disk_element_statistics_profile_owner(monkeypatch):
+    from pyroll.report import hookimpl
+
+    owners = {}
+
+    class Impls:
+        @staticmethod
+        @hookimpl(specname="property_format")
+        def record_owner(name, owner):
+            if name in ["temperature", "duration"]:
+                owners.setdefault(name, type(owner))
+
+    monkeypatch.setattr(Config, "PRINT_DISK_ELEMENTS", False)
+    monkeypatch.setattr(Config, "DISK_ELEMENT_STATISTICS", True)
+    plugin_manager.register(Impls)
+    try:
+        _format_disk_elements()
+    finally:
+        plugin_manager.unregister(Impls)
+
+    assert issubclass(owners["temperature"], pr.Profile)
+    assert not issubclass(owners["duration"], pr.Profile)
+
+
+def _format_disk_elements():
+    return plugin_manager.hook.property_format(value=ROLL_PASS.disk_elements, name="disk_elements", owner=ROLL_PASS)
+
+
+def test_disk_elements_selection(monkeypatch):
+    monkeypatch.setattr(Config, "PRINT_DISK_ELEMENTS", True)
+    monkeypatch.setattr(Config, "DISK_ELEMENT_SELECTION", "first,last")
+
+    result = _format_disk_elements()
+
+    headings = re.findall(r"<h6[^>]*>(.*?)</h6>", result)
+    assert [h[-4:] for h in headings] == ["[0]'", "[8]'"]
+
+
+def test_disk_elements_statistics_only(monkeypatch):
+    monkeypatch.setattr(Config, "PRINT_DISK_ELEMENTS", False)
+    monkeypatch.setattr(Config, "DISK_ELEMENT_STATISTICS", True)
+
+    result = _format_disk_elements()
+
+    assert "<th>At Exit</th>" in result
+    assert "out profile temperature" in result
+    assert "[0]" not in result
+
+
+def test_disk_elements_plot():
+    from pyroll.report.unit_display.plots import disk_elements_plot
+
+    fig = disk_elements_plot(ROLL_PASS)
+
+    assert len(fig.axes) == 4
+    line = fig.axes[0].lines[0]
+    assert np.array_equal(line.get_xdata(), [de.out_profile.x for de in ROLL_PASS.disk_elements])
+    assert np.array_equal(line.get_ydata(), [de.out_profile.temperature for de in ROLL_PASS.disk_elements])
+
+    assert disk_elements_plot(pr.Transport(label="no disk elements")) is None
+
+
+@pytest.mark.parametrize("selection", ["frist,last", "every:0", "every:x"])
+def test_disk_elements_invalid_selection_prints_all(monkeypatch, caplog, selection):
+    monkeypatch.setattr(Config, "PRINT_DISK_ELEMENTS", True)
+    monkeypatch.setattr(Config, "DISK_ELEMENT_SELECTION", selection)
+
+    result = _format_disk_elements()
+
+    assert len(re.findall(r"<h6[^>]*>", result)) == len(ROLL_PASS.disk_elements)
+    assert "Invalid DISK_ELEMENT_SELECTION" in caplog.text
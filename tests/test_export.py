@@ -0,0 +1,110 @@
+import io
+import json
+
+import pyroll.core as pr
+import pytest
+
+from pyroll.report import report_to, hookimpl, plugin_manager
+from pyroll.report.export import PropertyExport
+
+IN_PROFILE = pr.Profile.round(
+    diameter=30e-3,
+    temperature=1200 + 273.15,
+    strain=0,
+    material=["C45", "steel"],
+    flow_stress=100e6,
+)
+
+SEQUENCE = pr.PassSequence([
+    pr.RollPass(
+        label="Oval I",
+        orientation="H",
+        roll=pr.Roll(
+            groove=pr.CircularOvalGroove(depth=8e-3, r1=6e-3, r2=40e-3),
+            nominal_radius=160e-3,
+            rotational_frequency=1
+        ),
+        gap=2e-3,
+    ),
+    pr.Transport(
+        label="I => II",
+        duration=1
+    ),
+])
+
+SEQUENCE.solve(IN_PROFILE)
+
+
+def _rows(file):
+    return {(r["unit"], r["property"]): r for r in map(json.loads, file.read_text().splitlines())}
+
+
+def test_export_raw_values(tmp_path):
+    report_to(SEQUENCE, tmp_path / "report.html", properties_file=tmp_path / "properties.jsonl")
+    rows = _rows(tmp_path / "properties.jsonl")
+
+    assert rows["0", "gap"] == dict(unit="0", property="gap", type="float", value=2e-3)
+    assert rows["0", "orientation"] == dict(unit="0", property="orientation", type="str", value="H")
+    assert rows["1", "duration"]["value"] == 1
+    assert rows["0", "in_profile.width"]["value"] == SEQUENCE.units[0].in_profile.width
+    assert rows["0", "roll.groove.r2"]["value"] == 40e-3
+    assert rows["", "duration"]["value"] == SEQUENCE.duration
+
+    material = rows["0", "in_profile.material"]
+    assert material["type"] == "array"
+    assert material["value"] == ["C45", "steel"]
+
+
+def test_export_parallel_and_incremental_identical(tmp_path):
+    with PropertyExport() as serial:
+        report_to(SEQUENCE, tmp_path / "serial.html")
+
+    with PropertyExport() as parallel:
+        report_to(SEQUENCE, tmp_path / "parallel.html", workers=2)
+
+    assert parallel.rows == serial.rows
+
+    for _ in range(2):  # the second run takes the rows from the manifest
+        with PropertyExport() as incremental:
+            report_to(SEQUENCE, tmp_path / "incremental.html", incremental=True)
+
+        assert sorted(map(json.dumps, incremental.rows)) == sorted(map(json.dumps, serial.rows))
+
+
+def test_export_streamed_to_file():
+    file = io.StringIO()
+
+    with PropertyExport(file) as export:
+        report_to(SEQUENCE, io.StringIO())
+
+        # written while rendering, not on exit
+        assert file.getvalue().count("\n") > 0
+
+    assert export.rows == []
+
+    with PropertyExport() as collected:
+        report_to(SEQUENCE, io.StringIO())
+
+    assert [json.loads(line) for line in file.getvalue().splitlines()] == collected.rows
+
+
+def test_export_file_kept_on_failure(tmp_path):
+    class Impls:
+        @staticmethod
+        @hookimpl(specname="unit_display")
+        def failing_display(unit):
+            if isinstance(unit, pr.Transport):
+                raise RuntimeError("display failed")
+
+    file = tmp_path / "properties.jsonl"
+    file.write_text("previous")
+
+    plugin_manager.register(Impls)
+    try:
+        with pytest.raises(RuntimeError):
+            report_to(SEQUENCE, tmp_path / "report.html", properties_file=file)
+    finally:
+        plugin_manager.unregister(Impls)
+
+    assert file.read_text() == "previous"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["properties.jsonl"]
@@ -0,0 +1,61 @@
+import re
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pyroll.core as pr
+
+from pyroll.report import report
+
+IN_PROFILE = pr.Profile.round(
+    diameter=4e-3,
+    strain=0,
+    flow_stress=100e6,
+)
+
+
+def _sequence(r2: float):
+    sequence = pr.PassSequence([
+        pr.RollPass(
+            label=f"Pass {i}",
+            roll=pr.Roll(
+                groove=pr.CircularOvalGroove(r1=1e-3, r2=r2, depth=1e-3),
+                nominal_radius=100e-3
+            ),
+            gap=1e-3,
+            velocity=1,
+        )
+        for i in range(2)
+    ])
+    sequence.solve(IN_PROFILE)
+    return sequence
+
+
+def _svgs(html: str):
+    return re.findall(r"<svg.*?</svg>", html, re.DOTALL)
+
+
+def test_report_does_not_use_pyplot():
+    code = "\n".join([
+        "import sys",
+        "import pyroll.core as pr",
+        "from pyroll.report import report",
+        "sequence = pr.PassSequence([pr.RollPass(roll=pr.Roll(groove=pr.CircularOvalGroove(r1=1e-3, r2=5e-3, "
+        "depth=1e-3), nominal_radius=100e-3), gap=1e-3, velocity=1)])",
+        "sequence.solve(pr.Profile.round(diameter=4e-3, strain=0, flow_stress=100e6))",
+        "assert '<svg' in report(sequence)",
+        "print('matplotlib.pyplot' in sys.modules)",
+    ])
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+    assert result.stdout.strip() == "False"
+
+
+def test_concurrent_reports():
+    sequences = [_sequence(r2) for r2 in [4e-3, 5e-3, 6e-3, 7e-3]]
+    serial = [_svgs(report(s)) for s in sequences]
+
+    with ThreadPoolExecutor(4) as executor:
+        concurrent = [_svgs(r) for r in executor.map(report, sequences)]
+
+    assert concurrent == serial
@@ -159,3 +159,45 @@ def test_collection_owner():
         assert result is True
     finally:
         plugin_manager.unregister(Impls)
+
+
+@pytest.mark.parametrize(
+    "name",
+    ["", "kjashd_temperature_jkfndsjk", "kjashd_ratio_jkfndsjk", "kjashd_strain_jkfndsjk", "kjashd_angle_jkfndsjk"]
+)
+def test_float_array_vectorized(name):
+    values = np.array([np.pi * 10.0 ** e for e in range(-9, 9)] + [0, -1e-3, np.inf, np.nan])
+    expected = ", ".join(
+        pyroll.report.plugin_manager.hook.property_format(name=name, value=v, owner=None) for v in values
+    )
+
+    _test_format(name, values, expected)
+    _test_format(name, list(values), expected)
+
+
+def test_array_summarized(monkeypatch):
+    monkeypatch.setattr(Config, "ARRAY_THRESHOLD", 5)
+    monkeypatch.setattr(Config, "ARRAY_EDGEITEMS", 2)
+
+    _test_format("", np.arange(10), "0, 1, ..., 8, 9")
+    _test_format("", list(range(10)), "0, 1, ..., 8, 9")
+    _test_format("", [1, 2, 3], "1, 2, 3")
+
+
+def test_disk_elements_lazy(monkeypatch):
+    import base64
+    import gzip
+    import re
+
+    monkeypatch.setattr(Config, "PRINT_DISK_ELEMENTS", True)
+    monkeypatch.setattr(Config, "LAZY_DISK_ELEMENTS", True)
+
+    result = pyroll.report.plugin_manager.hook.property_format(value=[Transport()], name="disk_elements")
+
+    contents = re.findall(r'data-content="([^"]*)"', result)
+    assert len(contents) == 1
+
+    content = gzip.decompress(base64.b64decode(contents[0])).decode("utf-8")
+    assert "Transport" in content
+    assert "<table" in content
+    assert "<table" not in result
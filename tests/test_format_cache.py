@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+from pyroll.core import Transport
+from shapely import Point
+
+from pyroll.report import hookimpl, plugin_manager
+from pyroll.report.unit_display.properties import format_property, DoNotPrint
+
+
+def _hook_format(name, value, owner):
+    return plugin_manager.hook.property_format(name=name, value=value, owner=owner)
+
+
+@pytest.mark.parametrize(
+    "name,value",
+    [
+        ("", 42),
+        ("", True),
+        ("", np.pi),
+        ("", 0.0),
+        ("in_temperature", 1273.15),
+        ("filling_ratio", 0.31416),
+        ("alpha", np.pi / 2),
+        ("", "str"),
+        ("", [1, 2.5, 3]),
+        ("", np.array([1, 2, 3])),
+        ("", Transport()),
+        ("", Point(0, 0).buffer(1)),
+    ]
+)
+def test_same_as_hook(name, value):
+    owner = Transport()
+    assert format_property(name, value, owner) == _hook_format(name, value, owner)
+    # second call uses the cached resolution
+    assert format_property(name, value, owner) == _hook_format(name, value, owner)
+
+
+@pytest.mark.parametrize(
+    "name,value",
+    [
+        ("label", "abc"),
+        ("surface_x", np.zeros(3)),
+        ("", [Point(0, 0)]),
+    ]
+)
+def test_do_not_print(name, value):
+    for _ in range(2):
+        with pytest.raises(DoNotPrint):
+            format_property(name, value, None)
+
+
+def test_invalidated_on_register():
+    assert format_property("special", 42, None) == "42"
+
+    class Impls:
+        @staticmethod
+        @hookimpl(specname="property_format", tryfirst=True)
+        def special_format(name: str):
+            if name == "special":
+                return "special"
+
+    plugin_manager.register(Impls)
+
+    try:
+        assert format_property("special", 42, None) == "special"
+        assert format_property("other", 42, None) == "42"
+    finally:
+        plugin_manager.unregister(Impls)
+
+    assert format_property("special", 42, None) == "42"
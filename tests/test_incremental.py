@@ -0,0 +1,93 @@
+import re
+
+import pyroll.core as pr
+
+from pyroll.report import report_to
+from pyroll.report.fragments import FragmentCache, manifest_path
+
+IN_PROFILE = pr.Profile.round(
+    diameter=30e-3,
+    temperature=1200 + 273.15,
+    strain=0,
+    material=["C45", "steel"],
+    flow_stress=100e6,
+)
+
+
+def _sequence(r2: float = 12.5e-3):
+    sequence = pr.PassSequence([
+        pr.RollPass(
+            label="Oval I",
+            orientation="H",
+            roll=pr.Roll(
+                groove=pr.CircularOvalGroove(depth=8e-3, r1=6e-3, r2=40e-3),
+                nominal_radius=160e-3,
+                rotational_frequency=1
+            ),
+            gap=2e-3,
+        ),
+        pr.Transport(
+            label="I => II",
+            duration=1
+        ),
+        pr.RollPass(
+            label="Round II",
+            orientation="V",
+            roll=pr.Roll(
+                groove=pr.RoundGroove(r1=1e-3, r2=r2, depth=11.5e-3),
+                nominal_radius=160e-3,
+                rotational_frequency=1
+            ),
+            gap=2e-3,
+        ),
+    ])
+    sequence.solve(IN_PROFILE)
+    return sequence
+
+
+def _strip_footer(result: str):
+    return re.sub(r"<footer.*</footer>", "", result, flags=re.DOTALL)
+
+
+def test_incremental_reuses_unchanged_units(tmp_path):
+    file = tmp_path / "report.html"
+
+    sequence = _sequence()
+    report_to(sequence, file)
+    full = file.read_text()
+
+    with FragmentCache(manifest_path(file)) as cache:
+        report_to(sequence, file)
+    assert (cache.hits, cache.misses) == (0, 3)
+    assert manifest_path(file).exists()
+    assert _strip_footer(file.read_text()) == _strip_footer(full)
+
+    with FragmentCache(manifest_path(file)) as cache:
+        report_to(sequence, file)
+    assert (cache.hits, cache.misses) == (3, 0)
+    assert _strip_footer(file.read_text()) == _strip_footer(full)
+
+    # a fresh solution like in a new process, where only the last pass changed
+    sequence = _sequence(r2=13e-3)
+
+    with FragmentCache(manifest_path(file)) as cache:
+        report_to(sequence, file, workers=2)
+    assert (cache.hits, cache.misses) == (2, 1)
+
+    fresh = tmp_path / "fresh.html"
+    report_to(sequence, fresh)
+    assert _strip_footer(file.read_text()) == _strip_footer(fresh.read_text())
+
+
+def test_incremental_config_change(tmp_path, monkeypatch):
+    from pyroll.report import Config
+
+    file = tmp_path / "report.html"
+    sequence = _sequence()
+
+    report_to(sequence, file, incremental=True)
+    monkeypatch.setattr(Config, "FLOAT_PRECISION", 5)
+
+    with FragmentCache(manifest_path(file)) as cache:
+        report_to(sequence, file)
+    assert cache.hits == 0
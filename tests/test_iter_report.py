@@ -0,0 +1,61 @@
+import re
+
+import pyroll.core as pr
+
+from pyroll.report import iter_report
+from pyroll.report.unit_display.units import sequence_units
+
+IN_PROFILE = pr.Profile.round(
+    diameter=4e-3,
+    strain=0,
+    flow_stress=100e6,
+)
+
+SEQUENCE = pr.PassSequence([
+    pr.RollPass(
+        roll=pr.Roll(
+            groove=pr.CircularOvalGroove(r1=1e-3, r2=5e-3, depth=1e-3),
+            nominal_radius=100e-3
+        ),
+        gap=1e-3,
+        velocity=1,
+    ),
+    pr.Transport(duration=1),
+])
+
+SEQUENCE.solve(IN_PROFILE)
+
+
+def test_iter_report_chunks():
+    chunks = list(iter_report(SEQUENCE))
+
+    assert len(chunks) > 1
+    assert all(isinstance(c, str) for c in chunks)
+
+    result = "".join(chunks)
+    assert result.startswith("<!DOCTYPE html>")
+    assert "Transport" in result
+
+
+def test_sequence_units_lazy():
+    display = sequence_units(unit=SEQUENCE, level=1)
+
+    assert not isinstance(display, str)
+    assert "RollPass" in "".join(display)
+
+
+def test_iter_report_close_early():
+    chunks = iter_report(SEQUENCE)
+    next(chunks)
+    chunks.close()
+
+
+def test_geometry_symbols_unique():
+    result = "".join(iter_report(SEQUENCE))
+
+    defined = re.findall(r'<symbol id="([\w-]+)"', result)
+    used = re.findall(r'<use href="#([\w-]+)"', result)
+
+    assert len(defined) == len(set(defined))
+    assert len(used) > len(defined) > 0
+    assert set(used) == set(defined)
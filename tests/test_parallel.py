@@ -0,0 +1,54 @@
+import re
+
+import pyroll.core as pr
+
+from pyroll.report import report
+
+IN_PROFILE = pr.Profile.round(
+    diameter=30e-3,
+    temperature=1200 + 273.15,
+    strain=0,
+    material=["C45", "steel"],
+    flow_stress=100e6,
+)
+
+SEQUENCE = pr.PassSequence([
+    pr.RollPass(
+        label="Oval I",
+        orientation="H",
+        roll=pr.Roll(
+            groove=pr.CircularOvalGroove(depth=8e-3, r1=6e-3, r2=40e-3),
+            nominal_radius=160e-3,
+            rotational_frequency=1
+        ),
+        gap=2e-3,
+    ),
+    pr.Transport(
+        label="I => II",
+        duration=1
+    ),
+    pr.RollPass(
+        label="Round II",
+        orientation="V",
+        roll=pr.Roll(
+            groove=pr.RoundGroove(r1=1e-3, r2=12.5e-3, depth=11.5e-3),
+            nominal_radius=160e-3,
+            rotational_frequency=1
+        ),
+        gap=2e-3,
+    ),
+])
+
+SEQUENCE.solve(IN_PROFILE)
+
+
+def _strip_footer(result: str):
+    return re.sub(r"<footer.*</footer>", "", result, flags=re.DOTALL)
+
+
+def test_parallel_identical_to_serial():
+    serial = report(SEQUENCE)
+    parallel = report(SEQUENCE, workers=2)
+
+    assert "Round II" in parallel
+    assert _strip_footer(parallel) == _strip_footer(serial)
@@ -0,0 +1,84 @@
+import os
+
+import pyroll.core as pr
+
+from pyroll.report import Config
+from pyroll.report.plot_cache import plot_cache
+from pyroll.report.unit_display.plots import unit_plots_display
+
+IN_PROFILE = pr.Profile.round(
+    diameter=4e-3,
+    strain=0,
+    flow_stress=100e6,
+)
+
+SEQUENCE = pr.PassSequence([
+    pr.RollPass(
+        roll=pr.Roll(
+            groove=pr.CircularOvalGroove(r1=1e-3, r2=5e-3, depth=1e-3),
+            nominal_radius=100e-3
+        ),
+        gap=1e-3,
+        velocity=1,
+    ),
+])
+
+SEQUENCE.solve(IN_PROFILE)
+
+
+def test_plot_cache(tmp_path, monkeypatch):
+    uncached = unit_plots_display(SEQUENCE.roll_passes[0])
+
+    monkeypatch.setattr(Config, "PLOT_CACHE", True)
+    monkeypatch.setattr(Config, "PLOT_CACHE_DIR", tmp_path)
+    plot_cache.clear()
+
+    first = unit_plots_display(SEQUENCE.roll_passes[0])
+    stats = plot_cache.stats()
+    assert stats["hits"] == 0
+    assert stats["misses"] == stats["entries"] > 0
+
+    second = unit_plots_display(SEQUENCE.roll_passes[0])
+    assert plot_cache.stats()["hits"] == stats["misses"]
+
+    assert first == second == uncached
+
+
+def test_plot_cache_eviction(tmp_path, monkeypatch):
+    monkeypatch.setattr(Config, "PLOT_CACHE_DIR", tmp_path)
+    monkeypatch.setattr(Config, "PLOT_CACHE_SIZE", 25)
+    plot_cache.clear()
+
+    plot_cache.put("0", "0123456789")
+    plot_cache.put("1", "0123456789")
+
+    # "1" is the least recently used, although inserted after "0"
+    os.utime(tmp_path / "0.svg", (2000, 2000))
+    os.utime(tmp_path / "1.svg", (1000, 1000))
+
+    plot_cache.put("2", "0123456789")
+
+    assert plot_cache.stats()["entries"] == 2
+    assert plot_cache.get("0") is not None
+    assert plot_cache.get("1") is None
+    assert plot_cache.get("2") is not None
+
+
+def test_plot_cache_stale_tmp_files(tmp_path, monkeypatch):
+    monkeypatch.setattr(Config, "PLOT_CACHE_DIR", tmp_path)
+    plot_cache.clear()
+
+    stale = tmp_path / "stale.tmp"
+    stale.write_text("partial")
+    os.utime(stale, (1000, 1000))
+    recent = tmp_path / "recent.tmp"
+    recent.write_text("partial")
+
+    plot_cache.evict()
+
+    assert not stale.exists()
+    assert recent.exists()
+
+    plot_cache.clear()
+
+    assert not recent.exists()
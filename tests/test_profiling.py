@@ -0,0 +1,102 @@
+import json
+import time
+
+import pyroll.core as pr
+import pytest
+
+from pyroll.report import ReportProfiler, profile_report, report, Config, plugin_manager, hookimpl
+
+IN_PROFILE = pr.Profile.round(
+    diameter=4e-3,
+    strain=0,
+    flow_stress=100e6,
+)
+
+SEQUENCE = pr.PassSequence([
+    pr.RollPass(
+        roll=pr.Roll(
+            groove=pr.CircularOvalGroove(r1=1e-3, r2=5e-3, depth=1e-3),
+            nominal_radius=100e-3
+        ),
+        gap=1e-3,
+        velocity=1,
+    ),
+    pr.Transport(duration=1),
+])
+
+SEQUENCE.solve(IN_PROFILE)
+
+
+def test_profile_report(tmp_path):
+    result, profiler = profile_report(SEQUENCE, trace=True)
+
+    assert "RollPass" in result
+
+    functions = {s.function: s for s in profiler.hook_stats}
+    assert functions["roll_pass_plot"].calls == 3
+    assert functions["unit_heading"].calls == 3
+    assert all(s.cumulative >= s.self_time >= 0 for s in profiler.hook_stats)
+    assert profiler.total >= profiler.other_time >= 0
+
+    assert [u["unit"] for u in profiler.unit_stats] == [str(SEQUENCE), *map(str, SEQUENCE.units)]
+
+    profiler.write_json(tmp_path / "profile.json")
+    data = json.loads((tmp_path / "profile.json").read_text())
+    assert len(data["hooks"]) == len(profiler.hook_stats)
+
+    profiler.write_chrome_trace(tmp_path / "trace.json")
+    data = json.loads((tmp_path / "trace.json").read_text())
+    assert len(data["traceEvents"]) == sum(s.calls for s in profiler.hook_stats)
+
+
+def test_profile_report_without_trace(tmp_path):
+    _, profiler = profile_report(SEQUENCE)
+
+    assert profiler.hook_stats
+    assert not profiler._events
+
+    with pytest.raises(ValueError):
+        profiler.write_chrome_trace(tmp_path / "trace.json")
+
+
+def test_profiler_restores_functions():
+    functions = [impl.function for impl in plugin_manager.hook.unit_display.get_hookimpls()]
+
+    with ReportProfiler():
+        pass
+
+    assert [impl.function for impl in plugin_manager.hook.unit_display.get_hookimpls()] == functions
+
+
+def test_print_statistics(monkeypatch):
+    monkeypatch.setattr(Config, "PRINT_STATISTICS", True)
+
+    result = report(SEQUENCE)
+
+    assert "Report generation statistics" in result
+    assert "roll_pass_plot" in result
+
+
+def test_slow_properties(monkeypatch, caplog):
+    class Impls:
+        @staticmethod
+        @hookimpl(specname="property_format")
+        def slow_format(name, value, owner):
+            if name == "gap":
+                time.sleep(0.02)
+
+    monkeypatch.setattr(Config, "PROPERTY_TIME_BUDGET", 0.01)
+    plugin_manager.register(Impls)
+
+    try:
+        report(SEQUENCE)
+    finally:
+        plugin_manager.unregister(Impls)
+
+    slow = [r.message for r in caplog.records if r.message.startswith("Slow property 'gap'")]
+    assert len(slow) == 1
+    assert str(SEQUENCE.roll_passes[0]) in slow[0]
+
+    summary = [r.message for r in caplog.records if "exceeded the time budget" in r.message]
+    assert len(summary) == 1
+    assert "'gap' of" in summary[0]
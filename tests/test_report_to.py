@@ -1,6 +1,7 @@
 import pyroll.core as pr
 import pytest
 
+from pyroll.report import hookimpl, plugin_manager
 from pyroll.report.report import report_to
 
 IN_PROFILE = pr.Profile.round(
@@ -52,3 +53,25 @@ def test_file_object_bin(tmp_path):
     with pytest.raises(TypeError):
         # noinspection PyTypeChecker
         report_to(SEQUENCE, f.open("wb"))
+
+
+def test_failing_render_keeps_previous_report(tmp_path):
+    class Impls:
+        @staticmethod
+        @hookimpl(specname="unit_display")
+        def failing_display(unit):
+            if isinstance(unit, pr.RollPass):
+                raise RuntimeError("display failed")
+
+    f = tmp_path / "report.html"
+    f.write_text("previous")
+
+    plugin_manager.register(Impls)
+    try:
+        with pytest.raises(RuntimeError):
+            report_to(SEQUENCE, f)
+    finally:
+        plugin_manager.unregister(Impls)
+
+    assert f.read_text() == "previous"
+    assert [p.name for p in tmp_path.iterdir()] == ["report.html"]
@@ -0,0 +1,81 @@
+import numpy as np
+import pyroll.core as pr
+
+from pyroll.report import report, hookimpl, plugin_manager
+from pyroll.report.sequence_data import sequence_data, sequence_data_cache
+
+IN_PROFILE = pr.Profile.round(
+    diameter=30e-3,
+    temperature=1200 + 273.15,
+    strain=0,
+    material=["C45", "steel"],
+    flow_stress=100e6,
+)
+
+SEQUENCE = pr.PassSequence([
+    pr.RollPass(
+        label="Oval I",
+        orientation="H",
+        roll=pr.Roll(
+            groove=pr.CircularOvalGroove(depth=8e-3, r1=6e-3, r2=40e-3),
+            nominal_radius=160e-3,
+            rotational_frequency=1
+        ),
+        gap=2e-3,
+    ),
+    pr.Transport(
+        label="I => II",
+        duration=1
+    ),
+    pr.RollPass(
+        label="Round II",
+        orientation="V",
+        roll=pr.Roll(
+            groove=pr.RoundGroove(r1=1e-3, r2=12.5e-3, depth=11.5e-3),
+            nominal_radius=160e-3,
+            rotational_frequency=1
+        ),
+        gap=2e-3,
+    ),
+])
+
+SEQUENCE.solve(IN_PROFILE)
+
+
+def test_columns():
+    data = sequence_data(SEQUENCE)
+    passes = SEQUENCE.roll_passes
+
+    assert list(data.roll_pass_labels) == [str(p) for p in passes]
+    assert np.array_equal(data.roll_forces, [p.roll_force for p in passes])
+    assert np.array_equal(data.roll_torques, [p.roll.roll_torque for p in passes])
+    assert np.array_equal(data.filling_ratios["filling_ratio"], [p.out_profile.filling_ratio for p in passes])
+    assert np.array_equal(
+        data.strains_in_out, [IN_PROFILE.strain] + [u.out_profile.strain for u in SEQUENCE]
+    )
+
+
+def test_shared_within_report():
+    with sequence_data_cache():
+        assert sequence_data(SEQUENCE) is sequence_data(SEQUENCE)
+
+    assert sequence_data(SEQUENCE) is not sequence_data(SEQUENCE)
+
+    instances = []
+
+    class Plugin:
+        @staticmethod
+        @hookimpl(specname="unit_plot")
+        def data_plot(unit):
+            if isinstance(unit, pr.PassSequence):
+                instances.append(sequence_data(unit))
+
+    plugin_manager.register(Plugin)
+    try:
+        report(SEQUENCE)
+        report(SEQUENCE)
+    finally:
+        plugin_manager.unregister(Plugin)
+
+    assert len(instances) == 2
+    assert instances[0] is not instances[1]
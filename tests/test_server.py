@@ -0,0 +1,77 @@
+import urllib.error
+import urllib.request
+
+import pytest
+import pyroll.core as pr
+
+from pyroll.report import ReportServer, serve_report, plugin_manager, hookimpl
+
+IN_PROFILE = pr.Profile.round(
+    diameter=4e-3,
+    strain=0,
+    flow_stress=100e6,
+)
+
+SEQUENCE = pr.PassSequence([
+    pr.RollPass(
+        label=f"Pass {i}",
+        roll=pr.Roll(
+            groove=pr.CircularOvalGroove(r1=1e-3, r2=5e-3, depth=1e-3),
+            nominal_radius=100e-3
+        ),
+        gap=1e-3,
+        velocity=1,
+    )
+    for i in range(3)
+])
+
+SEQUENCE.solve(IN_PROFILE)
+
+
+def _get(url: str) -> str:
+    with urllib.request.urlopen(url) as response:
+        return response.read().decode("utf-8")
+
+
+def test_units_rendered_on_demand():
+    rendered = []
+
+    class Impls:
+        @staticmethod
+        @hookimpl(specname="unit_display")
+        def record(unit):
+            rendered.append(unit)
+
+    plugin_manager.register(Impls)
+
+    try:
+        with ReportServer(SEQUENCE) as server:
+            server.start()
+
+            index = _get(server.url)
+            assert rendered == [SEQUENCE]
+            for i in range(3):
+                assert f'href="units/{i}"' in index
+
+            page = _get(server.url + "units/1")
+            assert rendered == [SEQUENCE, SEQUENCE.units[1]]
+            assert "Pass 1" in page
+            assert 'href="2"' in page
+
+            assert _get(server.url + "units/1") == page
+            assert rendered == [SEQUENCE, SEQUENCE.units[1]]
+
+            with pytest.raises(urllib.error.HTTPError) as e:
+                _get(server.url + "units/3")
+            assert e.value.code == 404
+    finally:
+        plugin_manager.unregister(Impls)
+
+
+def test_serve_report():
+    server = serve_report(SEQUENCE, open_browser=False)
+
+    try:
+        assert "Pass 2" in _get(server.url + "units/2")
+    finally:
+        server.close()
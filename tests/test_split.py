@@ -0,0 +1,51 @@
+import re
+
+import pytest
+import pyroll.core as pr
+
+from pyroll.report import report_to_directory
+
+IN_PROFILE = pr.Profile.round(
+    diameter=4e-3,
+    strain=0,
+    flow_stress=100e6,
+)
+
+SEQUENCE = pr.PassSequence([
+    pr.RollPass(
+        label=f"Pass {i}",
+        roll=pr.Roll(
+            groove=pr.CircularOvalGroove(r1=1e-3, r2=5e-3, depth=1e-3),
+            nominal_radius=100e-3
+        ),
+        gap=1e-3,
+        velocity=1,
+    )
+    for i in range(3)
+])
+
+SEQUENCE.solve(IN_PROFILE)
+
+
+@pytest.mark.parametrize("workers", [None, 2])
+def test_report_to_directory(tmp_path, workers):
+    index = report_to_directory(SEQUENCE, tmp_path, workers)
+
+    assert index == tmp_path / "index.html"
+    assert sorted(p.name for p in tmp_path.glob("*.html")) == ["index.html", "unit_0.html", "unit_1.html",
+                                                                "unit_2.html"]
+
+    for i in range(3):
+        assert f'href="unit_{i}.html"' in index.read_text(encoding="utf-8")
+
+    page = (tmp_path / "unit_1.html").read_text(encoding="utf-8")
+    assert "Pass 1" in page
+    assert 'href="unit_2.html"' in page
+    assert 'href="index.html"' in page
+
+    # only the logo is inlined, all plots are referenced
+    assert page.count("<svg") == 1
+    assets = re.findall(r'<img src="(assets/[0-9a-f]+\.svg)"', page)
+    assert assets
+    assert all((tmp_path / a).read_text(encoding="utf-8").lstrip().startswith(("<?xml", "<svg")) for a in assets)
+    assert not list((tmp_path / "assets").glob("*.tmp"))
@@ -0,0 +1,38 @@
+import json
+import subprocess
+import sys
+
+IMPORT_TIME_BUDGET = 0.25
+"""Maximum time in seconds importing pyroll.report may take on top of pyroll.core."""
+
+DEFERRED_MODULES = ["matplotlib", "jinja2", "click", "webbrowser", "concurrent.futures"]
+
+SCRIPT = """
+import json, sys, time
+import pyroll.core
+loaded = set(sys.modules)
+start = time.perf_counter()
+import pyroll.report
+duration = time.perf_counter() - start
+print(json.dumps(dict(duration=duration, modules=sorted(set(sys.modules) - loaded))))
+"""
+
+
+def _measure_import():
+    result = subprocess.run([sys.executable, "-c", SCRIPT], capture_output=True, text=True, check=True)
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+def test_heavy_modules_deferred():
+    # modules loaded by importing pyroll.report in addition to pyroll.core
+    modules = _measure_import()["modules"]
+
+    for m in DEFERRED_MODULES:
+        assert m not in modules
+
+
+def test_import_time_budget():
+    # take the best of some runs to reduce noise from the machine load
+    duration = min(_measure_import()["duration"] for _ in range(3))
+
+    assert duration < IMPORT_TIME_BUDGET
@@ -0,0 +1,74 @@
+from unittest.mock import patch
+
+from pyroll.core.repr import ReprMixin
+
+from pyroll.report.export import PropertyExport
+from pyroll.report.memo import table_memo
+from pyroll.report.unit_display import properties
+from pyroll.report.unit_display.properties import render_properties_table
+
+
+class Node(ReprMixin):
+    def __init__(self, name, **children):
+        self.name = name
+        self.children = children
+
+    @property
+    def __attrs__(self):
+        return dict(name=self.name, **self.children)
+
+    def __str__(self):
+        return f"Node {self.name}"
+
+
+def test_shared_object_rendered_once():
+    shared = Node("shared")
+    root = Node("root", a=Node("a", child=shared), b=Node("b", child=shared))
+
+    plain = render_properties_table(root)
+
+    with table_memo(), patch.object(
+            properties, "_render_properties_table", wraps=properties._render_properties_table
+    ) as render:
+        memoized = render_properties_table(root)
+
+    assert memoized == plain
+    rendered = [c.args[0] for c in render.call_args_list]
+    assert rendered.count(shared) == 1
+
+
+def test_export_rows_replayed():
+    shared = Node("shared")
+    root = Node("root", a=Node("a", child=shared), b=Node("b", child=shared))
+
+    with table_memo(), PropertyExport() as export:
+        render_properties_table(root)
+
+    properties_ = {r["property"] for r in export.rows}
+    assert {"a.child.name", "b.child.name"} <= properties_
+
+
+def test_cycle():
+    a = Node("a")
+    b = Node("b", a=a)
+    a.children["b"] = b
+
+    table = render_properties_table(a)
+
+    assert "recursive reference to Node a" in table
+
+
+def test_cycle_not_memoized():
+    a = Node("a")
+    b = Node("b", a=a)
+    a.children["b"] = b
+    root = Node("root", first=a, second=b)
+
+    plain = render_properties_table(root)
+
+    with table_memo():
+        memoized = render_properties_table(root)
+
+    # b reached without a shows the table of a instead of the recursive reference
+    assert memoized == plain
+    assert plain.count("recursive reference to Node a") == 1
@@ -0,0 +1,83 @@
+import xml.etree.ElementTree as ET
+
+import pytest
+import shapely
+
+from pyroll.report.utils import plot_shapely_geom
+
+SVG_NS = "{http://www.w3.org/2000/svg}"
+
+
+@pytest.mark.parametrize(
+    "geom,paths",
+    [
+        (shapely.Point(0, 0).buffer(1), 1),
+        (shapely.box(0, 0, 2, 1).difference(shapely.box(0.5, 0.25, 1, 0.75)), 1),
+        (shapely.LineString([(0, 0), (1, 1), (2, 0)]), 1),
+        (shapely.MultiLineString([[(0, 0), (1, 1)], [(2, 0), (3, 1)]]), 2),
+        (shapely.MultiPolygon([shapely.box(0, 0, 1, 1), shapely.box(2, 0, 3, 1)]), 2),
+    ]
+)
+def test_plot_shapely_geom(geom, paths):
+    svg = plot_shapely_geom(geom)
+    root = ET.fromstring(svg)
+
+    assert root.tag == SVG_NS + "svg"
+    assert root.get("width") == "100%"
+    assert len(list(root.iter(SVG_NS + "path"))) == paths
+
+
+def test_plot_shapely_geom_hole():
+    svg = plot_shapely_geom(shapely.box(0, 0, 2, 1).difference(shapely.box(0.5, 0.25, 1, 0.75)))
+    assert svg.count("Z") == 2
+
+
+@pytest.mark.parametrize(
+    "geom",
+    [shapely.Polygon(), shapely.Point(0, 0), shapely.LineString([(1, 1), (1, 1)])]
+)
+def test_plot_shapely_geom_nothing_to_plot(geom):
+    assert plot_shapely_geom(geom) == ""
+
+
+def test_deduplicate_svg_symbols():
+    from pyroll.report.utils import deduplicate_svg_symbols
+
+    a = plot_shapely_geom(shapely.Point(0, 0).buffer(1))
+    b = plot_shapely_geom(shapely.box(0, 0, 1, 1))
+
+    chunks = list(deduplicate_svg_symbols([a, "<p>text</p>", a + b, b]))
+
+    assert chunks[0] == a
+    assert chunks[1] == "<p>text</p>"
+    assert "<symbol" not in chunks[2].split("</svg>")[0]
+    assert "<symbol" in chunks[2].split("</svg>")[1]
+    assert "<symbol" not in chunks[3]
+    assert all("<use" in c for c in [chunks[0], chunks[2], chunks[3]])
+
+
+@pytest.mark.parametrize("count", [10, 1000])
+def test_create_sequence_plot_label_thinning(count):
+    from pyroll.report import Config
+    from pyroll.report.utils import create_sequence_plot, plot_sequence_bars, get_svg_from_figure
+
+    fig, ax = create_sequence_plot([f"Unit {i}" for i in range(count)])
+    plot_sequence_bars(ax, list(range(count)))
+
+    labels = [t.get_text() for t in ax.xaxis.get_majorticklabels()]
+    assert len(labels) <= Config.SEQUENCE_PLOT_LABEL_LIMIT
+    assert labels[0] == "0: Unit 0"
+    assert len(ax.patches) == (count if count <= Config.SEQUENCE_PLOT_LABEL_LIMIT else 1)
+
+    get_svg_from_figure(fig)
+
+
+def test_create_sequence_plot_zero_label_limit(monkeypatch):
+    from pyroll.report import Config
+    from pyroll.report.utils import create_sequence_plot
+
+    monkeypatch.setattr(Config, "SEQUENCE_PLOT_LABEL_LIMIT", 0)
+
+    fig, ax = create_sequence_plot([f"Unit {i}" for i in range(10)])
+
+    assert [t.get_text() for t in ax.xaxis.get_majorticklabels()] == ["0: Unit 0"]